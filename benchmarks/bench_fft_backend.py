@@ -0,0 +1,66 @@
+"""Time of the Fourier transforms by the FFT backends.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_fft_backend
+"""
+
+import time
+
+import numpy as np
+
+from sweep_design.config import Config
+from sweep_design.math_signals.defaults.fft_backends import (
+    FFTBackend,
+    PyFFTW,
+    ScipyFFT,
+)
+from sweep_design.math_signals.utility_functions import get_peak_to_sidelobe_ratio
+
+SIZE = 2**16
+BATCH = 64
+NUMBER = 5
+
+
+def measure(function, repeat=3) -> float:
+    """Return the best time of one call of the function in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            function()
+        best = min(best, (time.perf_counter() - start) / NUMBER)
+    return best
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    batch = rng.normal(size=(BATCH, SIZE))
+
+    backends = {
+        "numpy.fft": FFTBackend(),
+        "scipy.fft, 1 worker": ScipyFFT(workers=None),
+        "scipy.fft, all workers": ScipyFFT(workers=-1),
+    }
+    try:
+        backends["pyFFTW, all workers"] = PyFFTW()
+    except ImportError:
+        print("pyFFTW is not installed")
+
+    default = Config.fft_backend
+    try:
+        for label, backend in backends.items():
+            Config.fft_backend = backend
+            rfft = measure(lambda: backend.rfft(batch))
+            sidelobes = measure(lambda: get_peak_to_sidelobe_ratio(batch))
+            print(
+                f"{label}: rfft {rfft * 1e3:.1f} ms, "
+                f"peak-to-sidelobe ratio {sidelobes * 1e3:.1f} ms "
+                f"({BATCH} x {SIZE})"
+            )
+    finally:
+        Config.fft_backend = default
+
+
+if __name__ == "__main__":
+    main()
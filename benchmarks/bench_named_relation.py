@@ -0,0 +1,57 @@
+"""Overhead of the creation of named relations over bare relations.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_named_relation
+"""
+
+import time
+
+import numpy as np
+
+from sweep_design.math_signals import Relation
+from sweep_design.named_signals import NamedRelation
+
+SIZE = 1_000
+NUMBER = 2_000
+
+
+def measure(function, repeat=3) -> float:
+    """Return the best time of one call of the function in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            function()
+        best = min(best, (time.perf_counter() - start) / NUMBER)
+    return best
+
+
+def main() -> None:
+    x = np.linspace(0.0, 1.0, SIZE)
+    y = np.sin(x)
+    relation = Relation(x, y)
+    named_relation = NamedRelation(x, y, name="named")
+
+    bare = measure(lambda: Relation(x, y))
+    cases = {
+        "NamedRelation(x, y)": lambda: NamedRelation(x, y),
+        "NamedRelation(x, y, name=...)": lambda: NamedRelation(x, y, name="named"),
+        "str(NamedRelation(x, y))": lambda: str(NamedRelation(x, y)),
+    }
+    print(f"Relation(x, y): {bare * 1e6:.1f} us")
+    for label, function in cases.items():
+        seconds = measure(function)
+        print(f"{label}: {seconds * 1e6:.1f} us ({seconds / bare:.1f}x)")
+
+    bare = measure(lambda: relation + relation)
+    seconds = measure(lambda: named_relation + named_relation)
+    print(f"relation + relation: {bare * 1e6:.1f} us")
+    print(
+        f"named_relation + named_relation: {seconds * 1e6:.1f} us "
+        f"({seconds / bare:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
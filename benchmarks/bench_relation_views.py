@@ -0,0 +1,67 @@
+"""Memory allocated by the operations of Relation.
+
+The operations use read-only views of the data, so only the result is
+allocated. The copying accessors are shown for comparison.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_relation_views
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from sweep_design.math_signals import Relation
+
+SIZE = 1_000_000
+NUMBER = 20
+
+
+def measure(function, repeat=3) -> float:
+    """Return the best time of one call of the function in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            function()
+        best = min(best, (time.perf_counter() - start) / NUMBER)
+    return best
+
+
+def measure_peak(function) -> int:
+    """Return the peak of memory allocated by the function call in bytes."""
+    function()
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    x = np.arange(SIZE) * 0.001
+    r1, r2 = Relation(x, np.sin(x)), Relation(x, np.cos(x))
+
+    cases = {
+        "r.get_data()": lambda: r1.get_data(),
+        "r.get_data(copy=False)": lambda: r1.get_data(copy=False),
+        "r1 + r2": lambda: r1 + r2,
+        "r1 * 2.0": lambda: r1 * 2.0,
+        "r1.exp()": lambda: r1.exp(),
+        "r1.shift(1.0)": lambda: r1.shift(1.0),
+        "r1.select_data(100.0, 900.0)": lambda: r1.select_data(100.0, 900.0),
+    }
+    print(f"Array of {SIZE} samples: {x.nbytes / 2**20:.1f} MiB")
+    for label, function in cases.items():
+        peak = measure_peak(function)
+        seconds = measure(function)
+        print(
+            f"{label}: {peak / x.nbytes:.2f} arrays allocated, "
+            f"{seconds * 1e3:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Throughput of the sweep signal correction for the vibration source.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_source_correction
+"""
+
+import time
+
+import numpy as np
+
+from sweep_design.math_signals.prepared_sweeps import get_linear_sweep
+from sweep_design.math_signals.utility_functions.sweep_correction_source import (
+    get_correction_for_source,
+    soft_clip,
+)
+
+SIZE = 200_000
+
+
+def measure(function, repeat=3) -> float:
+    """Return the best time of the function call in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    t = np.linspace(0.0, 20.0, SIZE)
+    sweep = get_linear_sweep(t, 1.0, 100.0, 1.0)
+
+    rng = np.random.default_rng(0)
+    data = np.column_stack((2 * rng.normal(size=SIZE), rng.normal(size=SIZE)))
+    seconds = measure(lambda: soft_clip(data, 1.0))
+    print(f"soft_clip: {SIZE / seconds:,.0f} samples/s")
+
+    displacement = sweep.integrate().integrate()
+    limits = 0.5 * np.max(np.abs(displacement.y))
+    seconds = measure(
+        lambda: get_correction_for_source(sweep, limits=limits, limit_iteration=3),
+        repeat=1,
+    )
+    print(f"get_correction_for_source: {SIZE / seconds:,.0f} samples/s")
+
+
+if __name__ == "__main__":
+    main()
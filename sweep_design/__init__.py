@@ -63,6 +63,7 @@ from .math_signals import Relation as Relation
 from .math_signals import Signal as Signal
 from .math_signals import Spectrum as Spectrum
 from .math_signals import Sweep as Sweep
+from .math_signals import SweepBatch as SweepBatch
 from .math_signals import UncalculatedSweep as UncalculatedSweep
 from .math_signals import ApriorUncalculatedSweep as ApriorUncalculatedSweep
 
@@ -1,4 +1,5 @@
 from pathlib import Path
+from ..math_signals.defaults import fft_backends as fftb
 from ..math_signals.defaults import methods as dfm
 
 
@@ -42,8 +43,7 @@ class Config:
 
     **math_operation_method**:
     > The method of basic mathematical operations of addition (+),
-    subtraction(-), multiplication (*), division(/), exponentiation (**)
-    and their unary operations (+=, -=, *=, /=).
+    subtraction(-), multiplication (*), division(/), exponentiation (**).
 
     > Method derived from default function:
     >> `sweep_design.math_signals.defaults.methods.math_operation`
@@ -62,6 +62,24 @@ class Config:
 
     - - -
 
+    **inplace_math_operation**:
+    > The method of the in-place mathematical operations (+=, -=, *=, /=, **=).
+    The result should be written to y1 if it is possible. If a new array
+    is returned, it replaces the data of the instance.
+
+    > Method derived from default function:
+    >> `sweep_design.math_signals.defaults.methods.inplace_math_operation`
+
+    > **input**:
+    >> **y1**: `numpy.ndarray`
+    >> **y2**: `Union`[`numpy.ndarray`, `float`, `int`, `complex`]
+    >> **name_operation**: `sweep_design.math_signals.defaults.base_structures.MathOperation`
+
+    > **output**:
+    >> **y**: `numpy.ndarray`
+
+    - - -
+
     **integrate_one_method**:
     > Method for calculating the integral of a sequence on a segment.
     > Method derived from default function:
@@ -84,7 +102,8 @@ class Config:
 
     > **input**:
     >> **x**: `numpy.ndarray`
-    >> **y**: `numpy.ndarray`
+    >> **y**: `numpy.ndarray` - for the batches of sweeps it is a 2-D array
+    integrated along the last axis.
     >> d**x**: float - sequence sample rate x
 
     > **output**:
@@ -119,6 +138,13 @@ class Config:
     > Method derived from default function:
     >> `sweep_design.math_signals.defaults.methods.correlate`
 
+    > The default function is the direct correlation by numpy. The FFT and
+    overlap-add methods (faster for long sequences) can be set instead,
+    or the function choosing between the three by the sizes of sequences:
+    >> `sweep_design.math_signals.defaults.methods.correlate_fft`
+    >> `sweep_design.math_signals.defaults.methods.correlate_overlap_add`
+    >> `sweep_design.math_signals.defaults.methods.correlate_auto`
+
     > **input**:
     >> cls: Relation
     >> r1: Relation
@@ -137,6 +163,13 @@ class Config:
     > Method derived from default function:
     >> `sweep_design.math_signals.defaults.methods.convolve`
 
+    > The default function is the direct convolution by numpy. The FFT and
+    overlap-add methods (faster for long sequences) can be set instead,
+    or the function choosing between the three by the sizes of sequences:
+    >> `sweep_design.math_signals.defaults.methods.convolve_fft`
+    >> `sweep_design.math_signals.defaults.methods.convolve_overlap_add`
+    >> `sweep_design.math_signals.defaults.methods.convolve_auto`
+
     > **input**:
     >> cls: Relation
     >> r1: Relation
@@ -167,6 +200,31 @@ class Config:
 
     - - -
 
+    **align_uniform_method**:
+    > A method by which two uniformly sampled sequences with the same sample
+    > rate are put on the common x-axis without interpolation (by integer
+    > offset and zero-padding). If the method returns `None`, then
+    > **get_common_x** and **interpolate_extrapolate_method** are used.
+    > Method derived from default function:
+    >> `sweep_design.math_signals.defaults.methods.align_uniform`
+
+    > **input**:
+    >> **x1**: `Union`[`UniformAxis`, `numpy.ndarray`]
+    >> **y1**: `numpy.ndarray`
+    >> **dx1**: float  - sample rate first sequence
+    >> **x2**: `Union`[`UniformAxis`, `numpy.ndarray`]
+    >> **y2**: `numpy.ndarray`
+    >> **dx2**: float  - sample rate second sequence
+
+    > **output**:
+    >> `Optional`[`Tuple` [
+        **x**: `Union`[`UniformAxis`, `numpy.ndarray`],
+        **y1**: `numpy.ndarray`,
+        **y2**: `numpy.ndarray`
+    ]]
+
+    - - -
+
     **spectrum2signal_method**:
     > Method for converting a spectrum into a signal. (Using Fourier transform)
     > Method derived from default function:
@@ -204,6 +262,38 @@ class Config:
 
     - - -
 
+    **fft_backend**:
+    > The backend of the Fourier transforms used by the default methods
+    (conversion of signals and spectra, FFT correlation and convolution,
+    Hilbert transform, spectrogram, `correlate_stream`). The backends are
+    defined in `sweep_design.math_signals.defaults.fft_backends`:
+    >> `sweep_design.math_signals.defaults.fft_backends.FFTBackend` (default) -
+    numpy.fft, one thread.
+    >> `sweep_design.math_signals.defaults.fft_backends.ScipyFFT` -
+    scipy.fft with **workers** threads (-1 - all CPUs).
+    >> `sweep_design.math_signals.defaults.fft_backends.PyFFTW` -
+    planned transforms of pyFFTW (if it is installed), the plans are reused
+    for the arrays of the same size.
+
+    > The backend is read when a transform is calculated, so it can be changed
+    at any time. Own backend should inherit `FFTBackend` and override its methods.
+    The multithreaded backends are used with one thread in the processes
+    of `sweep_design.dataio.write.write_batch.write_pilots`.
+
+    - - -
+
+    **result_cache**:
+    > The cache of the results of the expensive transforms (Fourier
+    transforms, analytic signal, spectrogram, conversion of a priori data).
+    If `None` (default), the results are only kept by the instances.
+    The cache is the instance of the class
+    >> `sweep_design.math_signals.result_cache.ResultCache`
+
+    > It keeps the results in memory and, if the path is specified, on disk
+    under the **DEFAULT_PATH**.
+
+    - - -
+
     The above methods can be overridden with your own here, or you can import the
     class `Config` somewhere and override it there.
     (They must be written according to the rules corresponding to
@@ -220,13 +310,21 @@ class Config:
     # Methods for the Relation.
     interpolate_extrapolate_method = dfm.interpolate_extrapolate
     math_operation = dfm.math_operation
+    inplace_math_operation = dfm.inplace_math_operation
     integrate_one_method = dfm.one_integrate
     integrate_method = dfm.integrate
     differentiate_method = dfm.differentiate
     correlate_method = dfm.correlate
     convolve_method = dfm.convolve
     get_common_x = dfm.get_common_x
+    align_uniform_method = dfm.align_uniform
 
     # Methods for Spectrum and Signal.
     spectrum2signal_method = dfm.spectrum2sigmal
     signal2spectrum_method = dfm.signal2spectrum
+
+    # Backend of the Fourier transforms.
+    fft_backend = fftb.FFTBackend()
+
+    # Cache of the results (sweep_design.math_signals.result_cache.ResultCache).
+    result_cache = None
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from ..named_signals.defaults.methods import extract_input
 
 
@@ -13,6 +15,9 @@ class NamedConfig:
     `sweep_design.named_signals.header_signals.defaults.names.make_default_relation_name`
     with parameter 1.
 
+    > The name by assignment is found by the code of the caller when the
+    object is created and resolved only when it is requested (`str`).
+
     > In both situations, if name param name is specified, then
     my_relation = `NamedRelation`(..., name='MyName') and `str`(my_relation) == 'MyName'.
 
@@ -38,6 +43,17 @@ class NamedConfig:
 
     - - -
 
+    **NAME_MAX_DEPTH**: `Optional`[`int`]
+    > If `None` then the whole history of operations is rendered in the name,
+    otherwise only the upper **NAME_MAX_DEPTH** levels of it, the deeper
+    history is replaced by "...". For example, with 2 the name
+    `(((A + B) * C) - D)` is rendered as `((... * C) - D)`.
+
+    > The rendered names are memoized, so `str` of a long chain of
+    operations is calculated once.
+
+    - - -
+
     **extract_input**
     > The method to convert input data to tuple of `numpy.ndarray`
     **x** and **y**.
@@ -66,5 +82,6 @@ class NamedConfig:
     NAMING_BY_ASSIGNMENT_CREATE = True
     NAMING_BY_ASSIGNMENT_MATH_OPERATION = False
     NAMING_BY_ASSIGNMENT_OTHER_OPERATION = False
+    NAME_MAX_DEPTH: Optional[int] = None
 
     extract_input = staticmethod(extract_input)
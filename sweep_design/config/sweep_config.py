@@ -26,6 +26,22 @@ class SweepConfig:
 
     - - -
 
+    **analytic_signal_method**
+    > The method by which the analytic signal will be calculated. The result
+    is shared by the frequency versus time and the time envelope
+    calculations.
+    > Method derived from default function:
+    >> `sweep_design.math_signals.defaults.sweep_methods.get_analytic_signal`
+
+    > **input**:
+    >> **time**: `numpy.ndarray`
+    **amplitude**: `numpy.ndarray`
+
+    > **output**:
+    >> **analytic_signal**: `numpy.ndarray`
+
+    - - -
+
     **get_f_t**
     > The method by which frequency versus time will be calculated.
     > Method derived from default function:
@@ -34,10 +50,15 @@ class SweepConfig:
     > **input**:
     >> **time**: `numpy.ndarray`
     **amplitude**: `numpy.ndarray`
+    **analytical_signal**: `numpy.ndarray` = `None` (keyword only, optional)
 
     > **output**:
     >> `sweep_design.math_signals.math_relation.Relation`
 
+    > The analytic signal is passed only if the method has the
+    **analytical_signal** parameter, the methods of two parameters are
+    also accepted.
+
     - - -
 
     **get_a_t**
@@ -48,6 +69,7 @@ class SweepConfig:
     > **input**:
     >> **time**: `numpy.ndarray`
     **amplitude**: `numpy.ndarray`
+    **analytical_signal**: `numpy.ndarray` = `None` (keyword only, optional)
 
     > **output**:
     >> `sweep_design.math_signals.math_relation.Relation`
@@ -57,8 +79,15 @@ class SweepConfig:
     **integrate_function**
     > A method for integrating a function rather than a sequence.
     Method derived from default function:
+    >> `sweep_design.math_signals.defaults.sweep_methods.integrate_simpson`
+
+    > The slow but accurate adaptive quadrature can be used as a reference:
     >> `sweep_design.math_signals.defaults.sweep_methods.integrate_quad`
 
+    > The default method calls the function once with the array of time.
+    The functions which accept only a number are called for each value
+    of time (slower, but the result is the same).
+
     > **input**:
     >> **f_t_function**: `Callable`[[**time**: `numpy.ndarray`],
     **frequency**: `numpy.ndarray`]
@@ -95,11 +124,12 @@ class SweepConfig:
 
     # Methods for Sweep.
     spectrogram_method = dfsm.get_spectrogram
+    analytic_signal_method = dfsm.get_analytic_signal
     get_f_t = dfsm.get_f_t
     get_a_t = dfsm.get_a_t
 
     # Methods for UncalculatedSweep.
-    integrate_function = dfsm.integrate_quad
+    integrate_function = dfsm.integrate_simpson
 
     # Method for ApriorUncalculatedSweep.
     freq2time = dfsm.simple_freq2time
@@ -28,6 +28,12 @@ If this is instance of
 `sweep_design.named_signals.named_relation.NamedRelation` you want to store, 
 then the name will be `str(instance of NamedRelation).(extension you chose)`. 
 
+To create and write a library of pilots use 
+`sweep_design.dataio.write.write_batch.write_pilots`. It takes a list of 
+`sweep_design.dataio.write.write_batch.PilotSpec` (the function creating the 
+pilot, its parameters and the file name), creates the pilots on a pool of 
+processes and writes them with `sweep_design.dataio.write.write_data.write_data`.
+
 """
 
 from .read.read_mat import read_mat_file as read_mat_file
@@ -36,3 +42,5 @@ from .read.read_txt import read_txt_file as read_txt_file
 from .write.write_data import write_data as write_data
 from .write.write_mat import write_mat_file as write_mat_file
 from .write.write_txt import write_txt_file as write_txt_file
+from .write.write_batch import PilotSpec as PilotSpec
+from .write.write_batch import write_pilots as write_pilots
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from ...config import Config
+from ...math_signals import Relation
+from ...math_signals.defaults.fft_backends import ScipyFFT
+from ...math_signals.prepared_sweeps import get_linear_sweep
+from ..write.write_batch import (
+    PilotSpec,
+    _create_to_shared_memory,
+    _read_from_shared_memory,
+    write_pilots,
+)
+
+SHM_PATH = Path("/dev/shm")
+
+
+def get_pilot_error(**kwargs):
+    raise ValueError("The pilot can not be created.")
+
+
+def get_pilot_workers(**kwargs):
+    workers = getattr(Config.fft_backend, "workers", 1)
+    return Relation(np.arange(2.0), np.full(2, workers))
+
+
+def get_shared_blocks():
+    if not SHM_PATH.exists():
+        return set()
+    return {k for k in os.listdir(SHM_PATH) if k.startswith("psm_")}
+
+
+class TestWritePilots(unittest.TestCase):
+    def setUp(self):
+        self.t = np.linspace(0.0, 1.0, 1001)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_specs(self):
+        return [
+            PilotSpec(
+                get_linear_sweep,
+                self.path / f"linear_{k}.txt",
+                {"t": self.t, "f_start": 1.0, "f_end": 10.0 * k},
+            )
+            for k in range(1, 4)
+        ]
+
+    def check_written(self, specs):
+        for spec in specs:
+            with self.subTest(file_name=spec.file_name):
+                expected = spec.create(**spec.kwargs)
+                x, y = np.loadtxt(spec.file_name, skiprows=1).T
+                np.testing.assert_allclose(x, expected.x)
+                np.testing.assert_allclose(y, expected.y)
+
+    def test_serial(self):
+        specs = self.get_specs()
+        self.assertEqual(write_pilots(specs, processes=1), [k.file_name for k in specs])
+        self.check_written(specs)
+
+    def test_pool(self):
+        blocks = get_shared_blocks()
+        specs = self.get_specs()
+        self.assertEqual(write_pilots(specs, processes=2), [k.file_name for k in specs])
+        self.check_written(specs)
+        self.assertEqual(get_shared_blocks(), blocks)
+
+    def test_pool_threads(self):
+        default = Config.fft_backend
+        Config.fft_backend = ScipyFFT(workers=-1)
+        try:
+            specs = [
+                PilotSpec(get_pilot_workers, self.path / f"workers_{k}.txt")
+                for k in range(2)
+            ]
+            write_pilots(specs, processes=2)
+        finally:
+            Config.fft_backend = default
+        for spec in specs:
+            workers = np.loadtxt(spec.file_name, skiprows=1).T[1]
+            np.testing.assert_array_equal(workers, 1)
+
+    def test_errors(self):
+        blocks = get_shared_blocks()
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                specs = self.get_specs()
+                failed = [
+                    PilotSpec(get_pilot_error, self.path / "error.txt"),
+                    specs[0]._replace(file_name=self.path / "absent" / "a.txt"),
+                ]
+                with self.assertRaises(ValueError):
+                    write_pilots(failed[:1] + specs + failed[1:], processes)
+                self.check_written(specs)
+                self.assertFalse(failed[1].file_name.exists())
+                self.assertEqual(get_shared_blocks(), blocks)
+
+    def test_shared_memory(self):
+        blocks = get_shared_blocks()
+        spec = self.get_specs()[0]
+        shared = _create_to_shared_memory(spec)
+        pilot = _read_from_shared_memory(shared)
+        expected = spec.create(**spec.kwargs)
+        np.testing.assert_array_equal(pilot.x, expected.x)
+        np.testing.assert_array_equal(pilot.y, expected.y)
+        self.assertEqual(get_shared_blocks(), blocks)
@@ -0,0 +1,163 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from loguru import logger
+
+from ...config import Config
+from ...math_signals import Relation, UniformAxis
+from .write_data import write_data
+
+
+class PilotSpec(NamedTuple):
+    """Specification of a pilot to create and write.
+
+    The pilot is created as create(**kwargs), for example by the functions
+    of `sweep_design.math_signals.prepared_sweeps`. The function and the
+    parameters must be picklable to be sent to other processes (functions
+    defined at the top level of a module).
+    """
+
+    create: Callable[..., Relation]
+    file_name: Union[Path, str]
+    kwargs: Optional[Dict[str, Any]] = None
+    header: Optional[Tuple[str, str]] = None
+    file_type: Optional[Literal[".mat", ".txt"]] = None
+
+
+class _SharedPilot(NamedTuple):
+    name: str
+    axis: Optional[UniformAxis]
+    arrays: List[Tuple[str, int, int]]
+
+
+def _init_process() -> None:
+    """Use one thread for the Fourier transforms in the process of the pool.
+
+    The processes already take all CPUs, the threads of the backend (e.g.
+    `ScipyFFT(workers=-1)`) would only compete with them.
+    """
+    backend = Config.fft_backend
+    if getattr(backend, "workers", 1) != 1:
+        backend = copy.copy(backend)
+        backend.workers = 1
+        Config.fft_backend = backend
+
+
+def _create_pilot(spec: PilotSpec) -> Relation:
+    pilot = spec.create(**(spec.kwargs or {}))
+    if not isinstance(pilot, Relation):
+        pilot = Relation(pilot)
+    return pilot
+
+
+def _create_to_shared_memory(spec: PilotSpec) -> _SharedPilot:
+    """Create the pilot and put its data to a new block of shared memory.
+
+    Only the y-array (and the x-array if it is not uniform) is copied, the
+    block is released by the process that reads it (the block is taken off
+    the resource tracker of this process, otherwise it is reported as leaked
+    or removed before reading when the process exits).
+    """
+    pilot = _create_pilot(spec)
+    axis = pilot._get_axis()
+    y = pilot.get_data(copy=False)[1]
+    data = [y] if isinstance(axis, UniformAxis) else [axis, y]
+
+    shm = SharedMemory(create=True, size=max(sum(k.nbytes for k in data), 1))
+    try:
+        arrays = []
+        offset = 0
+        for array in data:
+            view = np.ndarray(array.shape, array.dtype, shm.buf, offset)
+            view[:] = array
+            del view
+            arrays.append((array.dtype.str, array.size, offset))
+            offset += array.nbytes
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    # The tracker registers the name with the leading slash of POSIX.
+    resource_tracker.unregister(f"/{shm.name.lstrip('/')}", "shared_memory")
+
+    return _SharedPilot(
+        shm.name, axis if isinstance(axis, UniformAxis) else None, arrays
+    )
+
+
+def _read_from_shared_memory(shared: _SharedPilot) -> Relation:
+    shm = SharedMemory(shared.name)
+    try:
+        data = [
+            np.ndarray(size, dtype, shm.buf, offset).copy()
+            for dtype, size, offset in shared.arrays
+        ]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if shared.axis is not None:
+        return Relation(shared.axis, data[0])
+    return Relation(*data)
+
+
+def write_pilots(
+    specs: Sequence[PilotSpec], processes: Optional[int] = None
+) -> List[Union[Path, str]]:
+    """Create the pilots on a pool of processes and write them.
+
+    The pilots are created concurrently (processes = None - the number of
+    CPUs, processes = 1 - in the calling process), the Fourier transforms
+    of each process use one thread. The data of the pilots
+    are returned through the shared memory instead of pickling the objects
+    and written by `sweep_design.dataio.write.write_data.write_data` in the
+    calling process.
+
+    If some pilots failed (created or written), the rest are written anyway,
+    the errors are logged and the first of them is raised at the end.
+
+    Parametrs:
+    > specs: Sequence[PilotSpec] - specifications of the pilots.
+    > processes: Optional[int] = None - number of processes.
+    Returns:
+    > List[Union[Path, str]] - file names of the written pilots.
+    """
+    errors = []
+
+    def write(spec: PilotSpec, get_pilot: Callable[[], Relation]) -> None:
+        try:
+            pilot = get_pilot()
+            write_data(pilot, spec.file_name, spec.header, spec.file_type)
+        except Exception as error:
+            logger.error("The pilot {} is not written: {}", spec.file_name, error)
+            errors.append(error)
+
+    if processes == 1 or len(specs) < 2:
+        for spec in specs:
+            write(spec, lambda: _create_pilot(spec))
+    else:
+        with ProcessPoolExecutor(processes, initializer=_init_process) as executor:
+            futures = [executor.submit(_create_to_shared_memory, k) for k in specs]
+            for spec, future in zip(specs, futures):
+                write(spec, lambda: _read_from_shared_memory(future.result()))
+
+    if errors:
+        raise errors[0]
+    return [spec.file_name for spec in specs]
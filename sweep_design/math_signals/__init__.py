@@ -8,6 +8,15 @@ variable *y = f(x)*. It introduces basic math operations (-, +, *, /,
 exponentiation(**)), derivation, integration, 
 correlation, convolution, and other operations.
 
+An instance of the `sweep_design.math_signals.defaults.base_structures.UniformAxis` 
+class (start, step, size) can be passed instead of the x array. Then the x-axis 
+of the relation is not stored, it is calculated only when it is requested.
+
+The method `sweep_design.math_signals.math_relation.Relation.lazy` returns an 
+instance of the `sweep_design.math_signals.math_expression.RelationExpression` 
+class. The mathematical operations with it are not calculated immediately, 
+the whole expression is calculated once when the data of the result is requested.
+
 - - -
 
 The next two classes are `sweep_design.math_signals.math_signal.Signal` and 
@@ -50,6 +59,12 @@ inherits from the `sweep_design.math_signals.math_signal.Signal` class.
 It does not have additional methods, but only contains the fields of frequency 
 versus time (**frequency_time**), the amplitude envelope (**amplitude_time**), 
 the spectrogram (**spectrogram**) and the a priori signal (**aprior_signal**).
+The spectrogram and, if they were not passed, the frequency versus time and
+the amplitude envelope are calculated on the first access.
+
+The `sweep_design.math_signals.math_sweep.SweepBatch` class stores several
+sweep signals with a common time axis as one 2-D array and creates
+`sweep_design.math_signals.math_sweep.Sweep` instances only on request.
 
 - - -
 
@@ -94,6 +109,12 @@ The default methods to use are defined in
 `sweep_design.math_signals.defaults.methods` 
 and `sweep_design.math_signals.defaults.sweep_methods`
 
+The results of the expensive methods (Fourier transforms, analytic signal, 
+spectrogram, conversion of a priori data) are kept only by the instances. 
+To reuse them between instances with the same data, set an instance of the 
+`sweep_design.math_signals.result_cache.ResultCache` class (in-memory LRU 
+and optional on-disk store) to `Config.result_cache`.
+
 - - -
 
 `utility_functions` defines useful functions such as:
@@ -102,6 +123,10 @@ and `sweep_design.math_signals.defaults.sweep_methods`
 to analyse a signal using Empirical Mode Decomposition and contains instances that 
 contain Intrinsic Mode Functions (IMFs).
 
+> * Function `sweep_design.math_signals.utility_functions.emd_analyse.get_first_IMF_emd`
+to get only the first IMF of a signal. The sifting can be started from the 
+trend of a close signal, for example in the iterations of a correction.
+
 > * Function `sweep_design.math_signals.utility_functions.emd_analyse.get_IMFs_ceemdan`
 to analyse a signal using Complete Ensemble Empirical Mode Decomposition with 
 Adaptive Noise and return `NamedSignal` instances that contain Intrinsic 
@@ -143,6 +168,16 @@ window in the star so that the displacement starts at zero.
 > * `sweep_design.math_signals.utility_functions.sweep_correction_source.get_correction_for_source` - 
 Sweep signal correction for realization on the vibration source.
 
+> * `sweep_design.math_signals.utility_functions.detrend.highpass_detrend` and 
+`sweep_design.math_signals.utility_functions.detrend.spline_detrend` - 
+faster alternatives to the EMD 
+(`sweep_design.math_signals.utility_functions.detrend.emd_detrend`) to remove 
+the drift of the displacement in the sweep corrections (detrend_method parameter).
+
+> * `sweep_design.math_signals.utility_functions.stream_correlation.correlate_stream` - 
+Correlation of a long record, passed chunk by chunk, with a pilot sweep 
+signal using the overlap-save method.
+
 For convenience, you can import functions in the following way
 ```python
 from sweep_design.math_signals.utility_functions import get_time
@@ -157,15 +192,24 @@ the necessary parameters.
 Functions are defined to create the following sweep signals:
 
 * Linear sweep 
-(`sweep_design.math_signals.prepared_sweeps.linear_sweep.get_linear_sweep`)
+(`sweep_design.math_signals.prepared_sweeps.linear_sweep.get_linear_sweep`, 
+a batch of linear sweeps over arrays of parameters 
+`sweep_design.math_signals.prepared_sweeps.linear_sweep.get_linear_sweeps`)
 * Dwell sweep 
 (`sweep_design.math_signals.prepared_sweeps.dwell_sweep.get_dwell_sweep`)
 * Code Zinger 
 (`sweep_design.math_signals.prepared_sweeps.code_zinger.get_code_zinger`)
 * m - sequence 
-(`sweep_design.math_signals.prepared_sweeps.m_sequence.get_m_sequence`)
+(`sweep_design.math_signals.prepared_sweeps.m_sequence.get_m_sequence`, 
+a reproducible batch created on a pool of processes 
+`sweep_design.math_signals.prepared_sweeps.m_sequence.get_m_sequences`)
 * shuffle 
-(`sweep_design.math_signals.prepared_sweeps.pseudorandom_shuffle.get_shuffle`)
+(`sweep_design.math_signals.prepared_sweeps.pseudorandom_shuffle.get_shuffle`, 
+many shuffles at once 
+`sweep_design.math_signals.prepared_sweeps.pseudorandom_shuffle.get_shuffle_segments` 
+and `sweep_design.math_signals.prepared_sweeps.pseudorandom_shuffle.get_shuffle_frequency_time`, 
+the shuffles with the lowest autocorrelation side lobes 
+`sweep_design.math_signals.prepared_sweeps.pseudorandom_shuffle.get_best_shuffles`)
 
 For convenience, you can import functions in the following way
 ```python
@@ -174,9 +218,13 @@ from sweep_design.math_signals.prepared_sweeps import get_linear_sweep
 
 """
 
+from .defaults.base_structures import UniformAxis as UniformAxis
+from .math_expression import RelationExpression as RelationExpression
 from .math_relation import Relation as Relation
 from .math_signal import Spectrum as Spectrum
 from .math_signal import Signal as Signal
 from .math_sweep import Sweep as Sweep
+from .math_sweep import SweepBatch as SweepBatch
 from .math_uncalcsweep import UncalculatedSweep as UncalculatedSweep
 from .math_uncalcsweep import ApriorUncalculatedSweep as ApriorUncalculatedSweep
+from .result_cache import ResultCache as ResultCache
@@ -1,4 +1,5 @@
-from typing import NamedTuple, Protocol, Tuple, runtime_checkable
+import math
+from typing import NamedTuple, Protocol, Tuple, Union, runtime_checkable
 import numpy as np
 from enum import Enum
 
@@ -52,6 +53,52 @@ class MathOperation(Enum):
     RPOW = "__rpow__"
 
 
+# Seed of the random generation of the prepared sweeps.
+Seed = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+class ConvolveMethod(Enum):
+    DIRECT = "direct"
+    FFT = "fft"
+    OVERLAP_ADD = "overlap_add"
+
+
+class UniformAxis(NamedTuple):
+    """Uniform axis described by the first value, the step and the size."""
+
+    start: float
+    step: float
+    size: int
+
+    def get_array(self) -> np.ndarray:
+        return self.start + np.arange(self.size) * self.step
+
+    def get_value(self, index: int) -> float:
+        return self.start + index * self.step
+
+    def select(self, x_start: float, x_end: float) -> Tuple[int, int]:
+        """Return indexes [start, end) of values between x_start and x_end."""
+        i_start = min(max(0, math.ceil((x_start - self.start) / self.step)), self.size)
+        while i_start > 0 and self.get_value(i_start - 1) >= x_start:
+            i_start -= 1
+        while i_start < self.size and self.get_value(i_start) < x_start:
+            i_start += 1
+
+        i_end = min(
+            max(0, math.floor((x_end - self.start) / self.step) + 1), self.size
+        )
+        while i_end < self.size and self.get_value(i_end) <= x_end:
+            i_end += 1
+        while i_end > 0 and self.get_value(i_end - 1) > x_end:
+            i_end -= 1
+
+        return i_start, max(i_start, i_end)
+
+    def get_nearest(self, value: float) -> int:
+        """Return index of the nearest value of the axis."""
+        return min(max(0, round((value - self.start) / self.step)), self.size - 1)
+
+
 class BaseXY(NamedTuple):
     x: np.ndarray
     y: np.ndarray
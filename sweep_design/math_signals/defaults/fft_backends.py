@@ -0,0 +1,140 @@
+"""The backends of the Fourier transforms.
+
+The backend used by the default methods is set in `Config.fft_backend`.
+"""
+
+import os
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Iterator, Optional
+
+import numpy as np
+import scipy.fft  # type: ignore
+
+
+class FFTBackend:
+    """The Fourier transforms by numpy.fft.
+
+    The base class of the backends. The methods have the same parameters as
+    the functions of numpy.fft, the `context` method returns the context
+    in which the transforms made by scipy (the functions of scipy.signal)
+    use the backend.
+    """
+
+    def fft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return np.fft.fft(a, n, axis)
+
+    def ifft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return np.fft.ifft(a, n, axis)
+
+    def rfft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return np.fft.rfft(a, n, axis)
+
+    def irfft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return np.fft.irfft(a, n, axis)
+
+    def context(self) -> ContextManager[Any]:
+        return nullcontext()
+
+
+class ScipyFFT(FFTBackend):
+    """The Fourier transforms by scipy.fft.
+
+    Parametrs:
+    > workers: Optional[int] = -1 - number of threads, negative values
+    count from the number of CPUs (-1 - all of them), None - one thread.
+
+    The threads split the batch of transforms (2-D arrays, e.g. the segments
+    of the spectrogram or the rows of a batch of sweeps), one 1-D transform
+    is calculated by one thread.
+    """
+
+    def __init__(self, workers: Optional[int] = -1) -> None:
+        self.workers = workers
+
+    def fft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return scipy.fft.fft(a, n, axis, workers=self.workers)
+
+    def ifft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return scipy.fft.ifft(a, n, axis, workers=self.workers)
+
+    def rfft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return scipy.fft.rfft(a, n, axis, workers=self.workers)
+
+    def irfft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return scipy.fft.irfft(a, n, axis, workers=self.workers)
+
+    def context(self) -> ContextManager[Any]:
+        return scipy.fft.set_workers(self.workers or 1)
+
+
+class PyFFTW(ScipyFFT):
+    """The planned Fourier transforms by pyFFTW (if it is installed).
+
+    The plans are made once for each size and type of the arrays and kept
+    in the cache of pyFFTW, so the transforms of the same size (sweeps of
+    the same length, blocks of `correlate_stream`) reuse them.
+
+    Parametrs:
+    > workers: Optional[int] = -1 - number of threads, negative values
+    count from the number of CPUs (-1 - all of them), None - one thread.
+    > planner_effort: str = "FFTW_MEASURE" - the effort of the planning.
+    > keepalive_time: float = 60. - seconds to keep the unused plans.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = -1,
+        planner_effort: str = "FFTW_MEASURE",
+        keepalive_time: float = 60.0,
+    ) -> None:
+        try:
+            import pyfftw  # type: ignore
+            import pyfftw.interfaces.scipy_fft  # type: ignore
+        except ImportError as error:
+            raise ImportError(
+                "The PyFFTW backend requires the pyfftw package."
+            ) from error
+
+        if workers is not None and workers < 0:
+            workers = max((os.cpu_count() or 1) + 1 + workers, 1)
+        super().__init__(workers)
+        self.planner_effort = planner_effort
+        self._module = pyfftw.interfaces.scipy_fft
+        pyfftw.interfaces.cache.enable()
+        pyfftw.interfaces.cache.set_keepalive_time(keepalive_time)
+
+    def fft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return self._module.fft(
+            a, n, axis, workers=self.workers, planner_effort=self.planner_effort
+        )
+
+    def ifft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return self._module.ifft(
+            a, n, axis, workers=self.workers, planner_effort=self.planner_effort
+        )
+
+    def rfft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return self._module.rfft(
+            a, n, axis, workers=self.workers, planner_effort=self.planner_effort
+        )
+
+    def irfft(self, a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> Any:
+        return self._module.irfft(
+            a, n, axis, workers=self.workers, planner_effort=self.planner_effort
+        )
+
+    @contextmanager
+    def _context(self) -> Iterator[None]:
+        with scipy.fft.set_backend(self._module), super().context():
+            yield
+
+    def context(self) -> ContextManager[Any]:
+        return self._context()
+
+
+def get_fft_backend() -> FFTBackend:
+    """The backend set in `Config.fft_backend`."""
+    # The config imports the default methods, so it is imported here.
+    from ...config.config import Config
+
+    return Config.fft_backend
@@ -1,12 +1,14 @@
 """This is where defualt methods are defined."""
 
-from typing import Callable, Union, Any, TYPE_CHECKING, Type, Tuple
+from typing import Callable, Optional, Union, Any, TYPE_CHECKING, Type, Tuple
 
 import numpy as np
 from scipy.interpolate import interp1d  # type: ignore
 from scipy.integrate import cumulative_trapezoid, trapz  # type: ignore
+from scipy.signal import fftconvolve, oaconvolve  # type: ignore
 
-from .base_structures import NotEqualError, MathOperation
+from .base_structures import ConvolveMethod, NotEqualError, MathOperation, UniformAxis
+from .fft_backends import get_fft_backend
 
 x = np.ndarray
 y = np.ndarray
@@ -39,6 +41,73 @@ def math_operation(
     return x, y
 
 
+_UFUNCS = {
+    MathOperation.ADD: (np.add, False),
+    MathOperation.RADD: (np.add, True),
+    MathOperation.SUB: (np.subtract, False),
+    MathOperation.RSUB: (np.subtract, True),
+    MathOperation.MUL: (np.multiply, False),
+    MathOperation.RMUL: (np.multiply, True),
+    MathOperation.TRUEDIV: (np.true_divide, False),
+    MathOperation.RTRUEDIV: (np.true_divide, True),
+    MathOperation.RPOW: (np.power, True),
+}
+
+
+def _apply_ufunc(
+    ufunc: np.ufunc,
+    y1: Union[np.ndarray, Number],
+    y2: Union[np.ndarray, Number],
+    out: Optional[np.ndarray],
+) -> np.ndarray:
+    if out is not None and (
+        out.dtype.kind not in "fc"
+        or not out.flags.writeable
+        or np.result_type(y1, y2) != out.dtype
+    ):
+        out = None
+    return ufunc(y1, y2, out=out)
+
+
+def apply_math_operation(
+    y1: Union[np.ndarray, Number],
+    y2: Union[np.ndarray, Number],
+    name_operation: MathOperation,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Math operation with the output array.
+
+    The result is the same as the result of `math_operation`. It is written
+    to out, if out is not None and has a suitable type, otherwise a new
+    array is returned.
+    """
+    if name_operation == MathOperation.POW:
+        sign = np.sign(y1)
+        result = np.abs(y1, out=out if out is y1 else None)
+        result = _apply_ufunc(np.power, result, y2, result)
+        return _apply_ufunc(np.multiply, result, sign, result)
+
+    ufunc, is_reflected = _UFUNCS[name_operation]
+    if is_reflected:
+        y1, y2 = y2, y1
+    return _apply_ufunc(ufunc, y1, y2, out)
+
+
+def inplace_math_operation(
+    y1: np.ndarray,
+    y2: Union[np.ndarray, Number],
+    name_operation: MathOperation,
+) -> y:
+    """In-place math operations.
+
+    The result is written to y1 if its type allows it,
+    otherwise a new array is returned.
+    """
+    if isinstance(y2, np.ndarray) and np.shares_memory(y1, y2):
+        y2 = y2.copy()
+    return apply_math_operation(y1, y2, name_operation, y1)
+
+
 def one_integrate(y: np.ndarray, x: np.ndarray = None) -> float:
     """Integration.
 
@@ -95,16 +164,82 @@ def get_common_x(
     return np.linspace(x_start, (int(X / dx)) * dx, int(X / dx) + 1)
 
 
+def align_uniform(
+    x1: Union[UniformAxis, np.ndarray],
+    y1: np.ndarray,
+    dx1: float,
+    x2: Union[UniformAxis, np.ndarray],
+    y2: np.ndarray,
+    dx2: float,
+    tolerance: float = 1e-3,
+) -> Optional[Tuple[Union[UniformAxis, x], y, y]]:
+    """Align two uniformly sampled sequences on the common x-axis.
+
+    If both sequences have the same sample rate and their starts differ
+    by an integer number of samples, the sequences are aligned by the
+    offset and padded with zeros (the same result as the interpolation
+    with zero extrapolation). Otherwise `None` is returned.
+
+    If both x are `UniformAxis`, the grids are uniform by definition and
+    the common x-axis is `UniformAxis` too. Otherwise each step of the
+    arrays is checked.
+
+    `tolerance` is the allowed mismatch of the grids in parts of one sample.
+    """
+    is_axis = isinstance(x1, UniformAxis) and isinstance(x2, UniformAxis)
+    if is_axis:
+        dx1, dx2 = x1.step, x2.step
+        first1, first2 = x1.start, x2.start
+    else:
+        x1, x2 = (k.get_array() if isinstance(k, UniformAxis) else k for k in (x1, x2))
+        first1, first2 = x1[0], x2[0]
+
+    dx = dx1
+    if abs(dx1 - dx2) * max(x1.size, x2.size) > tolerance * dx:
+        return None
+
+    if not is_axis:
+        for k in (x1, x2):
+            if abs((k[-1] - k[0]) - (k.size - 1) * dx) > tolerance * dx:
+                return None
+            if not np.allclose(np.diff(k), dx, rtol=0.0, atol=tolerance * dx):
+                return None
+
+    offset = (first2 - first1) / dx
+    shift = int(round(offset))
+    if abs(offset - shift) > tolerance:
+        return None
+
+    start1, start2 = max(0, -shift), max(0, shift)
+    size = max(start1 + x1.size, start2 + x2.size)
+
+    if start1 == 0 and size == x1.size:
+        new_x = x1
+    elif start2 == 0 and size == x2.size:
+        new_x = x2
+    else:
+        x_start = first1 if start1 == 0 else first2
+        if is_axis:
+            new_x = UniformAxis(x_start, dx, size)
+        else:
+            new_x = x_start + np.arange(size) * dx
+
+    new_y1, new_y2 = y1, y2
+    if size != y1.size:
+        new_y1 = np.zeros(size, dtype=y1.dtype)
+        new_y1[start1 : start1 + y1.size] = y1
+    if size != y2.size:
+        new_y2 = np.zeros(size, dtype=y2.dtype)
+        new_y2[start2 : start2 + y2.size] = y2
+    return new_x, new_y1, new_y2
+
+
 def correlate(cls: Type["Relation"], r1: "Relation", r2: "Relation") -> Tuple[x, y]:
     """Correlation.
 
     Using the numpy.correlate function.
     """
-    r1 = r1.shift(-r1._x[0])
-    r2 = r2.shift(-r2._x[0])
-    r1, r2 = cls.equalize(r1, r2)
-    x, y1 = r1.get_data()
-    _, y2 = r2.get_data()
+    x, y1, y2 = _prepare_correlate_convolve(cls, r1, r2)
     return np.append(np.sort(-1 * x)[:-1], x), np.correlate(y1, y2, "full")
 
 
@@ -113,12 +248,165 @@ def convolve(cls: Type["Relation"], r1: "Relation", r2: "Relation") -> Tuple[x,
 
     Using the numpy.convlove function.
     """
+    x, y1, y2 = _prepare_correlate_convolve(cls, r1, r2)
+    return np.append(np.sort(-1 * x)[:-1], x), np.convolve(y1, y2, "full")
+
+
+def correlate_fft(
+    cls: Type["Relation"], r1: "Relation", r2: "Relation"
+) -> Tuple[x, y]:
+    """Correlation.
+
+    Using the scipy.signal.fftconvolve function.
+    """
+    return _correlate_by_method(cls, r1, r2, ConvolveMethod.FFT)
+
+
+def convolve_fft(
+    cls: Type["Relation"], r1: "Relation", r2: "Relation"
+) -> Tuple[x, y]:
+    """Convolution.
+
+    Using the scipy.signal.fftconvolve function.
+    """
+    return _convolve_by_method(cls, r1, r2, ConvolveMethod.FFT)
+
+
+def correlate_overlap_add(
+    cls: Type["Relation"], r1: "Relation", r2: "Relation"
+) -> Tuple[x, y]:
+    """Correlation.
+
+    Using the scipy.signal.oaconvolve function (overlap-add method).
+    """
+    return _correlate_by_method(cls, r1, r2, ConvolveMethod.OVERLAP_ADD)
+
+
+def convolve_overlap_add(
+    cls: Type["Relation"], r1: "Relation", r2: "Relation"
+) -> Tuple[x, y]:
+    """Convolution.
+
+    Using the scipy.signal.oaconvolve function (overlap-add method).
+    """
+    return _convolve_by_method(cls, r1, r2, ConvolveMethod.OVERLAP_ADD)
+
+
+def correlate_auto(
+    cls: Type["Relation"], r1: "Relation", r2: "Relation"
+) -> Tuple[x, y]:
+    """Correlation.
+
+    The method (direct, FFT or overlap-add) is chosen by the sizes of
+    the sequences using the `choose_convolve_method` function.
+    """
+    return _correlate_by_method(cls, r1, r2)
+
+
+def convolve_auto(
+    cls: Type["Relation"], r1: "Relation", r2: "Relation"
+) -> Tuple[x, y]:
+    """Convolution.
+
+    The method (direct, FFT or overlap-add) is chosen by the sizes of
+    the sequences using the `choose_convolve_method` function.
+    """
+    return _convolve_by_method(cls, r1, r2)
+
+
+def choose_convolve_method(size1: int, size2: int) -> ConvolveMethod:
+    """Choose the method of convolution by the sizes of the sequences.
+
+    The direct method is used when the number of multiplications is
+    comparable with the cost of the FFT. The overlap-add method is used
+    when one sequence is much longer than the other.
+    """
+    small, large = sorted((size1, size2))
+    full_size = size1 + size2 - 1
+    if small * large <= 30 * full_size * np.log2(max(full_size, 2)):
+        return ConvolveMethod.DIRECT
+    if large >= 20 * small:
+        return ConvolveMethod.OVERLAP_ADD
+    return ConvolveMethod.FFT
+
+
+def convolve_arrays(
+    y1: np.ndarray, y2: np.ndarray, method: ConvolveMethod = None
+) -> np.ndarray:
+    """Full discrete convolution of two sequences.
+
+    If the method is not passed, it is chosen by `choose_convolve_method`.
+    """
+    if method is None:
+        method = choose_convolve_method(y1.size, y2.size)
+
+    if method == ConvolveMethod.DIRECT:
+        return np.convolve(y1, y2, "full")
+    with get_fft_backend().context():
+        if method == ConvolveMethod.FFT:
+            return fftconvolve(y1, y2, "full")
+        return oaconvolve(y1, y2, "full")
+
+
+def correlate_arrays(
+    y1: np.ndarray, y2: np.ndarray, method: ConvolveMethod = None
+) -> np.ndarray:
+    """Full discrete cross-correlation of two sequences (as numpy.correlate).
+
+    If the method is not passed, it is chosen by `choose_convolve_method`.
+    """
+    if method is None:
+        method = choose_convolve_method(y1.size, y2.size)
+
+    if method == ConvolveMethod.DIRECT:
+        return np.correlate(y1, y2, "full")
+    return convolve_arrays(y1, np.conj(y2[::-1]), method)
+
+
+def _prepare_correlate_convolve(
+    cls: Type["Relation"], r1: "Relation", r2: "Relation"
+) -> Tuple[x, y, y]:
     r1 = r1.shift(-r1._x[0])
     r2 = r2.shift(-r2._x[0])
     r1, r2 = cls.equalize(r1, r2)
-    x, y1 = r1.get_data()
-    _, y2 = r2.get_data()
-    return np.append(np.sort(-1 * x)[:-1], x), np.convolve(y1, y2, "full")
+    x, y1 = r1.get_data(copy=False)
+    _, y2 = r2.get_data(copy=False)
+    return x, y1, y2
+
+
+def _correlate_by_method(
+    cls: Type["Relation"],
+    r1: "Relation",
+    r2: "Relation",
+    method: ConvolveMethod = None,
+) -> Tuple[x, y]:
+    x, y1, y2 = _prepare_correlate_convolve(cls, r1, r2)
+
+    # Zeros added by the equalization at the end of sequences are not used.
+    t_y1, t_y2 = np.trim_zeros(y1, "b"), np.trim_zeros(y2, "b")
+    result = np.zeros(2 * x.size - 1, dtype=np.result_type(y1, y2, float))
+    if t_y1.size and t_y2.size:
+        start = x.size - t_y2.size
+        result[start : start + t_y1.size + t_y2.size - 1] = correlate_arrays(
+            t_y1, t_y2, method
+        )
+    return np.append(np.sort(-1 * x)[:-1], x), result
+
+
+def _convolve_by_method(
+    cls: Type["Relation"],
+    r1: "Relation",
+    r2: "Relation",
+    method: ConvolveMethod = None,
+) -> Tuple[x, y]:
+    x, y1, y2 = _prepare_correlate_convolve(cls, r1, r2)
+
+    # Zeros added by the equalization at the end of sequences are not used.
+    t_y1, t_y2 = np.trim_zeros(y1, "b"), np.trim_zeros(y2, "b")
+    result = np.zeros(2 * x.size - 1, dtype=np.result_type(y1, y2, float))
+    if t_y1.size and t_y2.size:
+        result[: t_y1.size + t_y2.size - 1] = convolve_arrays(t_y1, t_y2, method)
+    return np.append(np.sort(-1 * x)[:-1], x), result
 
 
 # ==============================================================================
@@ -129,7 +417,7 @@ def signal2spectrum(
 ) -> Tuple[frequency, spectrum]:
     """Forward Fourier Transform.
 
-    Using the numpy.fft.rfft function.
+    Using the rfft of `Config.fft_backend`.
     """
     if not is_start_zero:
         if time[0] > 0.0:
@@ -143,7 +431,7 @@ def signal2spectrum(
 
         amplitude = np.append(amplitude[time >= 0.0], amplitude[time < 0.0])
 
-    spectrum = np.fft.rfft(amplitude)
+    spectrum = get_fft_backend().rfft(amplitude)
     frequency = np.fft.rfftfreq(
         amplitude.size, d=(time[-1] - time[0]) / (amplitude.size)
     )
@@ -155,9 +443,9 @@ def spectrum2sigmal(
 ) -> Tuple[time, amplitude]:
     """Inverse Fourier Transform.
 
-    Using the numpy.fft.irfft function.
+    Using the irfft of `Config.fft_backend`.
     """
-    amplitude = np.fft.irfft(spectrum)  # type: np.ndarray
+    amplitude = get_fft_backend().irfft(spectrum)  # type: np.ndarray
     if time_start is None:
         time = np.linspace(
             0,
@@ -6,8 +6,10 @@ from scipy.signal import hilbert, spectrogram  # type: ignore
 
 from ...config.config import Config
 from ..defaults.base_structures import BadInputError, RelationProtocol
+from ..defaults.fft_backends import get_fft_backend
 from ..math_relation import Relation
 from ..math_signal import Signal, Spectrum
+from ..result_cache import call_cached
 
 InterpolateTime = Callable[[np.ndarray], np.ndarray]
 CallFtatMethod = Callable[[Spectrum], Tuple[np.ndarray, np.ndarray, np.ndarray]]
@@ -18,6 +20,7 @@ frequency = np.ndarray
 time = np.ndarray
 spectrogram_ = np.ndarray
 envelope = np.ndarray
+analytic_signal = np.ndarray
 
 theta = np.ndarray
 
@@ -38,7 +41,7 @@ def simple_freq2time(spectrum: "Spectrum") -> Tuple[time, frequency, envelope]:
     The amplitude modulation is constant.
     """
     amplitude_spectrum = spectrum.get_amp_spectrum()
-    frequency, amplitude = amplitude_spectrum.get_data()
+    frequency, amplitude = amplitude_spectrum.get_data(copy=False)
     n_spec = amplitude**2
     time = np.append(
         [0.0], ((n_spec[1:] + n_spec[:-1]) / (frequency[1:] - frequency[:-1])).cumsum()
@@ -75,7 +78,7 @@ def convert_freq2time(
     spectrum: "Spectrum", convert_method: CallFtatMethod
 ) -> Tuple[InterpolateTime, InterpolateTime]:
     """The method consists in obtaining the functions of frequency and amplitude modulation."""
-    nT, f, a_t = convert_method(spectrum)
+    nT, f, a_t = call_cached(convert_method, spectrum)
     return pre_interpolate_time(nT, f), pre_interpolate_time(nT, a_t)
 
 
@@ -175,17 +178,31 @@ def get_spectrogram(
     if dt is None:
         dt = time[1] - time[0]
 
-    frequency, spectrogram_time, spectrogram_ = spectrogram(amplitude, 1 / (dt))
+    with get_fft_backend().context():
+        frequency, spectrogram_time, spectrogram_ = spectrogram(amplitude, 1 / (dt))
 
     return spectrogram_time, frequency, spectrogram_
 
 
-def get_f_t(time: np.ndarray, amplitude: np.ndarray) -> Relation:
-    """Get time-frequency function from sweep signal using the Hilbert transformation.
+def get_analytic_signal(time: np.ndarray, amplitude: np.ndarray) -> analytic_signal:
+    """Get analytic signal of the sweep signal using the Hilbert transformation.
 
     Using the scipy.signal.hilbert function.
     """
-    analytical_signal = hilbert(amplitude)
+    with get_fft_backend().context():
+        return hilbert(amplitude)
+
+
+def get_f_t(
+    time: np.ndarray, amplitude: np.ndarray, *, analytical_signal: np.ndarray = None
+) -> Relation:
+    """Get time-frequency function from sweep signal using the Hilbert transformation.
+
+    Using the scipy.signal.hilbert function. If the analytical signal
+    is passed, it is used instead of calculating a new one.
+    """
+    if analytical_signal is None:
+        analytical_signal = get_analytic_signal(time, amplitude)
     result = np.append(
         [0.0],
         np.diff(np.unwrap(np.angle(analytical_signal)))
@@ -195,12 +212,16 @@ def get_f_t(time: np.ndarray, amplitude: np.ndarray) -> Relation:
     return Relation(time, result)
 
 
-def get_a_t(time: np.ndarray, amplitude: np.ndarray) -> Relation:
+def get_a_t(
+    time: np.ndarray, amplitude: np.ndarray, *, analytical_signal: np.ndarray = None
+) -> Relation:
     """Get envelop from sweep signal using the Hilbert transformation.
 
-    Using the scipy.signal.hilbert function.
+    Using the scipy.signal.hilbert function. If the analytical signal
+    is passed, it is used instead of calculating a new one.
     """
-    analytical_signal = hilbert(amplitude)
+    if analytical_signal is None:
+        analytical_signal = get_analytic_signal(time, amplitude)
     return Relation(time, np.abs(analytical_signal))
 
 
@@ -217,3 +238,53 @@ def integrate_quad(
             [2 * np.pi * integrate.quad(f_t_function, time[0], t)[0] for t in time[1:]]
         ),
     )
+
+
+def _call_on_grid(
+    f_t_function: Callable[[time], frequency], time: np.ndarray
+) -> frequency:
+    """Values of the function on the grid, point by point if it is scalar."""
+    try:
+        values = np.asarray(f_t_function(time), dtype=float)
+    except (TypeError, ValueError):
+        values = None
+    if values is None or values.shape not in ((), time.shape):
+        values = np.vectorize(f_t_function, otypes=[float])(time)
+    return np.broadcast_to(values, time.shape)
+
+
+def integrate_simpson(
+    f_t_function: Callable[[time], frequency], time: np.ndarray, oversampling: int = 4
+) -> theta:
+    """Integration.
+
+    Cumulative integration of time-frequency function using the composite
+    Simpson's rule. The function is called once on a grid that is
+    `oversampling` times finer than `time` (`oversampling` is rounded up
+    to an even number). If the function does not accept a `numpy.ndarray`
+    (it raises TypeError or ValueError, or returns an array of other shape),
+    it is called for each point of the grid, as `integrate_quad` calls it.
+
+    The error of the phase at any point of `time` is bounded by
+    2 * pi * (time[-1] - time[0]) * (dt / oversampling) ** 4 * max(|f(4)|) / 180,
+    where dt is the largest step of `time` and f(4) is the fourth derivative
+    of the function. The result is exact (up to the rounding error) for
+    polynomials up to the third degree. Use `integrate_quad` as a reference
+    when accuracy is in doubt.
+    """
+    n_sub = max(2, oversampling + oversampling % 2)
+    steps = np.diff(time) / n_sub
+
+    fine_time = np.append(
+        (time[:-1, np.newaxis] + steps[:, np.newaxis] * np.arange(n_sub)).ravel(),
+        time[-1],
+    )
+    values = _call_on_grid(f_t_function, fine_time)
+
+    weights = np.ones(n_sub + 1)
+    weights[1:-1:2] = 4.0
+    weights[2:-1:2] = 2.0
+    index = np.arange(time.size - 1)[:, np.newaxis] * n_sub + np.arange(n_sub + 1)
+
+    segments = values[index] @ weights * steps / 3.0
+    return np.append([0.0], 2 * np.pi * np.cumsum(segments))
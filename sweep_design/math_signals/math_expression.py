@@ -0,0 +1,157 @@
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .defaults.base_structures import MathOperation, RelationProtocol, TypeFuncError
+from .defaults.methods import apply_math_operation
+
+if TYPE_CHECKING:
+    from .math_relation import Relation
+
+Num = Union[float, int, complex]
+Operand = Union["Relation", "RelationExpression", Num]
+
+
+class RelationExpression:
+    """Deferred arithmetic on instances of the Relation class.
+
+    The instance is created by the `Relation.lazy` method. The mathematical
+    operations (+, -, *, /, **) with the instance do not calculate anything,
+    they build a tree of the expression. The expression is calculated once,
+    when the data is requested for the first time (x, y, get_data, evaluate
+    or any other attribute of the resulting relation).
+
+    All relations of the expression are equalized once on the common x-axis,
+    after that the expression is calculated by numpy ufuncs reusing
+    the intermediate arrays.
+
+    The result is an instance of the type of the first relation of the
+    expression. Unlike the operations of the Signal and Spectrum classes,
+    the relations of the expression are not converted into each other,
+    they must be of the same kind (all signals or all spectra).
+    """
+
+    def __init__(
+        self,
+        operation: Optional[MathOperation],
+        left: Operand,
+        right: Optional[Operand] = None,
+    ) -> None:
+        self._operation = operation
+        self._left = left
+        self._right = right
+        self._result: Optional["Relation"] = None
+
+    def _get_relations(self) -> List["Relation"]:
+        relations: Dict[int, "Relation"] = {}
+        stack: List[Operand] = [self]
+        while stack:
+            operand = stack.pop()
+            if isinstance(operand, RelationExpression):
+                if operand._operation is None:
+                    relations.setdefault(id(operand._left), operand._left)
+                else:
+                    stack.extend((operand._right, operand._left))
+        return list(relations.values())
+
+    def _calculate(
+        self, data: Dict[int, np.ndarray], buffers: set
+    ) -> Union[np.ndarray, Num]:
+        if self._operation is None:
+            return data[id(self._left)]
+
+        left, right = (
+            k._calculate(data, buffers) if isinstance(k, RelationExpression) else k
+            for k in (self._left, self._right)
+        )
+        out = None
+        for k in (left, right):
+            if id(k) in buffers:
+                out = k
+                break
+
+        result = apply_math_operation(left, right, self._operation, out)
+        buffers.discard(id(left))
+        buffers.discard(id(right))
+        buffers.add(id(result))
+        return result
+
+    def evaluate(self) -> "Relation":
+        """Calculate the expression and return the resulting relation."""
+        if self._result is not None:
+            return self._result
+
+        relations = self._get_relations()
+        first = relations[0]
+
+        grid = first
+        for relation in relations[1:]:
+            grid, _ = first.equalize(grid, relation)
+
+        data = {}
+        for relation in relations:
+            _, equalized = first.equalize(grid, relation)
+            data[id(relation)] = equalized.get_data(copy=False)[1]
+
+        y = self._calculate(data, set())
+        if not isinstance(y, np.ndarray):
+            y = np.full(len(grid), y)
+
+        self._result = type(first)(grid._get_axis(), y)
+        return self._result
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.evaluate().x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.evaluate().y
+
+    def get_data(self, copy: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate the expression and return the data of the result."""
+        return self.evaluate().get_data(copy)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.evaluate(), name)
+
+    def _build(self, other: Operand, operation: MathOperation) -> "RelationExpression":
+        if isinstance(other, RelationProtocol) and not isinstance(
+            other, RelationExpression
+        ):
+            other = RelationExpression(None, other)
+        elif not isinstance(other, (RelationExpression, float, int, complex)):
+            raise TypeFuncError(operation.value.strip("_"), type(self), type(other))
+        return RelationExpression(operation, self, other)
+
+    def __add__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.ADD)
+
+    def __radd__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.RADD)
+
+    def __sub__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.SUB)
+
+    def __rsub__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.RSUB)
+
+    def __mul__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.MUL)
+
+    def __rmul__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.RMUL)
+
+    def __truediv__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.TRUEDIV)
+
+    def __rtruediv__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.RTRUEDIV)
+
+    def __pow__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.POW)
+
+    def __rpow__(self, other: Operand) -> "RelationExpression":
+        return self._build(other, MathOperation.RPOW)
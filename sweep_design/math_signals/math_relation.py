@@ -1,5 +1,5 @@
 import logging
-from typing import Tuple, Type, TypeVar, Union
+from typing import Optional, Tuple, Type, TypeVar, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -11,13 +11,33 @@ from .defaults.base_structures import (
     NotEqualError,
     RelationProtocol,
     TypeFuncError,
+    UniformAxis,
 )
+from .math_expression import RelationExpression
 
 Num = Union[float, int, complex]
 R = TypeVar("R", bound="Relation")
 R2 = TypeVar("R2", bound="Relation")
 
 
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Return a view of the array that can not be changed."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def get_dx(x: np.ndarray) -> float:
+    """The sample rate of x (the most frequent step, rounded as `Relation.dx`)."""
+    diff_x = np.diff(x)
+    values, counts = np.unique(diff_x, return_counts=True)
+
+    num = values[np.argmax(counts)]
+    if num < 1:
+        return 1 / round(1 / num)
+    return round(num)
+
+
 class Relation:
     """A representation of dependency y from x (y = f(x))
 
@@ -27,9 +47,10 @@ class Relation:
     sequence.
 
     **Properties**:
-    > **x**: `Union[RelationProtocol, NDArray]`
+    > **x**: `Union[RelationProtocol, NDArray, UniformAxis]`
     The Relation class, or a class derived from the Relation class, or
-    an array_like object containing numbers(real or complex).
+    an array_like object containing numbers(real or complex), or
+    an instance of `UniformAxis`.
 
     > **y**: `NDArray` = None.
     None or array_like object containing real or complex numbers.
@@ -39,12 +60,27 @@ class Relation:
 
     For the instance of `Relation` class, define the basic mathematical operstions:
     *additon (+), subtraction(-), multiplication('*'), devision(/),
-    expopnentiation ('*''*') and their unary representation (+=, -=, *=, /=).
+    expopnentiation ('*''*') and their unary representation (+=, -=, *=, /=, **=).
     The result of the operation is a new instance of the Relation class.
+    The unary operations change the data of the instance itself, the array
+    is reused if the x-axis of the instance is not changed.
 
     Determined correlation and convolution between two instances
     (methods: correlate and convolve).
 
+    The method lazy returns an instance of `RelationExpression`, which
+    calculates a chain of the mathematical operations at once, when the data
+    of the result is requested.
+
+    If x is an instance of `UniformAxis` (start, step, size), then the x-axis
+    is not stored as an array, it is calculated when it is requested.
+    The sample rate, shift, selection and indexing do not need the array,
+    and the results of these operations keep the compact representation.
+
+    The properties x, y and the method get_data return copies of the data.
+    get_data(copy=False) returns read-only views without copying, the same
+    views are used by the operations of the class.
+
     How those operations will be calculated determined by the methods described
     in the Config class. Methods can be overridden if necessary
     (sweep_design.math_signals.config).
@@ -66,14 +102,23 @@ class Relation:
     ) -> None:
 
         self._math_operation = Config.math_operation
+        self._inplace_math_operation = Config.inplace_math_operation
         self._interpolate_extrapolate_method = Config.interpolate_extrapolate_method
         self._integrate_one_method = Config.integrate_one_method
         self._integrate_method = Config.integrate_method
         self._differentiate_method = Config.differentiate_method
 
         self._dx = dx
+        self._axis: Optional[UniformAxis] = None
+        self._x_array: Optional[np.ndarray] = None
 
-        if isinstance(x, RelationProtocol):
+        if isinstance(x, Relation) and x._axis is not None:
+            self._axis, self._y = x._axis, x._y.copy()
+            if self._dx is None:
+                self._dx = x._axis.step
+            if y is not None:
+                logging.warning(f'x is instance of {type(x)}, "y" was ignored')
+        elif isinstance(x, RelationProtocol):
             self._x, self._y = x.get_data()
             if y is not None:
                 logging.warning(f'x is instance of {type(x)}, "y" was ignored')
@@ -81,6 +126,16 @@ class Relation:
             if y is None:
                 raise BadInputError("y absent. Not enough data!")
 
+            if isinstance(x, UniformAxis):
+                if Config.CONVERT2ARRAY:
+                    y = np.array(y)
+                if x.size != y.size:
+                    raise NotEqualError(x.size, y.size)
+                if self._dx is None:
+                    self._dx = x.step
+                self._axis, self._y = x, y
+                return
+
             if Config.CONVERT2ARRAY:
                 x, y = np.array(x), np.array(y)
 
@@ -89,22 +144,33 @@ class Relation:
 
             self._x, self._y = x, y
 
+    @property
+    def _x(self) -> np.ndarray:
+        if self._axis is not None:
+            return self._axis.get_array()
+        return self._x_array
+
+    @_x.setter
+    def _x(self, value: np.ndarray) -> None:
+        self._axis = None
+        self._x_array = value
+
+    def _get_axis(self) -> Union[UniformAxis, np.ndarray]:
+        """Return the compact x-axis if it is uniform, otherwise the array."""
+        if self._axis is not None:
+            return self._axis
+        return self._x_array
+
     @property
     def x(self) -> np.ndarray:
-        return self._x.copy()
+        if self._axis is not None:
+            return self._axis.get_array()
+        return self._x_array.copy()
 
     @property
     def dx(self) -> float:
-        if self._dx is not None:
-            return self._dx
-        diff_x = np.diff(self._x)
-        values, counts = np.unique(diff_x, return_counts=True)
-
-        num = values[np.argmax(counts)]
-        if num < 1:
-            self._dx = 1 / round(1 / num)
-        else:
-            self._dx = round(num)
+        if self._dx is None:
+            self._dx = get_dx(self._x)
         return self._dx
 
     @dx.setter
@@ -115,9 +181,31 @@ class Relation:
     def y(self) -> np.ndarray:
         return self._y.copy()
 
-    def get_data(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Return the data of the called object."""
-        return self._x.copy(), self._y.copy()
+    def get_data(self, copy: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the data of the called object.
+
+        If copy is False, read-only views of the data are returned instead
+        of copies. The views are valid as long as the data of the instance
+        is not changed.
+        """
+        if copy:
+            return self.x, self._y.copy()
+        return _read_only(self._x), _read_only(self._y)
+
+    def lazy(self) -> RelationExpression:
+        """Start the deferred calculation of an expression.
+
+        The mathematical operations with the returned object are calculated
+        together when the data of the result is requested.
+        For example: `((a.lazy() + b) * c / d).evaluate()`.
+        """
+        return RelationExpression(None, self)
+
+    def _reset_cache(self) -> None:
+        """Drop the values calculated from the data of the instance.
+
+        Must be called when the data of the instance has been changed.
+        """
 
     def max(self) -> Num:
         return self._y.max()
@@ -136,7 +224,18 @@ class Relation:
     def select_data(self: R, x_start: Num = None, x_end: Num = None, **kwargs) -> R:
         """Select data using x-axis."""
 
-        x, y = self.get_data()
+        if self._axis is not None:
+            if x_start is None:
+                x_start = self._axis.start
+            if x_end is None:
+                x_end = self._axis.get_value(self._axis.size - 1)
+            i_start, i_end = self._axis.select(x_start, x_end)
+            axis = UniformAxis(
+                self._axis.get_value(i_start), self._axis.step, i_end - i_start
+            )
+            return type(self)(axis, self._y[i_start:i_end], **kwargs)
+
+        x, y = self.get_data(copy=False)
 
         if x_start is None:
             x_start = x[0]
@@ -145,22 +244,24 @@ class Relation:
             x_end = x[-1]
 
         is_selected = np.logical_and(
-            np.greater_equal(self._x, x_start), np.less_equal(self._x, x_end)
+            np.greater_equal(x, x_start), np.less_equal(x, x_end)
         )
 
         return type(self)(x[is_selected], y[is_selected], **kwargs)
 
     def exp(self: R, **kwargs) -> R:
-        x, y = self.get_data()
+        if self._axis is not None:
+            return type(self)(self._axis, np.exp(self._y), **kwargs)
+        x, y = self.get_data(copy=False)
         return type(self)(x, np.exp(y), **kwargs)
 
     def diff(self: R, **kwargs) -> R:
-        x, y = self.get_data()
+        x, y = self.get_data(copy=False)
         result = self._differentiate_method(x, y, self.dx)
         return type(self)(*result, **kwargs)
 
     def integrate(self: R, **kwargs) -> R:
-        x, y = self.get_data()
+        x, y = self.get_data(copy=False)
         result = self._integrate_method(x, y, self.dx)
         return type(self)(*result, **kwargs)
 
@@ -169,18 +270,34 @@ class Relation:
         return type(self)(new_x, new_y, **kwargs)
 
     def shift(self: R, x_shift: Num = 0, **kwargs) -> R:
-        x, y = self.get_data()
+        if self._axis is not None:
+            axis = self._axis._replace(start=self._axis.start + x_shift)
+            return type(self)(axis, self._y, **kwargs)
+        x, y = self.get_data(copy=False)
         return type(self)(x + x_shift, y, **kwargs)
 
     @staticmethod
     def equalize(r1: R, r2: R2) -> Tuple[R, R2]:
-        x1, _ = r1.get_data()
-        x2, _ = r2.get_data()
-        comparation = x1 == x2
-        if isinstance(comparation, np.ndarray):
-            if all(comparation):
+        if r1._axis is not None and r2._axis is not None:
+            if r1._axis == r2._axis:
+                return r1, r2
+        else:
+            x1, x2 = r1._x, r2._x
+            if x1.size == x2.size and np.array_equal(x1, x2):
                 return r1, r2
-        x_new = Config.get_common_x(x1, x2, r1.dx, r2.dx)
+
+        aligned = Config.align_uniform_method(
+            r1._get_axis(), r1._y, r1.dx, r2._get_axis(), r2._y, r2.dx
+        )
+        if aligned is not None:
+            x_new, y1, y2 = aligned
+            if y1 is not r1._y:
+                r1 = type(r1)(x_new, y1)
+            if y2 is not r2._y:
+                r2 = type(r2)(x_new, y2)
+            return r1, r2
+
+        x_new = Config.get_common_x(r1._x, r2._x, r1.dx, r2.dx)
         r1 = r1.interpolate_extrapolate(x_new)
         r2 = r2.interpolate_extrapolate(x_new)
         return r1, r2
@@ -203,23 +320,68 @@ class Relation:
         else:
             raise TypeFuncError("Convolution", type(r1), type(r2))
 
+    def _keep_axis(
+        self, x: np.ndarray, new_x: np.ndarray, new_y: np.ndarray
+    ) -> Tuple[Union[UniformAxis, np.ndarray], np.ndarray]:
+        """Replace the resulting x-axis by the compact one if it was not changed."""
+        if self._axis is not None and new_x is x:
+            return self._axis, new_y
+        return new_x, new_y
+
+    @staticmethod
+    def _prepare_operand(b: Union["Relation", Num]) -> Union["Relation", Num]:
+        """Bring the relation-like operand to the Relation class."""
+        if isinstance(b, RelationExpression):
+            return b.evaluate()
+        if isinstance(b, RelationProtocol) and not isinstance(b, Relation):
+            return Relation(b)
+        return b
+
     @staticmethod
     def _operation(
         a: "Relation", b: Union["Relation", Num], name_operation: MathOperation
-    ) -> Tuple[np.ndarray, np.ndarray]:
+    ) -> Tuple[Union[UniformAxis, np.ndarray], np.ndarray]:
         logging.debug(f"Type of a: {type(a)}")
         logging.debug(f"Type of b: {type(b)}")
+        b = Relation._prepare_operand(b)
         if isinstance(b, RelationProtocol):
             r1, r2 = Relation.equalize(a, b)
-            x, y1 = r1.get_data()
-            _, y2 = r2.get_data()
-            return a._math_operation(x, y1, y2, name_operation)
+            x, y1 = r1.get_data(copy=False)
+            _, y2 = r2.get_data(copy=False)
+            result = a._math_operation(x, y1, y2, name_operation)
+            return r1._keep_axis(x, *result)
         elif isinstance(b, (float, int, complex)):
-            x, y = a.get_data()
-            return a._math_operation(x, y, b, name_operation)
+            x, y = a.get_data(copy=False)
+            result = a._math_operation(x, y, b, name_operation)
+            return a._keep_axis(x, *result)
         else:
             raise TypeFuncError(name_operation.value.strip("_"), type(a), type(b))
 
+    def _inplace_operation(
+        self: R, other: Union["Relation", Num], name_operation: MathOperation
+    ) -> R:
+        """Change the data of the instance by the operation.
+
+        The array of the instance is reused if the x-axis of the instance
+        is not changed by the equalization.
+        """
+        other = self._prepare_operand(other)
+        if isinstance(other, RelationProtocol):
+            r1, r2 = Relation.equalize(self, other)
+            if r1 is not self:
+                self._axis, self._x_array = r1._axis, r1._x_array
+                self._dx, self._y = r1._dx, r1._y
+            _, y2 = r2.get_data(copy=False)
+        elif isinstance(other, (float, int, complex)):
+            y2 = other
+        else:
+            raise TypeFuncError(
+                name_operation.value.strip("_"), type(self), type(other)
+            )
+        self._y = self._inplace_math_operation(self._y, y2, name_operation)
+        self._reset_cache()
+        return self
+
     def __add__(self: R, other: Union["Relation", Num], **kwargs) -> R:
         return type(self)(*self._operation(self, other, MathOperation.ADD), **kwargs)
 
@@ -254,26 +416,29 @@ class Relation:
     def __rpow__(self: R, other: Union["Relation", Num], **kwargs) -> R:
         return type(self)(*self._operation(self, other, MathOperation.RPOW), **kwargs)
 
-    def __iadd__(self: R, other: Union["Relation", Num], **kwargs) -> R:
-        return self.__add__(other, **kwargs)
+    def __iadd__(self: R, other: Union["Relation", Num]) -> R:
+        return self._inplace_operation(other, MathOperation.ADD)
 
-    def __isub__(self: R, other: Union["Relation", Num], **kwargs) -> R:
-        return self.__sub__(other, **kwargs)
+    def __isub__(self: R, other: Union["Relation", Num]) -> R:
+        return self._inplace_operation(other, MathOperation.SUB)
 
-    def __imul__(self: R, other: Union["Relation", Num], **kwargs) -> R:
-        return self.__mul__(other, **kwargs)
+    def __imul__(self: R, other: Union["Relation", Num]) -> R:
+        return self._inplace_operation(other, MathOperation.MUL)
 
-    def __idiv__(self: R, other: Union["Relation", Num], **kwargs) -> R:
-        return self.__truediv__(other, **kwargs)
+    def __itruediv__(self: R, other: Union["Relation", Num]) -> R:
+        return self._inplace_operation(other, MathOperation.TRUEDIV)
 
-    def __ipow__(self: R, other: Union["Relation", Num], **kwargs) -> R:
-        return self.__pow__(other, **kwargs)
+    def __ipow__(self: R, other: Union["Relation", Num]) -> R:
+        return self._inplace_operation(other, MathOperation.POW)
 
     def __len__(self) -> int:
-        return self._x.size
+        return self._y.size
 
     def __getitem__(self, item: Union[float, slice]):
         if isinstance(item, float):
+            if self._axis is not None:
+                idx = self._axis.get_nearest(item)
+                return self._axis.get_value(idx), self._y[idx]
             idx = (np.abs(self._x - item)).argmin()
             return self._x[idx], self._y[idx]
         if isinstance(item, slice):
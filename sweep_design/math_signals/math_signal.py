@@ -4,7 +4,9 @@ import numpy as np
 from numpy.typing import NDArray
 
 from ..config import Config
+from .math_expression import RelationExpression
 from .math_relation import Relation
+from .result_cache import call_cached
 from .defaults.base_structures import ConvertingError
 
 
@@ -18,6 +20,8 @@ SSPRN = Union["Spectrum", "Signal", "Relation", Num]
 
 
 def _input2spectrum_operation(inp: SSPRN) -> Union["Relation", "Spectrum", Num]:
+    if isinstance(inp, RelationExpression):
+        inp = inp.evaluate()
     if isinstance(inp, Signal):
         return inp.get_spectrum()
     elif isinstance(inp, (Spectrum, Relation, int, float, complex)):
@@ -78,6 +82,10 @@ class Spectrum(Relation):
         self._spectrum2signal_method_default = Config.spectrum2signal_method
         self.signal: Optional[Signal] = None
 
+    def _reset_cache(self) -> None:
+        super()._reset_cache()
+        self.signal = None
+
     @property
     def frequency(self):
         return self.x
@@ -98,8 +106,8 @@ class Spectrum(Relation):
         """Compute the signal from the spectrum."""
 
         if self.signal is None or recalculate:
-            time, amplitude = self._spectrum2signal_method_default(
-                self._x, self._y, start_time
+            time, amplitude = call_cached(
+                self._spectrum2signal_method_default, self._x, self._y, start_time
             )
             self.signal = Signal(time, amplitude)
         return self.signal
@@ -110,12 +118,12 @@ class Spectrum(Relation):
         Calculate the relationship between the frequency and the absolute
         value of the spectrum amplitude."""
 
-        x, y = self.get_data()
+        x, y = self.get_data(copy=False)
         return Relation(x, np.abs(y))
 
     def get_phase_spectrum(self: R, **kwargs) -> "Relation":
         """Calculate the relationship between frequency and phase of the spectrum."""
-        x, y = self.get_data()
+        x, y = self.get_data(copy=False)
         return Relation(x, np.unwrap(np.angle(y)))
 
     def get_reverse_filter(
@@ -217,8 +225,30 @@ class Spectrum(Relation):
         r_a = _input2spectrum_operation(a)
         return super().__pow__(r_a, **kwargs)
 
+    def __iadd__(self: SP, a: SSPRN) -> SP:
+        r_a = _input2spectrum_operation(a)
+        return super().__iadd__(r_a)
+
+    def __isub__(self: SP, a: SSPRN) -> SP:
+        r_a = _input2spectrum_operation(a)
+        return super().__isub__(r_a)
+
+    def __imul__(self: SP, a: SSPRN) -> SP:
+        r_a = _input2spectrum_operation(a)
+        return super().__imul__(r_a)
+
+    def __itruediv__(self: SP, a: SSPRN) -> SP:
+        r_a = _input2spectrum_operation(a)
+        return super().__itruediv__(r_a)
+
+    def __ipow__(self: SP, a: SSPRN) -> SP:
+        r_a = _input2spectrum_operation(a)
+        return super().__ipow__(r_a)
+
 
 def _inp2signal_operation(inp: SSPRN) -> Union["Relation", "Signal", Num]:
+    if isinstance(inp, RelationExpression):
+        inp = inp.evaluate()
     if isinstance(inp, Spectrum):
         return inp.get_signal()
     elif isinstance(inp, (Signal, Relation, int, complex, float)):
@@ -279,10 +309,18 @@ class Signal(Relation):
         super().__init__(time, amplitude, dt)
         self._spectrum: Optional[Spectrum] = None
 
+    def _reset_cache(self) -> None:
+        super()._reset_cache()
+        self._spectrum = None
+
     def get_spectrum(self, recalculate=False, is_start_zero=False) -> "Spectrum":
 
         if self._spectrum is None or recalculate:
-            f, a = self._signal2spectrum_method_default(*self.get_data(), is_start_zero)
+            f, a = call_cached(
+                self._signal2spectrum_method_default,
+                *self.get_data(copy=False),
+                is_start_zero,
+            )
             self._spectrum = Spectrum(f, a)
 
         return self._spectrum
@@ -378,3 +416,23 @@ class Signal(Relation):
     def __pow__(self: S, a: SSPRN, **kwargs) -> S:
         s_a = _inp2signal_operation(a)
         return super().__pow__(s_a, **kwargs)
+
+    def __iadd__(self: S, a: SSPRN) -> S:
+        s_a = _inp2signal_operation(a)
+        return super().__iadd__(s_a)
+
+    def __isub__(self: S, a: SSPRN) -> S:
+        s_a = _inp2signal_operation(a)
+        return super().__isub__(s_a)
+
+    def __imul__(self: S, a: SSPRN) -> S:
+        s_a = _inp2signal_operation(a)
+        return super().__imul__(s_a)
+
+    def __itruediv__(self: S, a: SSPRN) -> S:
+        s_a = _inp2signal_operation(a)
+        return super().__itruediv__(s_a)
+
+    def __ipow__(self: S, a: SSPRN) -> S:
+        s_a = _inp2signal_operation(a)
+        return super().__ipow__(s_a)
@@ -1,13 +1,30 @@
-from typing import Any, Union
+import inspect
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 from numpy.typing import NDArray
+from ..config import Config
 from ..config.sweep_config import SweepConfig
 
 from .math_relation import Relation
 from .math_signal import Signal
+from .result_cache import call_cached
 
-from .defaults.base_structures import Spectrogram
+from .defaults.base_structures import NotEqualError, Spectrogram
+
+
+@lru_cache(maxsize=None)
+def _accepts_analytical_signal(method: Callable[..., Any]) -> bool:
+    """Whether the method has the analytical_signal parameter."""
+    try:
+        parameters = inspect.signature(method).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        k.name == "analytical_signal" or k.kind == inspect.Parameter.VAR_KEYWORD
+        for k in parameters
+    )
 
 
 class Sweep(Signal):
@@ -19,13 +36,18 @@ class Sweep(Signal):
     For analysis, you can use not only the sweep signal, but also other
     signals for which the spectrogram needs to be considered.
 
-    When creating an instance of the class, the spectrogram is calculated.
-    The method used to calculate the spectrogram is defined in the
-    `SweepConfig` class. You can override it with your own.
+    The spectrogram is calculated on the first access to the `spectrogram`
+    property and stored in the instance. The method used to calculate the
+    spectrogram is defined in the `SweepConfig` class. You can override it
+    with your own.
 
     If the frequency vs. time and amplitude vs. time functions have not
-    been passed, they are also calculated, the `get_frequency_time`,
-    `get_amplitude_time` methods defined in the `SweepConfig` class are used.
+    been passed, they are also calculated on the first access, the `get_f_t`,
+    `get_a_t` methods defined in the `SweepConfig` class are used. Both of
+    them are calculated from the one analytic signal (`get_analytic_signal`).
+
+    The number of calculated transforms is stored in the
+    `Sweep.calculation_counter` class attribute.
 
     Perform the same operations as for the inherited class.
 
@@ -50,6 +72,14 @@ class Sweep(Signal):
 
     """
 
+    # Number of transforms calculated by all instances of the class.
+    calculation_counter: Dict[str, int] = {
+        "spectrogram": 0,
+        "analytic_signal": 0,
+        "frequency_time": 0,
+        "amplitude_time": 0,
+    }
+
     def __init__(
         self,
         time: Union[Relation, NDArray],
@@ -61,21 +91,228 @@ class Sweep(Signal):
 
         super().__init__(time, amplitude)
 
-        self.frequency_time = (
+        self._spectrogram_method_default = SweepConfig.spectrogram_method
+        self._analytic_signal_method_default = SweepConfig.analytic_signal_method
+        self._get_f_t_method_default = SweepConfig.get_f_t
+        self._get_a_t_method_default = SweepConfig.get_a_t
+
+        self._frequency_time = frequency_time
+        self._amplitude_time = amplitude_time
+        self._is_calculated_f_t = frequency_time is None
+        self._is_calculated_a_t = amplitude_time is None
+        self._spectrogram: Optional[Spectrogram] = None
+        self._analytic_signal: Optional[np.ndarray] = None
+
+        self.aprior_signal = aprior_signal
+
+    @classmethod
+    def reset_calculation_counter(cls) -> None:
+        """Set to zero the number of calculated transforms."""
+        for key in cls.calculation_counter:
+            cls.calculation_counter[key] = 0
+
+    def _get_analytic_signal(self) -> np.ndarray:
+        if self._analytic_signal is None:
+            self._analytic_signal = call_cached(
+                self._analytic_signal_method_default, self._x, self._y
+            )
+            Sweep.calculation_counter["analytic_signal"] += 1
+        return self._analytic_signal
+
+    def get_analytic_signal(self) -> Signal:
+        """Get the analytic signal of the sweep.
+
+        The analytic signal is calculated once and used to calculate
+        the frequency versus time and the amplitude envelope.
+        """
+        return Signal(self._x, self._get_analytic_signal())
+
+    def _call_ftat_method(self, method: Callable[..., Relation]) -> Relation:
+        """Call the get_f_t or get_a_t method of the `SweepConfig`.
+
+        The analytic signal is shared only with the methods which accept it,
+        the methods of (time, amplitude) calculate it themselves.
+        """
+        if _accepts_analytical_signal(method):
+            return method(
+                self._x, self._y, analytical_signal=self._get_analytic_signal()
+            )
+        return method(self._x, self._y)
+
+    @property
+    def frequency_time(self) -> Relation:
+        """Frequency versus time, calculated on the first access."""
+        if self._frequency_time is None:
+            self._frequency_time = self._call_ftat_method(
+                self._get_f_t_method_default
+            )
+            Sweep.calculation_counter["frequency_time"] += 1
+        return self._frequency_time
+
+    @frequency_time.setter
+    def frequency_time(self, value: Relation) -> None:
+        self._frequency_time = value
+        self._is_calculated_f_t = value is None
+
+    @property
+    def amplitude_time(self) -> Relation:
+        """Amplitude envelope versus time, calculated on the first access."""
+        if self._amplitude_time is None:
+            self._amplitude_time = self._call_ftat_method(
+                self._get_a_t_method_default
+            )
+            Sweep.calculation_counter["amplitude_time"] += 1
+        return self._amplitude_time
+
+    @amplitude_time.setter
+    def amplitude_time(self, value: Relation) -> None:
+        self._amplitude_time = value
+        self._is_calculated_a_t = value is None
+
+    @property
+    def spectrogram(self) -> Spectrogram:
+        """Spectrogram of the sweep, calculated on the first access."""
+        if self._spectrogram is None:
+            spectrogram = call_cached(
+                self._spectrogram_method_default, self._x, self._y, self.dx
+            )
+            self._spectrogram = Spectrogram(
+                time=spectrogram[0],
+                frequency=spectrogram[1],
+                spectrogram_matrix=spectrogram[2],
+            )
+            Sweep.calculation_counter["spectrogram"] += 1
+        return self._spectrogram
+
+    @spectrogram.setter
+    def spectrogram(self, value: Spectrogram) -> None:
+        self._spectrogram = value
+
+    def _reset_cache(self) -> None:
+        super()._reset_cache()
+        self._spectrogram = None
+        self._analytic_signal = None
+        if self._is_calculated_f_t:
+            self._frequency_time = None
+        if self._is_calculated_a_t:
+            self._amplitude_time = None
+
+
+class SweepBatch:
+    """Class `SweepBatch`.
+
+    A collection of sweep signals sharing one time axis. The amplitudes
+    are stored as one 2-D array (one row per sweep), instances of the
+    `Sweep` class are created only when they are requested by index
+    or by iteration.
+
+    **Properties**:
+    > **time**: `NDArray`
+    An array_like object containing the time axis of all sweep signals.
+
+    > **amplitudes**: `NDArray`
+    2-D array_like object, each row is the amplitude of one sweep signal.
+
+    > **frequency_time**: `NDArray` = `None`
+    `None` or 2-D array_like object, each row is the frequency versus time
+    of one sweep signal.
+
+    > **amplitude_time**: `NDArray` = `None`
+    `None` or 2-D array_like object, each row is the amplitude envelope
+    of one sweep signal.
+
+    > **aprior_signal**: `Signal` = `None`
+    The signal used to create the sweep signals.
+
+    """
+
+    def __init__(
+        self,
+        time: NDArray,
+        amplitudes: NDArray,
+        frequency_time: NDArray = None,
+        amplitude_time: NDArray = None,
+        aprior_signal: Signal = None,
+    ) -> None:
+
+        self._time = np.asarray(time)
+        self._amplitudes = np.atleast_2d(amplitudes)
+
+        if self._amplitudes.shape[-1] != self._time.size:
+            raise NotEqualError(self._time.size, self._amplitudes.shape[-1])
+
+        self._frequency_time = (
             frequency_time
-            if frequency_time is not None
-            else SweepConfig.get_f_t(self.x, self.y)
+            if frequency_time is None
+            else np.broadcast_to(frequency_time, self._amplitudes.shape)
         )
-        self.amplitude_time = (
+        self._amplitude_time = (
             amplitude_time
-            if amplitude_time is not None
-            else SweepConfig.get_a_t(self.x, self.y)
+            if amplitude_time is None
+            else np.broadcast_to(amplitude_time, self._amplitudes.shape)
         )
+        self.aprior_signal = aprior_signal
+        self._sweeps: List[Optional[Sweep]] = [None] * len(self._amplitudes)
 
-        spectrogram = SweepConfig.spectrogram_method(self.x, self.y, self.dx)
-        self.spectrogram = Spectrogram(
-            time=spectrogram[0],
-            frequency=spectrogram[1],
-            spectrogram_matrix=spectrogram[2],
+    @property
+    def time(self) -> np.ndarray:
+        return self._time.copy()
+
+    @property
+    def amplitudes(self) -> np.ndarray:
+        return self._amplitudes.copy()
+
+    @property
+    def frequency_time(self) -> Optional[np.ndarray]:
+        if self._frequency_time is None:
+            return None
+        return self._frequency_time.copy()
+
+    @property
+    def amplitude_time(self) -> Optional[np.ndarray]:
+        if self._amplitude_time is None:
+            return None
+        return self._amplitude_time.copy()
+
+    def get_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the time axis and the 2-D array of amplitudes."""
+        return self._time.copy(), self._amplitudes.copy()
+
+    def get_norm(self) -> np.ndarray:
+        """Get rates of the sweep signals.
+
+        Calculated in terms of signal energy, one value for each row.
+        """
+        dt = self._time[1] - self._time[0]
+        return Config.integrate_one_method(self._amplitudes**2, self._time) / dt
+
+    def _make_sweep(self, index: int) -> Sweep:
+        frequency_time = (
+            None
+            if self._frequency_time is None
+            else Relation(self._time, self._frequency_time[index])
         )
-        self.aprior_signal = aprior_signal
+        amplitude_time = (
+            None
+            if self._amplitude_time is None
+            else Relation(self._time, self._amplitude_time[index])
+        )
+        return Sweep(
+            self._time,
+            self._amplitudes[index],
+            frequency_time=frequency_time,
+            amplitude_time=amplitude_time,
+            aprior_signal=self.aprior_signal,
+        )
+
+    def __len__(self) -> int:
+        return len(self._amplitudes)
+
+    def __getitem__(self, index: int) -> Sweep:
+        index = range(len(self))[index]
+        if self._sweeps[index] is None:
+            self._sweeps[index] = self._make_sweep(index)
+        return self._sweeps[index]
+
+    def __iter__(self) -> Iterator[Sweep]:
+        return (self[k] for k in range(len(self)))
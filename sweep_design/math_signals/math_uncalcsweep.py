@@ -1,22 +1,35 @@
 import logging
 from math import sqrt
-from typing import Any, Callable, Tuple, Union
+from typing import Any, Callable, Optional, Tuple, Union
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
+from ..config import Config
 from ..config.sweep_config import SweepConfig
 
 from .defaults import sweep_methods as dfsm
 from .defaults.base_structures import BadInputError
 from .defaults.sweep_methods import Ftatr
-from .math_relation import Relation
+from .math_relation import Relation, get_dx
 from .math_signal import Spectrum
-from .math_sweep import Sweep
+from .math_sweep import Sweep, SweepBatch
 
 CallFtatMethod = Callable[[Spectrum], Tuple[np.ndarray, np.ndarray, np.ndarray]]
 
 
+def get_array_tht(time: np.ndarray, frequency_time: np.ndarray) -> np.ndarray:
+    """Calculate the angular sweep (phase without zero phase) from the frequency.
+
+    The frequency is sampled at the time, it can be a 2-D array (one sweep
+    in each row), then it is integrated along the last axis. The integration
+    is performed by `Config.integrate_method`.
+    """
+    _, tht = Config.integrate_method(time, frequency_time, get_dx(time))
+    zero = np.zeros(tht.shape[:-1] + (1,))
+    return np.concatenate((zero, 2 * np.pi * tht), axis=-1)
+
+
 class UncalculatedSweep:
     """The `UncalculatedSweep` class prepares for the calculation of the signal sweep (`Sweep`).
 
@@ -103,6 +116,57 @@ class UncalculatedSweep:
             "".format(self._frequency_time, self._amplitude_time, time)
         )
 
+        calc_time = self._get_calc_time(time)
+        sweep = self._amplitude_time(calc_time) * np.sin(
+            self._get_tht(calc_time) + tht0
+        )
+
+        amplitude_time = Relation(calc_time, self._amplitude_time(calc_time))
+        frequency_time = Relation(calc_time, self._frequency_time(calc_time))
+
+        return Sweep(
+            time=calc_time,
+            amplitude=sweep,
+            frequency_time=frequency_time,
+            amplitude_time=amplitude_time,
+        )
+
+    def get_phase_rotated_sweeps(
+        self, tht0: ArrayLike, time: NDArray = None
+    ) -> SweepBatch:
+        """Calculate several sweep signals that differ only in zero phase.
+
+        Properties:
+
+        > **tht0**: `ArrayLike`
+        The sequence of zero phases, one sweep signal for each of them.
+
+        > **time**: `NDArray` = `None`
+        The number sequence determines the time.
+
+        Return
+        > `SweepBatch`
+        The sweep signals stored as one 2-D array (one row per zero phase).
+
+        The phase of the sweep signal is calculated once for all zero phases.
+        """
+        calc_time = self._get_calc_time(time)
+        tht0 = np.ravel(tht0)
+
+        amplitude_time = self._amplitude_time(calc_time)
+        frequency_time = self._frequency_time(calc_time)
+        sweeps = amplitude_time * np.sin(
+            self._get_tht(calc_time) + tht0[:, np.newaxis]
+        )
+
+        return SweepBatch(
+            calc_time,
+            sweeps,
+            frequency_time=frequency_time,
+            amplitude_time=amplitude_time,
+        )
+
+    def _get_calc_time(self, time: Optional[NDArray]) -> np.ndarray:
         if time is None and self._time is None:
             raise BadInputError("Not enough data: time")
 
@@ -110,23 +174,15 @@ class UncalculatedSweep:
             calc_time = self._time
         elif time is not None:
             calc_time = time
+        return calc_time
 
+    def _get_tht(self, calc_time: np.ndarray) -> np.ndarray:
+        """Calculate the angular sweep (phase without zero phase)."""
         if self._frequency_time.__name__ == "interpolate_time":
             tht = self._array_tht(self._frequency_time(calc_time))
         else:
             tht = self._func_tht(self._frequency_time)
-
-        sweep = self._amplitude_time(calc_time) * np.sin(tht(calc_time) + tht0)
-
-        amplitude_time = Relation(calc_time, self._amplitude_time(calc_time))
-        frequency_time = Relation(calc_time, self._frequency_time(calc_time))
-
-        return Sweep(
-            time=calc_time,
-            amplitude=sweep,
-            frequency_time=frequency_time,
-            amplitude_time=amplitude_time,
-        )
+        return tht(calc_time)
 
     def _func_tht(
         self, frequency_time: Callable[[np.ndarray], np.ndarray]
@@ -144,8 +200,7 @@ class UncalculatedSweep:
         """Angular sweep represented by a numerical sequence."""
 
         def result(time: np.ndarray) -> np.ndarray:
-            frequency_time_relation = Relation(time, frequency_time)
-            return np.append([0.0], 2 * np.pi * frequency_time_relation.integrate().y)
+            return get_array_tht(time, frequency_time)
 
         return result
 
@@ -200,3 +255,26 @@ class ApriorUncalculatedSweep(UncalculatedSweep):
 
         sweep.aprior_signal = self._aprior_signal
         return sweep
+
+    def get_phase_rotated_sweeps(
+        self, tht0: ArrayLike, time: Any = None, is_normolize=True
+    ) -> SweepBatch:
+        """Calculate the sweeps for several zero phases and normolise them."""
+        sweeps = super().get_phase_rotated_sweeps(tht0=tht0, time=time)
+        calc_time, amplitudes = sweeps.get_data()
+        amplitude_time = sweeps.amplitude_time
+
+        if is_normolize:
+            norm_sweeps = sweeps.get_norm()
+            norm_aprior = self._aprior_signal.get_norm()
+            norm = np.sqrt(norm_aprior) / np.sqrt(norm_sweeps)
+            amplitudes *= norm[:, np.newaxis]
+            amplitude_time = amplitude_time * norm[:, np.newaxis]
+
+        return SweepBatch(
+            calc_time,
+            amplitudes,
+            frequency_time=sweeps.frequency_time,
+            amplitude_time=amplitude_time,
+            aprior_signal=self._aprior_signal,
+        )
@@ -2,7 +2,14 @@
 
 from .dwell_sweep import get_dwell_sweep as get_dwell_sweep
 from .linear_sweep import get_linear_sweep as get_linear_sweep
+from .linear_sweep import get_linear_sweeps as get_linear_sweeps
 from .pseudorandom_shuffle import get_shuffle as get_shuffle
 from .code_zinger import get_code_zinger as get_code_zinger
 from .m_sequence import get_m_sequence as get_m_sequence
 from .m_sequence import get_pure_m_sequence as get_pure_m_sequence
+from .m_sequence import get_m_sequences as get_m_sequences
+from .pseudorandom_shuffle import get_shuffle_segments as get_shuffle_segments
+from .pseudorandom_shuffle import (
+    get_shuffle_frequency_time as get_shuffle_frequency_time,
+)
+from .pseudorandom_shuffle import get_best_shuffles as get_best_shuffles
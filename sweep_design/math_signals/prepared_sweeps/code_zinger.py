@@ -1,24 +1,41 @@
 from typing import List
+
+import numpy as np
+
+from ..defaults.base_structures import UniformAxis
 from ..math_relation import Relation
 
 
 def get_code_zinger(
     segment_sweep: Relation, code_zinger: List[int] = [-1, -1, -1, 1], periods=1
 ):
-    """Repeat the transmitted signal according to the Zniger code for n periods (n times)."""
-
-    new_sweep = segment_sweep * code_zinger[0]
+    """Repeat the transmitted signal according to the Zniger code for n periods (n times).
 
-    for cnt, v in enumerate(code_zinger[1:], 1):
-        new_sweep = new_sweep + v * segment_sweep.shift(
-            cnt * segment_sweep.x[-1] + cnt * segment_sweep.dx
-        )
+    The segment multiplied by each element of the code is placed right after
+    the previous one, the periods follow each other in the same way.
+    The result is allocated once and every signed segment is written to its
+    place, so the building time is linear in the length of the code
+    and the number of periods.
+    """
+    x, y = segment_sweep.get_data(copy=False)
+    dx = segment_sweep.dx
+    code = np.tile(np.asarray(code_zinger), periods)
 
-    new_sweep_period = new_sweep
+    step = int(round((x[-1] + dx) / dx))
+    size = (code.size - 1) * step + y.size
+    dtype = np.result_type(y, code)
 
-    for period in range(periods - 1):
-        new_sweep_period += new_sweep.shift(
-            (period + 1) * new_sweep_period.x[-1] + (period + 1) * new_sweep_period.dx
-        )
+    if step >= y.size:
+        result = np.zeros(code.size * step, dtype=dtype)
+        slots = result.reshape(code.size, step)[:, : y.size]
+        np.multiply(code[:, np.newaxis], y, out=slots)
+        result = result[:size]
+    else:
+        result = np.zeros(size, dtype=dtype)
+        for k, value in enumerate(code):
+            result[k * step : k * step + y.size] += value * y
 
-    return new_sweep_period
+    axis = UniformAxis(x[0], dx, size)
+    if not isinstance(segment_sweep, Relation):
+        axis = axis.get_array()
+    return type(segment_sweep)(axis, result)
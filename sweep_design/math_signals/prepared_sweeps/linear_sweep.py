@@ -1,7 +1,10 @@
+from typing import Union
+
 import numpy as np
+from numpy.typing import ArrayLike
 
-from ..math_uncalcsweep import UncalculatedSweep
-from ..math_sweep import Sweep
+from ..math_uncalcsweep import UncalculatedSweep, get_array_tht
+from ..math_sweep import Sweep, SweepBatch
 from ..utility_functions.tukey import tukey_a_t
 from ..utility_functions import f_t_linear_array
 
@@ -17,3 +20,37 @@ def get_linear_sweep(t: np.ndarray, f_start=1.0, f_end=100.0, t_tapper=1.0) -> S
 
     unsw = UncalculatedSweep(t, f_t, a_t)
     return unsw()
+
+
+def get_linear_sweeps(
+    t: np.ndarray,
+    f_start: Union[float, ArrayLike] = 1.0,
+    f_end: Union[float, ArrayLike] = 100.0,
+    t_tapper: Union[float, ArrayLike] = 1.0,
+    tht0: Union[float, ArrayLike] = 0.0,
+) -> SweepBatch:
+    """Create a batch of linear sweeps.
+
+    The parameters are broadcast against each other and flattened, every
+    combination gives one row of the result. All sweeps are calculated
+    at once, instances of `Sweep` are created only on request.
+
+    t_tapper in seconds is used to apply tukey function to a sweep signal.
+    tht0 is the initial phase of a sweep signal.
+    The phase is integrated by `Config.integrate_method` along the last
+    axis, as the phase of `get_linear_sweep`.
+    """
+    t = np.asarray(t)
+    f_start, f_end, t_tapper, tht0 = (
+        np.ravel(k) for k in np.broadcast_arrays(f_start, f_end, t_tapper, tht0)
+    )
+
+    f_t = f_t_linear_array(t, f_start[:, np.newaxis], f_end[:, np.newaxis])
+
+    tappers, tapper_index = np.unique(t_tapper, return_inverse=True)
+    a_t = np.array([tukey_a_t(t, k) for k in tappers])[tapper_index]
+
+    tht = get_array_tht(t, f_t)
+    sweeps = a_t * np.sin(tht + tht0[:, np.newaxis])
+
+    return SweepBatch(t, sweeps, frequency_time=f_t, amplitude_time=a_t)
@@ -1,11 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Optional
+
 import numpy as np
 from scipy.signal import butter, filtfilt, max_len_seq
 
+from ..defaults.base_structures import Seed
 from ..math_relation import Relation
 from ..math_signal import Signal
 from ..utility_functions import get_IMFs_ceemdan, tukey_a_t
 import math
-import random
 
 
 def filtering(seq: Signal, f: float, type_filter: str):
@@ -16,6 +20,21 @@ def filtering(seq: Signal, f: float, type_filter: str):
     return Signal(x, y2)
 
 
+def _get_start_state(nbits: int, rng: np.random.Generator) -> np.ndarray:
+    state = rng.integers(0, 2, nbits)
+    while not state.any():
+        state = rng.integers(0, 2, nbits)
+    return state
+
+
+def _spawn_seeds(seed: Seed, number: int) -> List[np.random.SeedSequence]:
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(seed.integers(2**63, size=4))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(number)
+
+
 def get_m_sequence(
     len_seq: float,
     dt: float,
@@ -26,10 +45,21 @@ def get_m_sequence(
     f_start=None,
     f_end=None,
     is_full=False,
-) -> np.ndarray:
+    seed: Seed = None,
+    parallel=False,
+    processes: Optional[int] = None,
+) -> Signal:
+    """Create the m-sequence prepared for the vibration source.
+
+    The start state of the LFSR and the noise of CEEMDAN are drawn from
+    the seed (int, SeedSequence or numpy.random.Generator), the same seed
+    gives the same m-sequence. The trials of CEEMDAN can be run on a pool
+    of processes (parallel, processes).
+    """
+    rng = np.random.default_rng(seed)
 
     start_len_seq = math.ceil(math.log((len_seq - 1), 2))
-    start_seq = np.array([random.randint(0, 1) for _ in range(start_len_seq)])
+    start_seq = _get_start_state(start_len_seq, rng)
 
     m_seq = max_len_seq(nbits=start_seq.size, state=start_seq)[0]
     t = np.linspace(0, dt * (m_seq.size - 1), m_seq.size)
@@ -43,9 +73,16 @@ def get_m_sequence(
 
     displacement = signal.integrate().integrate()
 
-    imfs = get_IMFs_ceemdan(displacement)
+    imfs = get_IMFs_ceemdan(
+        displacement,
+        parallel=parallel,
+        processes=processes,
+        seed=int(rng.integers(2**32)),
+    )
 
-    result_signal = sum(imfs[:-1])
+    result_signal = imfs[0]
+    for imf in imfs[1:-1]:
+        result_signal += imf
     y = result_signal.y * tukey_a_t(result_signal.x, t_tapper)
     result_signal = Signal(result_signal.x, y)
 
@@ -66,10 +103,46 @@ def get_m_sequence(
     return result_signal.select_data(x_end=(len_seq - 1) * dt)
 
 
-def get_pure_m_sequence(len_seq: float, dt: float) -> Relation:
+def get_m_sequences(
+    number: int,
+    len_seq: float,
+    dt: float,
+    seed: Seed = None,
+    processes: Optional[int] = None,
+    **kwargs,
+) -> List[Signal]:
+    """Create a batch of m-sequences prepared for the vibration source.
+
+    Each m-sequence is created by `get_m_sequence` with its own seed spawned
+    from the seed, so the batch is reproducible and does not depend on the
+    number of processes. The m-sequences are created concurrently on a pool
+    of processes (processes = None - the number of CPUs, processes = 1 -
+    in the calling process).
+
+    Parametrs:
+    > number: int - number of m-sequences.
+    > len_seq, dt - as in `get_m_sequence`.
+    > seed: None, int, SeedSequence or numpy.random.Generator - seed of the
+    batch.
+    > processes: Optional[int] = None - number of processes.
+    > kwargs - other parameters of `get_m_sequence`.
+    Returns:
+    > List[Signal] - m-sequences.
+    """
+    create = partial(get_m_sequence, len_seq, dt, **kwargs)
+    seeds = _spawn_seeds(seed, number)
+    if processes == 1 or number < 2:
+        return [create(seed=k) for k in seeds]
+
+    with ProcessPoolExecutor(processes) as executor:
+        futures = [executor.submit(create, seed=k) for k in seeds]
+        return [k.result() for k in futures]
+
+
+def get_pure_m_sequence(len_seq: float, dt: float, seed: Seed = None) -> Relation:
 
     len_seq = math.ceil(math.log((len_seq - 1), 2))
-    start_seq = np.array([random.randint(0, 1) for _ in range(len_seq)])
+    start_seq = _get_start_state(len_seq, np.random.default_rng(seed))
 
     m_seq = max_len_seq(nbits=start_seq.size, state=start_seq)[0]
     t = np.linspace(0, dt * (m_seq.size - 1), m_seq.size)
@@ -1,10 +1,14 @@
 import math
-import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 
 import numpy as np
 
+from ...config import Config
+from ..defaults.base_structures import Seed
 from ..math_sweep import Sweep
-from ..math_uncalcsweep import UncalculatedSweep
+from ..math_uncalcsweep import UncalculatedSweep, get_array_tht
+from ..utility_functions.sidelobes import get_peak_to_sidelobe_ratio
 from ..utility_functions.tukey import tukey_a_t
 
 
@@ -12,6 +16,56 @@ class SegmentSmallerDtError(Exception):
     pass
 
 
+def get_shuffle_segments(
+    f_start: float,
+    f_end: float,
+    n_segments: int,
+    round_number_freqency: int = None,
+    number: int = None,
+    seed: Seed = None,
+) -> np.ndarray:
+    """Shuffle the frequencies at the ends of the segments of shuffle sweeps.
+
+    The frequencies are evenly spaced from f_start to f_end (n_segments + 1
+    values) and shuffled by the generator created from the seed.
+    If number is passed, the array of the shape (number, n_segments + 1) with
+    independently shuffled rows is returned.
+    """
+    f_segment = np.linspace(f_start, f_end, n_segments + 1)
+    if round_number_freqency:
+        f_segment = np.round(f_segment, round_number_freqency)
+
+    rng = np.random.default_rng(seed)
+    if number is None:
+        rng.shuffle(f_segment)
+        return f_segment
+    return rng.permuted(
+        np.broadcast_to(f_segment, (number, f_segment.size)), axis=-1
+    )
+
+
+def get_shuffle_frequency_time(
+    f_segments: np.ndarray, length_time_segments: float, dt: float
+) -> np.ndarray:
+    """Frequency versus time of shuffle sweeps.
+
+    The frequency changes from the value at the end of a segment to the next
+    one by the cosine ramp. The ramp is broadcast against all segments at
+    once. f_segments can be 2D array (a shuffle in each row), then the
+    frequencies of all shuffles are calculated together (one in each row).
+    """
+    f_segments = np.asarray(f_segments)
+    x = np.linspace(
+        0.0, length_time_segments, math.ceil(length_time_segments / dt) + 1
+    )
+    my_cos = np.cos(x * np.pi / length_time_segments - np.pi) / 2 + 1 / 2
+
+    f1 = f_segments[..., :-1, np.newaxis]
+    df = np.diff(f_segments, axis=-1)[..., np.newaxis]
+    f_t = my_cos[1:] * df + f1
+    return f_t.reshape(f_segments.shape[:-1] + (-1,))
+
+
 def get_shuffle(
     time: np.ndarray,
     f_start=1.0,
@@ -20,13 +74,26 @@ def get_shuffle(
     round_number_freqency: int = None,
     time_end=10.0,
     t_tapper=1.0,
+    seed: Seed = None,
 ) -> Sweep:
 
     """Create shuffle sweep signal.
 
     t_tapper in seconds is used to apply tukey function at the end of dwell sweep signal.
+    The frequencies of segments are shuffled by the generator created from
+    the seed (int or numpy.random.Generator), the same seed gives the same sweep.
     """
 
+    dt, n_segments = _get_segments_info(time, length_time_segments)
+    f_segment = get_shuffle_segments(
+        f_start, f_end, n_segments, round_number_freqency, seed=seed
+    )
+    return _create_shuffle(time, f_segment, length_time_segments, t_tapper)
+
+
+def _get_segments_info(
+    time: np.ndarray, length_time_segments: float
+) -> Tuple[float, int]:
     dt = time[1] - time[0]
     time_end = time[-1]
 
@@ -37,23 +104,17 @@ def get_shuffle(
              then sample rate (dt - {dt})"
         )
 
-    n_segments = math.ceil(time_end / length_time_segments)
+    return dt, math.ceil(time_end / length_time_segments)
 
-    if not round_number_freqency:
-        f_segment = np.linspace(f_start, f_end, n_segments + 1)
-    else:
-        f_segment = np.round(
-            np.linspace(f_start, f_end, n_segments + 1), round_number_freqency
-        )
-
-    random.shuffle(f_segment)
 
-    x = np.linspace(0.0, length_time_segments, math.ceil(length_time_segments / dt) + 1)
-    my_cos = np.cos(x * np.pi / length_time_segments - np.pi) / 2 + 1 / 2
-    f_t = []
-    for f1, f2 in zip(f_segment[:-1], f_segment[1:]):
-        f_t.extend((my_cos * (f2 - f1) + f1)[1:])
-    f_t = np.array(f_t)
+def _create_shuffle(
+    time: np.ndarray,
+    f_segment: np.ndarray,
+    length_time_segments: float,
+    t_tapper: float,
+) -> Sweep:
+    dt = time[1] - time[0]
+    f_t = get_shuffle_frequency_time(f_segment, length_time_segments, dt)
 
     t_correct = time
     f_t_correct = f_t[:-2]
@@ -62,3 +123,88 @@ def get_shuffle(
     unsw = UncalculatedSweep(t_correct, f_t_correct, a_t)
 
     return unsw()
+
+
+def _get_shuffle_sweeps(
+    time: np.ndarray,
+    f_segments: np.ndarray,
+    length_time_segments: float,
+    t_tapper: float,
+) -> np.ndarray:
+    """The amplitudes of shuffle sweeps (one in each row) calculated together.
+
+    The steps are the same as of `_create_shuffle` (through the
+    `UncalculatedSweep`), but each of them is applied to the 2D array.
+    The phase is calculated by `get_array_tht` as by the `UncalculatedSweep`.
+    """
+    dt = time[1] - time[0]
+    f_t = get_shuffle_frequency_time(f_segments, length_time_segments, dt)[..., :-2]
+    if f_t.shape[-1] != time.size:
+        calc_time = np.linspace(time[0], time[-1], f_t.shape[-1])
+        f_t = Config.interpolate_extrapolate_method(calc_time, f_t)(time)
+
+    return tukey_a_t(time, t_tapper) * np.sin(get_array_tht(time, f_t))
+
+
+def _score_shuffles(
+    time: np.ndarray,
+    f_segments: np.ndarray,
+    length_time_segments: float,
+    t_tapper: float,
+) -> np.ndarray:
+    sweeps = _get_shuffle_sweeps(time, f_segments, length_time_segments, t_tapper)
+    return get_peak_to_sidelobe_ratio(sweeps)
+
+
+def get_best_shuffles(
+    time: np.ndarray,
+    f_start=1.0,
+    f_end=101.0,
+    length_time_segments=0.5,
+    round_number_freqency: int = None,
+    t_tapper=1.0,
+    number_candidates: int = 1000,
+    number_best: int = 1,
+    seed: Seed = None,
+    processes: Optional[int] = None,
+    chunk_size: int = 50,
+) -> List[Sweep]:
+    """Search the shuffle sweeps with the lowest side lobes of autocorrelation.
+
+    number_candidates shuffles of the frequencies of segments are drawn from
+    the seed, the sweeps are calculated and scored in batches of chunk_size
+    (each batch as one 2D array) by the peak-to-sidelobe ratio of the autocorrelation
+    (`sweep_design.math_signals.utility_functions.sidelobes.get_peak_to_sidelobe_ratio`).
+    The batches are scored on a pool of processes (processes = None -
+    the number of CPUs, processes = 1 - in the calling process).
+
+    The other parameters are the same as of `get_shuffle`.
+
+    Returns:
+    > List[Sweep] - number_best sweeps, from the highest ratio to the lowest.
+    """
+    _, n_segments = _get_segments_info(time, length_time_segments)
+    candidates = get_shuffle_segments(
+        f_start, f_end, n_segments, round_number_freqency, number_candidates, seed
+    )
+    chunks = np.array_split(candidates, math.ceil(number_candidates / chunk_size))
+
+    if processes == 1 or len(chunks) < 2:
+        scores = [
+            _score_shuffles(time, k, length_time_segments, t_tapper) for k in chunks
+        ]
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            futures = [
+                executor.submit(
+                    _score_shuffles, time, k, length_time_segments, t_tapper
+                )
+                for k in chunks
+            ]
+            scores = [k.result() for k in futures]
+
+    best = np.argsort(-np.concatenate(scores), kind="stable")[:number_best]
+    return [
+        _create_shuffle(time, candidates[k], length_time_segments, t_tapper)
+        for k in best
+    ]
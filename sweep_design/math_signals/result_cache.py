@@ -0,0 +1,300 @@
+import functools
+import hashlib
+import inspect
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, List, NamedTuple, Optional, Set, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from ..config import Config
+
+Result = Union[np.ndarray, Tuple[np.ndarray, ...]]
+
+
+class CacheStats(NamedTuple):
+    """Statistics of the `ResultCache`.
+
+    > hits: int - results found in memory.
+    > disk_hits: int - results found on disk (not in memory).
+    > misses: int - results calculated.
+    > evictions: int - results removed from memory to keep its size.
+    > items: int - results in memory.
+    > size: int - bytes of the results in memory.
+    """
+
+    hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    items: int
+    size: int
+
+
+def _update_code_key(digest: Any, code: Any) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for k in code.co_consts:
+        if inspect.iscode(k):
+            _update_code_key(digest, k)
+        else:
+            digest.update(repr(k).encode())
+
+
+def _get_code_names(code: Any) -> Set[str]:
+    names = set(code.co_names)
+    for k in code.co_consts:
+        if inspect.iscode(k):
+            names |= _get_code_names(k)
+    return names
+
+
+def _update_method_key(
+    digest: Any, method: Callable[..., Any], keying: Tuple[int, ...]
+) -> bool:
+    """Add the method to the key, False if the method can not be keyed.
+
+    The functions are keyed by the name, the code, the values they
+    captured (closure cells and defaults) and the globals they read (the
+    modules by their names, the functions by their keys, the other values
+    by their content). So the closures made with other parameters and the
+    edited functions have other keys. The bound methods (their result depends on
+    the state of the instance) and the objects without a name are not keyed.
+    """
+    if isinstance(method, functools.partial):
+        return (
+            _update_method_key(digest, method.func, keying)
+            and _update_key(digest, method.args, keying)
+            and _update_key(digest, sorted(method.keywords.items()), keying)
+        )
+    name = getattr(method, "__qualname__", None)
+    instance = getattr(method, "__self__", None)
+    if name is None or not (instance is None or inspect.ismodule(instance)):
+        return False
+    digest.update(f"{getattr(method, '__module__', '')}.{name}".encode())
+
+    code = getattr(method, "__code__", None)
+    if code is None:
+        return True
+    _update_code_key(digest, code)
+    values: List[Any] = [method.__defaults__, method.__kwdefaults__]
+    for cell in method.__closure__ or ():
+        try:
+            values.append(cell.cell_contents)
+        except ValueError:
+            values.append(None)
+    scope = getattr(method, "__globals__", {})
+    for k in sorted(_get_code_names(code)):
+        if k in scope:
+            digest.update(k.encode())
+            if inspect.ismodule(scope[k]):
+                digest.update(scope[k].__name__.encode())
+            else:
+                values.append(scope[k])
+    return all(_update_key(digest, k, keying) for k in values)
+
+
+def _update_key(digest: Any, value: Any, keying: Tuple[int, ...] = ()) -> bool:
+    """Add the value to the key, False if the value can not be keyed.
+
+    The keying is the ids of the functions being keyed (the recursive
+    closures refer to themselves).
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return False
+        digest.update(f"array{value.shape}{value.dtype}".encode())
+        digest.update(np.ascontiguousarray(value).data)
+        return True
+    if hasattr(value, "get_data"):
+        digest.update(type(value).__name__.encode())
+        data = value.get_data(copy=False)
+        return all(_update_key(digest, k, keying) for k in data)
+    if isinstance(value, (tuple, list)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        return all(_update_key(digest, k, keying) for k in value)
+    if isinstance(value, dict):
+        return _update_key(digest, sorted(value.items(), key=repr), keying)
+    if callable(value) and not isinstance(value, type):
+        if id(value) in keying:
+            digest.update(b"recursion")
+            return True
+        return _update_method_key(digest, value, keying + (id(value),))
+    text = repr(value)
+    if " at 0x" in text:
+        # The representation by the address of the object is not its content.
+        return False
+    digest.update(text.encode())
+    return True
+
+
+class ResultCache:
+    """Content-addressed cache of the results of expensive transforms.
+
+    The results of the methods (Fourier transforms of the `Signal` and
+    `Spectrum`, the analytic signal and the spectrogram of the `Sweep`,
+    the conversion of a priori data of the `ApriorUncalculatedSweep`) are
+    stored by the key made of the method and the content of its arguments.
+    The same arrays converted by the same method in other instance (or in
+    other session, if the disk store is used) are not recalculated.
+
+    The cache is disabled by default. To enable it set `Config.result_cache`:
+    ```python
+    Config.result_cache = ResultCache(max_size=2**28, path="cache")
+    ```
+
+    Parametrs:
+    > max_size: int - bytes of the results kept in memory, the least
+    recently used are removed.
+    > path: Optional[Union[Path, str]] = None - directory of the disk store
+    (relative to `Config.DEFAULT_PATH`), if None then the disk is not used.
+    > max_disk_size: Optional[int] = None - bytes of the disk store, the least
+    recently used files are removed, if None then the size is not limited.
+
+    The results are returned as copies, so they can be changed safely.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 2**28,
+        path: Optional[Union[Path, str]] = None,
+        max_disk_size: Optional[int] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.max_disk_size = max_disk_size
+        self._path = None if path is None else Path(path)
+        self._results: "OrderedDict[str, Tuple[bool, Tuple[np.ndarray, ...]]]" = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._hits = self._disk_hits = self._misses = self._evictions = 0
+
+    @property
+    def path(self) -> Optional[Path]:
+        if self._path is None or self._path.is_absolute():
+            return self._path
+        return Config.DEFAULT_PATH / self._path
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self._hits,
+            self._disk_hits,
+            self._misses,
+            self._evictions,
+            len(self._results),
+            self._size,
+        )
+
+    def clear(self, disk: bool = False) -> None:
+        """Remove the results from memory (and from the disk store)."""
+        self._results.clear()
+        self._size = 0
+        if disk and self.path is not None and self.path.exists():
+            for file in self.path.glob("*.npz"):
+                file.unlink()
+
+    @staticmethod
+    def get_key(method: Callable[..., Any], *args: Any) -> Optional[str]:
+        """The key of the result of method(*args).
+
+        None if the method or the arguments can not be keyed by their content
+        (bound methods, objects represented by their address).
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        if not _update_key(digest, method) or not _update_key(digest, args):
+            return None
+        return digest.hexdigest()
+
+    def call(self, method: Callable[..., Result], *args: Any) -> Result:
+        """Return the result of method(*args) from the cache or calculate it.
+
+        Only the results which are an array or a tuple of arrays are stored.
+        If the call can not be keyed (see `get_key`), it is not cached.
+        """
+        key = self.get_key(method, *args)
+        if key is None:
+            return method(*args)
+        item = self._results.get(key)
+        if item is not None:
+            self._results.move_to_end(key)
+            self._hits += 1
+            return self._unpack(item)
+
+        item = self._read(key)
+        if item is not None:
+            self._disk_hits += 1
+            self._store(key, item)
+            return self._unpack(item)
+
+        self._misses += 1
+        result = method(*args)
+        is_tuple = isinstance(result, tuple)
+        arrays = result if is_tuple else (result,)
+        if all(isinstance(k, np.ndarray) and k.dtype != object for k in arrays):
+            item = (is_tuple, tuple(np.array(k) for k in arrays))
+            self._store(key, item)
+            self._write(key, item)
+        return result
+
+    @staticmethod
+    def _unpack(item: Tuple[bool, Tuple[np.ndarray, ...]]) -> Result:
+        is_tuple, arrays = item
+        if is_tuple:
+            return tuple(k.copy() for k in arrays)
+        return arrays[0].copy()
+
+    def _store(self, key: str, item: Tuple[bool, Tuple[np.ndarray, ...]]) -> None:
+        size = sum(k.nbytes for k in item[1])
+        if size > self.max_size:
+            return
+        self._results[key] = item
+        self._size += size
+        while self._size > self.max_size:
+            _, (_, arrays) = self._results.popitem(last=False)
+            self._size -= sum(k.nbytes for k in arrays)
+            self._evictions += 1
+
+    def _read(self, key: str) -> Optional[Tuple[bool, Tuple[np.ndarray, ...]]]:
+        if self.path is None:
+            return None
+        file = self.path / f"{key}.npz"
+        try:
+            with np.load(file) as data:
+                arrays = tuple(data[f"arr_{k}"] for k in range(len(data.files) - 1))
+                is_tuple = bool(data["is_tuple"])
+        except (OSError, KeyError, ValueError):
+            return None
+        os.utime(file)
+        return is_tuple, arrays
+
+    def _write(self, key: str, item: Tuple[bool, Tuple[np.ndarray, ...]]) -> None:
+        if self.path is None:
+            return
+        path = self.path
+        path.mkdir(parents=True, exist_ok=True)
+        # The suffix of the temporary file is not .npz, so the files being
+        # written by other processes are not read or removed.
+        temp_file = path / f"{key}.{os.getpid()}.tmp"
+        with temp_file.open("wb") as file:
+            np.savez(file, *item[1], is_tuple=np.array(item[0]))
+        os.replace(temp_file, path / f"{key}.npz")
+
+        if self.max_disk_size is not None:
+            files = sorted(path.glob("*.npz"), key=lambda k: k.stat().st_mtime)
+            size = sum(k.stat().st_size for k in files)
+            while files and size > self.max_disk_size:
+                file = files.pop(0)
+                size -= file.stat().st_size
+                file.unlink()
+                logger.debug("The cached result {} is removed", file)
+
+
+def call_cached(method: Callable[..., Result], *args: Any) -> Result:
+    """Call method(*args) through `Config.result_cache`, if it is set."""
+    cache: Optional[ResultCache] = Config.result_cache
+    if cache is None:
+        return method(*args)
+    return cache.call(method, *args)
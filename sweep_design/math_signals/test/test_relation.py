@@ -1,3 +1,4 @@
+import tracemalloc
 import unittest
 
 import numpy as np
@@ -5,7 +6,8 @@ from scipy.integrate import cumulative_trapezoid
 from numpy.testing import assert_array_equal
 
 from ..math_relation import Relation
-from ..defaults.base_structures import BaseXY
+from ..defaults import methods as dfm
+from ..defaults.base_structures import BaseXY, UniformAxis
 
 
 def pre_integr(x, y):
@@ -165,6 +167,202 @@ class TestRelation(unittest.TestCase):
         r2 = Relation([1, 2, 3, 4, 5], [10, 20, 30, 40, 50])
         self.pre_cases.pre_test_convolve_correlate(self, r1, r2, Relation)
 
+    def test_equalize_uniform(self):
+        x = np.arange(100) * 0.01
+        r1 = Relation(x, np.arange(100.0))
+        r2 = Relation(x[30:80], np.ones(50))
+        r3 = Relation(np.arange(50) * 0.01 + 1.5, np.ones(50))
+
+        e1, e2 = Relation.equalize(r1, r2)
+        self.assertIs(e1, r1)
+        assert_array_equal(e2.x, x)
+        assert_array_equal(e2.y, np.where((x >= 0.295) & (x <= 0.795), 1.0, 0.0))
+
+        e1, e3 = Relation.equalize(r1, r3)
+        self.assertEqual(len(e1), 200)
+        np.testing.assert_allclose(e1.x, np.arange(200) * 0.01)
+        assert_array_equal(e1.y[:100], r1.y)
+        assert_array_equal(e1.y[100:], np.zeros(100))
+        assert_array_equal(e3.y, np.append(np.zeros(150), np.ones(50)))
+
+        r4 = Relation(np.arange(50) * 0.02, np.ones(50))
+        e1, e4 = Relation.equalize(r1, r4)
+        assert_array_equal(e1.x, e4.x)
+
+        # The ends and the size are the same as of the uniform grid.
+        x_nonuniform = x.copy()
+        x_nonuniform[40:60] += 0.004
+        self.assertIsNone(dfm.align_uniform(x, r1.y, 0.01, x_nonuniform, r1.y, 0.01))
+        r5 = Relation(x_nonuniform, np.arange(100.0))
+        e1, e5 = Relation.equalize(r1, r5)
+        expected = r5.interpolate_extrapolate(e1.x)
+        assert_array_equal(e5.y, expected.y)
+
+        a1 = Relation(UniformAxis(0.0, 0.01, 100), np.arange(100.0))
+        a3 = Relation(UniformAxis(1.5, 0.01, 50), np.ones(50))
+        e1, e3 = Relation.equalize(a1, a3)
+        self.assertEqual(e1._axis, UniformAxis(0.0, 0.01, 200))
+        self.assertEqual(e3._axis, e1._axis)
+        assert_array_equal(e3.y, np.append(np.zeros(150), np.ones(50)))
+
+        class Wrapped:
+            """Relation-like object without the fields of Relation."""
+
+            def __init__(self, relation):
+                self._relation = relation
+                self.x, self.y = relation.get_data()
+
+            def get_data(self):
+                return self._relation.get_data()
+
+        assert_array_equal((r1 + Wrapped(r2)).y, (r1 + r2).y)
+
+    def test_uniform_axis(self):
+        axis = UniformAxis(0.0, 0.01, 1000)
+        y = np.arange(1000.0)
+        r = Relation(axis, y)
+        r_array = Relation(axis.get_array(), y)
+
+        self.assertIsNone(r._x_array)
+        self.assertEqual(r.dx, 0.01)
+        self.assertEqual(len(r), 1000)
+        assert_array_equal(r.x, r_array.x)
+        self.assertEqual(r[0.333], r_array[0.333])
+
+        for x_start, x_end in [(0.3, 0.5), (0.305, 0.505), (-1.0, 20.0), (5.0, 4.0)]:
+            with self.subTest(x_start=x_start, x_end=x_end):
+                selected = r.select_data(x_start, x_end)
+                expected = r_array.select_data(x_start, x_end)
+                self.assertIsNotNone(selected._axis)
+                np.testing.assert_allclose(selected.x, expected.x)
+                assert_array_equal(selected.y, expected.y)
+
+        shifted = r.shift(1.5)
+        self.assertEqual(shifted._axis, UniformAxis(1.5, 0.01, 1000))
+
+        result = (r + r) * 2 - r
+        self.assertEqual(result._axis, axis)
+        assert_array_equal(result.y, 3 * y)
+
+    def test_conv_corr_methods(self):
+        rng = np.random.default_rng(1)
+        r1 = Relation(np.arange(3000) * 0.01 + 0.5, rng.normal(size=3000))
+        r2 = Relation(np.arange(100) * 0.01, rng.normal(size=100))
+
+        methods = {
+            dfm.correlate: [
+                dfm.correlate_fft,
+                dfm.correlate_overlap_add,
+                dfm.correlate_auto,
+            ],
+            dfm.convolve: [
+                dfm.convolve_fft,
+                dfm.convolve_overlap_add,
+                dfm.convolve_auto,
+            ],
+        }
+        for direct_method, other_methods in methods.items():
+            x, y = direct_method(Relation, r1, r2)
+            for method in other_methods:
+                with self.subTest(method=method):
+                    result_x, result_y = method(Relation, r1, r2)
+                    assert_array_equal(result_x, x)
+                    np.testing.assert_allclose(result_y, y, atol=1e-10)
+
+    def test_data_view(self):
+        x = np.arange(100) * 0.1
+        r = Relation(x, x**2)
+
+        view_x, view_y = r.get_data(copy=False)
+        assert_array_equal(view_x, x)
+        assert_array_equal(view_y, x**2)
+        with self.assertRaises(ValueError):
+            view_y[0] = 1.0
+
+        copy_x, copy_y = r.get_data()
+        copy_y[0] = 1.0
+        assert_array_equal(r.y, x**2)
+
+    def test_lazy(self):
+        x = np.arange(200) * 0.01
+        rng = np.random.default_rng(2)
+        a, b, c = (Relation(x, rng.random(200) + 0.5) for _ in range(3))
+        shifted = Relation(x + 0.5, rng.random(200))
+
+        expressions = [
+            (lambda r: (r + b) * c / 2, lambda: (a + b) * c / 2),
+            (lambda r: 2 - r**2 * 3 + c**0.5, lambda: 2 - a**2 * 3 + c**0.5),
+            (lambda r: 1 / (r - shifted) + b, lambda: 1 / (a - shifted) + b),
+        ]
+        for lazy_expression, expression in expressions:
+            with self.subTest(expression=expression):
+                result = lazy_expression(a.lazy())
+                expected = expression()
+                assert_array_equal(result.x, expected.x)
+                np.testing.assert_allclose(result.y, expected.y)
+                self.assertIsInstance(result.evaluate(), Relation)
+                self.assertIs(result.evaluate(), result.evaluate())
+
+        uniform = Relation(UniformAxis(0.0, 0.01, 200), a.y)
+        result = (uniform.lazy() * 2 + uniform).evaluate()
+        self.assertEqual(result._axis, uniform._axis)
+        assert_array_equal(result.y, 3 * a.y)
+
+    def test_inplace(self):
+        x = np.arange(100) * 0.1
+        y1, y2 = np.sin(x) - 0.5, np.cos(x) + 2.0
+        shifted = Relation(x + 0.5, y2)
+
+        operations = ["__iadd__", "__isub__", "__imul__", "__itruediv__", "__ipow__"]
+        for operation in operations:
+            for other in [Relation(x, y2), 3.0, shifted]:
+                with self.subTest(operation=operation, other=other):
+                    r = Relation(x, y1)
+                    with np.errstate(divide="ignore"):
+                        expected = getattr(r, operation.replace("__i", "__", 1))(other)
+                    buffer = r._y
+
+                    with np.errstate(divide="ignore"):
+                        result = getattr(r, operation)(other)
+                    self.assertIs(result, r)
+                    assert_array_equal(r.x, expected.x)
+                    np.testing.assert_allclose(r.y, expected.y)
+                    self.assertIs(r._y is buffer, other is not shifted)
+
+        r = Relation(x, y1)
+        r **= r
+        np.testing.assert_allclose(r.y, np.abs(y1) ** y1 * np.sign(y1))
+
+        r = Relation(x, np.arange(100))
+        r /= 2
+        assert_array_equal(r.y, np.arange(100) / 2)
+
+        uniform = Relation(UniformAxis(0.0, 0.1, 100), y1)
+        uniform += Relation(UniformAxis(0.0, 0.1, 100), y2)
+        self.assertEqual(uniform._axis, UniformAxis(0.0, 0.1, 100))
+        np.testing.assert_allclose(uniform.y, y1 + y2)
+
+    def test_operation_allocations(self):
+        size = 100000
+        x = np.arange(size) * 0.001
+        r1, r2 = Relation(x, np.sin(x)), Relation(x, np.cos(x))
+
+        operations = {
+            "add": lambda: r1 + r2,
+            "mul": lambda: r1 * 2.0,
+            "exp": lambda: r1.exp(),
+            "shift": lambda: r1.shift(1.0),
+        }
+        for name, operation in operations.items():
+            with self.subTest(name=name):
+                operation()
+                tracemalloc.start()
+                operation()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                # The result and the arrays of the new instance only.
+                self.assertLessEqual(peak, 3.5 * x.nbytes)
+
 
 def math_check(r1, ry, x, y1, y, operation):
     r = r1.__getattribute__(operation)(ry)  # type: Relation
@@ -1,7 +1,21 @@
+import tempfile
 import unittest
+from math import sin
+from pathlib import Path
 
+import numpy as np
+
+from ...config import Config
+from ..defaults.base_structures import BadInputError
+from ..defaults.fft_backends import FFTBackend, PyFFTW, ScipyFFT
 from ..math_relation import Relation
 from ..math_signal import Signal, Spectrum
+from ..result_cache import ResultCache
+from ..utility_functions.stream_correlation import correlate_stream
+from ..utility_functions.detrend import emd_detrend, highpass_detrend, spline_detrend
+from ..utility_functions.emd_analyse import get_first_IMF_emd, get_IMFs_emd
+from ..utility_functions.sweep_correction import correct_sweep_without_window
+from ..utility_functions.sweep_correction_source import soft_clip
 from .test_relation import PreTestRelation
 
 
@@ -95,3 +109,202 @@ class TestSignalSpectrum(unittest.TestCase):
 
     def test_spectrum(self):
         self.pre_spectrum.pre_test_spectrum(self, Spectrum)
+
+    def test_correlate_stream(self):
+        rng = np.random.default_rng(2)
+        pilot = Signal(np.arange(200) * 0.002, rng.normal(size=200))
+        record = rng.normal(size=5003)
+        chunks = (record[k : k + 611] for k in range(0, record.size, 611))
+
+        result = list(correlate_stream(pilot, chunks, block_size=1000))
+        self.assertTrue(all(isinstance(k, Signal) for k in result))
+
+        time = np.concatenate([k.x for k in result])
+        amplitude = np.concatenate([k.y for k in result])
+        expected = np.correlate(record, pilot.y, "full")[199 : 199 + record.size]
+        np.testing.assert_allclose(time, np.arange(record.size) * 0.002)
+        np.testing.assert_allclose(amplitude, expected, atol=1e-10)
+
+        record = np.append(rng.normal(size=1500), rng.normal(size=700) + 1j)
+        chunks = [record[:1500], record[1500:]]
+        result = correlate_stream(pilot, chunks, block_size=500, dt=0.002)
+        amplitude = np.concatenate([k.y for k in result])
+        expected = np.correlate(record, pilot.y, "full")[199 : 199 + record.size]
+        np.testing.assert_allclose(amplitude, expected, atol=1e-10)
+
+        with self.assertRaises(BadInputError):
+            next(correlate_stream(pilot, [record], dt=0.001))
+        with self.assertRaises(BadInputError):
+            chunk = Signal(np.arange(1000) * 0.001, record[:1000])
+            next(correlate_stream(pilot, [chunk]))
+
+    def test_result_cache(self):
+        rng = np.random.default_rng(3)
+        time = np.arange(100) * 0.01
+        signals = [Signal(time, rng.normal(size=100)) for _ in range(3)]
+        expected = [k.get_spectrum() for k in signals]
+        size = sum(k.nbytes for k in expected[0].get_data(copy=False))
+        with tempfile.TemporaryDirectory() as path:
+            cache = ResultCache(max_size=2 * size, path=path)
+            Config.result_cache = cache
+            try:
+                for k, spectrum in zip(signals, expected):
+                    copy = Signal(*k.get_data())
+                    np.testing.assert_array_equal(copy.get_spectrum().y, spectrum.y)
+                copy = Signal(*signals[2].get_data())
+                np.testing.assert_array_equal(copy.get_spectrum().y, expected[2].y)
+                stats = cache.stats
+                self.assertEqual((stats.hits, stats.misses), (1, 3))
+                self.assertEqual((stats.evictions, stats.items), (1, 2))
+
+                cache.clear()
+                copy = Signal(*signals[0].get_data())
+                np.testing.assert_array_equal(copy.get_spectrum().y, expected[0].y)
+                self.assertEqual(cache.stats.disk_hits, 1)
+            finally:
+                Config.result_cache = None
+
+    def test_result_cache_closures(self):
+        def make(k):
+            def method(a):
+                return a * k
+
+            return method
+
+        a = np.ones(3)
+        with tempfile.TemporaryDirectory() as path:
+            cache = ResultCache(path=path)
+            for _ in range(2):
+                # The closures made in the loop are collected and their ids
+                # are reused, the results must not be.
+                for k in range(1, 6):
+                    np.testing.assert_array_equal(cache.call(make(k), a), a * k)
+            self.assertEqual((cache.stats.hits, cache.stats.misses), (5, 5))
+
+            # The bound methods are not cached.
+            np.testing.assert_array_equal(cache.call(a.__mul__, 2.0), a * 2)
+            self.assertEqual(cache.stats.items, 5)
+
+            # The files being written by other processes are not removed.
+            temp_file = Path(path) / "key.1.tmp"
+            temp_file.touch()
+            cache.clear()
+            self.assertTrue(temp_file.exists())
+
+    def test_result_cache_globals(self):
+        source = "def method(a):\n    return np.{0}(a) * SCALE\n"
+        methods = {}
+        for k in ("sin", "cos"):
+            scope = {"np": np, "SCALE": 2.0}
+            exec(source.format(k), scope)
+            methods[k] = scope
+
+        a = np.linspace(0.0, 1.0, 5)
+        cache = ResultCache()
+        for k, scope in methods.items():
+            np.testing.assert_array_equal(
+                cache.call(scope["method"], a), getattr(np, k)(a) * 2.0
+            )
+        self.assertEqual(cache.stats.misses, 2)
+
+        # The edited global constant is a part of the key.
+        methods["sin"]["SCALE"] = 3.0
+        np.testing.assert_array_equal(
+            cache.call(methods["sin"]["method"], a), np.sin(a) * 3.0
+        )
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (0, 3))
+
+    def test_fft_backend(self):
+        rng = np.random.default_rng(4)
+        signal = Signal(np.arange(1000) * 0.002, rng.normal(size=1000))
+        expected = signal.get_spectrum()
+        backends = [FFTBackend(), ScipyFFT(workers=None), ScipyFFT(workers=2)]
+        try:
+            backends.append(PyFFTW(planner_effort="FFTW_ESTIMATE"))
+        except ImportError:
+            pass
+
+        default = Config.fft_backend
+        try:
+            for backend in backends:
+                with self.subTest(backend=type(backend).__name__):
+                    Config.fft_backend = backend
+                    spectrum = Signal(*signal.get_data()).get_spectrum()
+                    np.testing.assert_allclose(spectrum.y, expected.y, atol=1e-10)
+                    np.testing.assert_allclose(
+                        spectrum.get_signal().y, signal.y, atol=1e-10
+                    )
+                    batch = rng.normal(size=(3, 64))
+                    np.testing.assert_allclose(
+                        backend.irfft(backend.rfft(batch)), batch, atol=1e-12
+                    )
+        finally:
+            Config.fft_backend = default
+
+
+def soft_clip_by_sample(data, limits, percent=0.85, coef=1):
+    """soft_clip calculated sample by sample."""
+    hard_limit = limits
+    linear_limit = limits * percent
+
+    def select_choice(data):
+        amplitude = abs(data[0])
+        if amplitude <= linear_limit:
+            return data[1]
+        if amplitude >= hard_limit:
+            return ((hard_limit / amplitude) ** coef) * data[1]
+        scale = hard_limit - linear_limit
+        compression = scale * sin(np.pi / 2 * (amplitude - linear_limit) / scale)
+        return (((linear_limit + compression) / amplitude) ** coef) * data[1]
+
+    return np.apply_along_axis(select_choice, 1, data)
+
+
+class TestSweepCorrectionSource(unittest.TestCase):
+    def test_soft_clip(self):
+        rng = np.random.default_rng(3)
+        data = np.column_stack((2 * rng.normal(size=5000), rng.normal(size=5000)))
+        data[::100, 0] = 0.0
+
+        for percent in [0.85, 1.0]:
+            for coef in [1, 2, 1.5, 7]:
+                with self.subTest(percent=percent, coef=coef):
+                    np.testing.assert_array_equal(
+                        soft_clip(data, 1.0, percent, coef),
+                        soft_clip_by_sample(data, 1.0, percent, coef),
+                    )
+
+    def test_first_imf(self):
+        rng = np.random.default_rng(4)
+        t = np.linspace(0.0, 1.0, 2001)
+        y = np.convolve(rng.normal(size=t.size), np.hanning(20), "same")
+        signal = Signal(t, y + 5 * t**2)
+
+        imf, trend = get_first_IMF_emd(signal)
+        self.assertIsInstance(imf, Signal)
+        np.testing.assert_array_equal(imf.y, get_IMFs_emd(signal)[0].y)
+        np.testing.assert_allclose(imf.y + trend, signal.y)
+
+        close_signal = signal + Signal(t, 0.1 * np.sin(2 * np.pi * t))
+        warm_imf, _ = get_first_IMF_emd(close_signal, trend)
+        expected = get_IMFs_emd(close_signal)[0].y
+        self.assertLess(np.std(warm_imf.y - expected), 0.05 * np.std(expected))
+
+    def test_detrend(self):
+        t = np.linspace(0.0, 10.0, 10001)
+        oscillation = np.sin(2 * np.pi * 20 * t)
+        signal = Signal(t, oscillation + 0.5 * t**2 + 2 * t)
+
+        for detrend_method in [
+            emd_detrend,
+            highpass_detrend(2.0),
+            spline_detrend(1.0),
+        ]:
+            with self.subTest(detrend_method=detrend_method):
+                result = detrend_method(signal)
+                assert_slice = slice(1000, -1000)
+                np.testing.assert_allclose(
+                    result.y[assert_slice], oscillation[assert_slice], atol=0.05
+                )
+                corrected = correct_sweep_without_window(signal, detrend_method)
+                self.assertLessEqual(len(corrected), t.size)
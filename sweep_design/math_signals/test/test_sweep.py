@@ -1,17 +1,31 @@
 import logging
+import math
 import unittest
 from typing import Callable
 
 import numpy as np
 from scipy import signal
 
+from ...config import Config
 from ...config.sweep_config import SweepConfig
+from ..defaults import sweep_methods as dfsm
 from ..defaults.base_structures import Spectrogram
 from ..math_relation import Relation
 from ..math_signal import Signal
-from ..math_sweep import Sweep
+from ..math_sweep import Sweep, SweepBatch
 from ..math_uncalcsweep import ApriorUncalculatedSweep, UncalculatedSweep
+from ..prepared_sweeps.code_zinger import get_code_zinger
+from ..prepared_sweeps.linear_sweep import get_linear_sweep, get_linear_sweeps
+from ..prepared_sweeps.m_sequence import get_m_sequence, get_m_sequences
+from ..prepared_sweeps import pseudorandom_shuffle
+from ..prepared_sweeps.pseudorandom_shuffle import (
+    get_best_shuffles,
+    get_shuffle,
+    get_shuffle_frequency_time,
+    get_shuffle_segments,
+)
 from ..utility_functions.ftat_functions import dwell
+from ..utility_functions.sidelobes import get_peak_to_sidelobe_ratio
 from .test_relation import PreTestRelation
 from .test_signal import PreTestSignal
 
@@ -101,6 +115,27 @@ class TestUncalculatedSweep(unittest.TestCase):
                             sweep2 = result()
                             self.assertIsInstance(sweep2, Sweep)
 
+    def test_integrate_function(self):
+        t = np.linspace(0.0, 2.0, 201)
+
+        def f_t_polynomial(t):
+            return 1.0 + 2.0 * t + 3.0 * t**3
+
+        def f_t_sin(t):
+            return 10.0 + 5.0 * np.sin(3.0 * t)
+
+        def f_t_scalar(t):
+            return 10.0 + 5.0 * math.sin(3.0 * t)
+
+        for f_t in [f_t_polynomial, f_t_sin, f_t_scalar]:
+            with self.subTest(f_t=f_t):
+                np.testing.assert_allclose(
+                    dfsm.integrate_simpson(f_t, t),
+                    dfsm.integrate_quad(f_t, t),
+                    rtol=1e-10,
+                    atol=1e-10,
+                )
+
 
 class TestSweep(unittest.TestCase):
 
@@ -132,3 +167,263 @@ class TestSweep(unittest.TestCase):
             for k2 in l:
                 self.subTest(k=k, k2=k2)
                 self.pre_relation.pre_test_convolve_correlate(self, k, k2, Sweep)
+
+    def test_lazy_calculation(self):
+        spectrogram_method = SweepConfig.spectrogram_method
+        SweepConfig.spectrogram_method = dfsm.get_spectrogram
+        Sweep.reset_calculation_counter()
+        try:
+            t = np.linspace(0.0, 1.0, 1001)
+            sweep = Sweep(t, np.sin(2 * np.pi * 10 * t))
+            result = (sweep + sweep).shift(1.0) * 2
+            self.assertEqual(sum(Sweep.calculation_counter.values()), 0)
+
+            self.assertIsInstance(result.spectrogram, Spectrogram)
+            self.assertIs(result.spectrogram, result.spectrogram)
+            self.assertIsInstance(result.frequency_time, Relation)
+            self.assertIsInstance(result.amplitude_time, Relation)
+            result.frequency_time
+            result.amplitude_time
+            self.assertEqual(
+                Sweep.calculation_counter,
+                {
+                    "spectrogram": 1,
+                    "analytic_signal": 1,
+                    "frequency_time": 1,
+                    "amplitude_time": 1,
+                },
+            )
+
+            analytic_signal = result.get_analytic_signal()
+            self.assertIsInstance(analytic_signal, Signal)
+            np.testing.assert_allclose(analytic_signal.y.real, result.y, atol=1e-9)
+            np.testing.assert_allclose(
+                np.abs(analytic_signal.y), result.amplitude_time.y
+            )
+            self.assertEqual(Sweep.calculation_counter["analytic_signal"], 1)
+
+            result._reset_cache()
+            result.spectrogram
+            self.assertEqual(Sweep.calculation_counter["spectrogram"], 2)
+        finally:
+            SweepConfig.spectrogram_method = spectrogram_method
+            Sweep.reset_calculation_counter()
+
+    def test_two_argument_ftat_methods(self):
+        get_f_t, get_a_t = SweepConfig.get_f_t, SweepConfig.get_a_t
+
+        def f_t_by_time(time, amplitude):
+            return Relation(time, np.ones_like(time))
+
+        SweepConfig.get_f_t = f_t_by_time
+        SweepConfig.get_a_t = lambda time, amplitude: Relation(time, abs(amplitude))
+        try:
+            t = np.linspace(0.0, 1.0, 101)
+            sweep = Sweep(t, np.sin(2 * np.pi * 10 * t))
+            np.testing.assert_array_equal(sweep.frequency_time.y, np.ones(101))
+            np.testing.assert_array_equal(sweep.amplitude_time.y, abs(sweep.y))
+        finally:
+            SweepConfig.get_f_t, SweepConfig.get_a_t = get_f_t, get_a_t
+
+
+class TestSweepBatch(unittest.TestCase):
+    def test_linear_sweeps(self):
+        t = np.linspace(0.0, 2.0, 2001)
+        f_start = np.array([1.0, 5.0])
+        f_end = np.array([[50.0], [80.0], [100.0]])
+
+        batch = get_linear_sweeps(t, f_start, f_end, t_tapper=0.5)
+        self.assertIsInstance(batch, SweepBatch)
+        self.assertEqual(batch.amplitudes.shape, (6, t.size))
+        self.assertEqual(batch._sweeps, [None] * 6)
+
+        f_start, f_end = (k.ravel() for k in np.broadcast_arrays(f_start, f_end))
+
+        for k, (f_s, f_e) in enumerate(zip(f_start, f_end)):
+            with self.subTest(f_s=f_s, f_e=f_e):
+                expected = get_linear_sweep(t, f_s, f_e, t_tapper=0.5)
+                sweep = batch[k]
+                self.assertIsInstance(sweep, Sweep)
+                self.assertIs(sweep, batch[k])
+                np.testing.assert_allclose(sweep.y, expected.y, atol=1e-9)
+                np.testing.assert_allclose(
+                    sweep.frequency_time.y, expected.frequency_time.y
+                )
+                np.testing.assert_allclose(
+                    sweep.amplitude_time.y, expected.amplitude_time.y
+                )
+
+    def test_linear_sweeps_integrate_method(self):
+        def integrate_rectangles(x, y, dx=None):
+            return x[1:], np.cumsum(y[..., 1:], axis=-1) * dx
+
+        t = np.linspace(0.0, 1.0, 1001)
+        default = Config.integrate_method
+        Config.integrate_method = integrate_rectangles
+        try:
+            batch = get_linear_sweeps(t, [1.0, 5.0], 40.0, t_tapper=0.2)
+            expected = get_linear_sweep(t, 5.0, 40.0, t_tapper=0.2)
+        finally:
+            Config.integrate_method = default
+        np.testing.assert_array_equal(batch[1].y, expected.y)
+
+    def test_phase(self):
+        t = np.linspace(0.0, 1.0, 1001)
+        batch = get_linear_sweeps(t, 1.0, 20.0, 0.2, tht0=[0.0, np.pi])
+        np.testing.assert_allclose(batch[0].y, -batch[1].y, atol=1e-9)
+        self.assertEqual(len(list(batch)), 2)
+
+    def test_phase_rotated_sweeps(self):
+        t = np.linspace(0.0, 1.0, 1001)
+        tht0 = [0.0, np.pi / 4, np.pi / 2]
+        aprior_signal = Signal(t, get_ricker(t.size))
+
+        def f_t(t):
+            return 5.0 + 20.0 * t
+
+        for uncalc_sweep in [
+            UncalculatedSweep(t, f_t, np.hanning(t.size)),
+            ApriorUncalculatedSweep(t, aprior_signal, dwell(None, None, 5)),
+        ]:
+            with self.subTest(uncalc_sweep=uncalc_sweep):
+                batch = uncalc_sweep.get_phase_rotated_sweeps(tht0)
+                self.assertIsInstance(batch, SweepBatch)
+                self.assertEqual(len(batch), len(tht0))
+                for k, phase in enumerate(tht0):
+                    expected = uncalc_sweep(tht0=phase)
+                    np.testing.assert_allclose(batch[k].y, expected.y, atol=1e-9)
+                    np.testing.assert_allclose(
+                        batch[k].frequency_time.y, uncalc_sweep._frequency_time(t)
+                    )
+
+
+def code_zinger_by_shift(segment_sweep, code_zinger, periods):
+    """The code sweep assembled by shifting and adding of the segments."""
+    new_sweep = segment_sweep * code_zinger[0]
+    for cnt, v in enumerate(code_zinger[1:], 1):
+        new_sweep = new_sweep + v * segment_sweep.shift(
+            cnt * segment_sweep.x[-1] + cnt * segment_sweep.dx
+        )
+
+    new_sweep_period = new_sweep
+    for period in range(periods - 1):
+        new_sweep_period = new_sweep_period + new_sweep.shift(
+            (period + 1) * new_sweep_period.x[-1] + (period + 1) * new_sweep_period.dx
+        )
+    return new_sweep_period
+
+
+class TestCodeZinger(unittest.TestCase):
+    def test_equal_to_shift(self):
+        t = np.linspace(0.0, 1.0, 1001)
+        segment = get_linear_sweep(t, 1.0, 50.0, 0.1)
+
+        for code in [[-1, -1, -1, 1], [1], [1, -1, 1, 1, -1]]:
+            for periods in [1, 2]:
+                with self.subTest(code=code, periods=periods):
+                    result = get_code_zinger(segment, code, periods)
+                    expected = code_zinger_by_shift(segment, code, periods)
+                    self.assertIsInstance(result, Sweep)
+                    np.testing.assert_allclose(result.x, expected.x, atol=1e-9)
+                    np.testing.assert_allclose(result.y, expected.y, atol=1e-12)
+
+    def test_periods(self):
+        t = np.linspace(0.0, 1.0, 101)
+        segment = Signal(t, np.sin(2 * np.pi * 5 * t))
+        code = [-1, -1, -1, 1]
+
+        result = get_code_zinger(segment, code, 5)
+        self.assertEqual(len(result), 5 * len(code) * t.size)
+        np.testing.assert_allclose(result.x, np.arange(len(result)) * 0.01)
+        np.testing.assert_allclose(
+            result.y, np.tile(get_code_zinger(segment, code).y, 5)
+        )
+
+
+class TestMSequence(unittest.TestCase):
+    def test_seed(self):
+        first = get_m_sequence(64, 0.002, seed=1)
+        second = get_m_sequence(64, 0.002, seed=np.random.default_rng(1))
+        np.testing.assert_array_equal(first.y, get_m_sequence(64, 0.002, seed=1).y)
+        np.testing.assert_array_equal(
+            second.y, get_m_sequence(64, 0.002, seed=np.random.default_rng(1)).y
+        )
+
+    def test_batch(self):
+        serial = get_m_sequences(2, 64, 0.002, seed=7, processes=1)
+        concurrent = get_m_sequences(2, 64, 0.002, seed=7, processes=2)
+        self.assertEqual(len(serial), 2)
+        for k, m in zip(serial, concurrent):
+            np.testing.assert_allclose(k.y, m.y, atol=1e-9)
+        self.assertFalse(np.allclose(serial[0].y, serial[1].y))
+
+
+def shuffle_frequency_time_by_segment(
+    f_segment: np.ndarray, length_time_segments: float, dt: float
+) -> np.ndarray:
+    x = np.linspace(
+        0.0, length_time_segments, math.ceil(length_time_segments / dt) + 1
+    )
+    my_cos = np.cos(x * np.pi / length_time_segments - np.pi) / 2 + 1 / 2
+    f_t = []
+    for f1, f2 in zip(f_segment[:-1], f_segment[1:]):
+        f_t.extend((my_cos * (f2 - f1) + f1)[1:])
+    return np.array(f_t)
+
+
+class TestShuffle(unittest.TestCase):
+    def test_frequency_time(self):
+        f_segments = get_shuffle_segments(1.0, 101.0, 20, number=5, seed=1)
+        self.assertEqual(f_segments.shape, (5, 21))
+        np.testing.assert_array_equal(
+            np.sort(f_segments, axis=-1)[0], np.linspace(1.0, 101.0, 21)
+        )
+
+        for length_time_segments, dt in [(0.5, 0.001), (0.03, 0.002)]:
+            f_t = get_shuffle_frequency_time(f_segments, length_time_segments, dt)
+            for f_segment, f_t_row in zip(f_segments, f_t):
+                np.testing.assert_array_equal(
+                    f_t_row,
+                    shuffle_frequency_time_by_segment(
+                        f_segment, length_time_segments, dt
+                    ),
+                )
+
+    def test_seed(self):
+        t = np.linspace(0.0, 10.0, 10001)
+        first = get_shuffle(t, seed=3)
+        self.assertEqual(len(first), t.size)
+        np.testing.assert_array_equal(first.y, get_shuffle(t, seed=3).y)
+        self.assertFalse(np.array_equal(first.y, get_shuffle(t, seed=4).y))
+
+    def test_peak_to_sidelobe_ratio(self):
+        t = np.linspace(0.0, 10.0, 10001)
+        sweeps = np.stack(
+            [get_linear_sweep(t, 10.0, 100.0, 0.0).y, get_shuffle(t, seed=1).y]
+        )
+        ratios = get_peak_to_sidelobe_ratio(sweeps)
+        self.assertEqual(ratios.shape, (2,))
+        # The first side lobe of the rectangular window is -13.26 dB.
+        self.assertAlmostEqual(ratios[0], 13.26, delta=0.1)
+        self.assertAlmostEqual(ratios[1], get_peak_to_sidelobe_ratio(sweeps[1]))
+
+    def test_best_shuffles(self):
+        t = np.linspace(0.0, 5.0, 2501)
+        best = get_best_shuffles(
+            t, number_candidates=20, number_best=3, seed=2, processes=1, chunk_size=8
+        )
+        ratios = [get_peak_to_sidelobe_ratio(k.y) for k in best]
+        self.assertEqual(len(best), 3)
+        self.assertEqual(ratios, sorted(ratios, reverse=True))
+
+        concurrent = get_best_shuffles(
+            t, number_candidates=20, number_best=3, seed=2, processes=2, chunk_size=8
+        )
+        for k, m in zip(best, concurrent):
+            np.testing.assert_array_equal(k.y, m.y)
+
+        segments = get_shuffle_segments(1.0, 101.0, 10, number=4, seed=3)
+        np.testing.assert_array_equal(
+            pseudorandom_shuffle._get_shuffle_sweeps(t, segments, 0.5, 1.0),
+            [pseudorandom_shuffle._create_shuffle(t, k, 0.5, 1.0).y for k in segments],
+        )
@@ -11,6 +11,11 @@ from .sweep_correction import (
     correct_sweep_without_window as correct_sweep_without_window,
 )
 from .sweep_correction import correct_sweep as correct_sweep
+from .detrend import emd_detrend as emd_detrend
+from .detrend import highpass_detrend as highpass_detrend
+from .detrend import spline_detrend as spline_detrend
 from .sweep_correction_source import (
     get_correction_for_source as get_correction_for_source,
 )
+from .stream_correlation import correlate_stream as correlate_stream
+from .sidelobes import get_peak_to_sidelobe_ratio as get_peak_to_sidelobe_ratio
@@ -0,0 +1,62 @@
+from typing import Callable, TypeVar
+
+import numpy as np
+from scipy.interpolate import make_lsq_spline  # type: ignore
+from scipy.signal import butter, sosfiltfilt  # type: ignore
+
+from ..math_relation import Relation
+from .emd_analyse import get_first_IMF_emd
+
+Signal = TypeVar("Signal", bound=Relation)
+
+
+def emd_detrend(data: Signal) -> Signal:
+    """Remove the low-frequency drift using the first IMF of the EMD.
+
+    The default method for the sweep corrections.
+    """
+    imf, _ = get_first_IMF_emd(data)
+    return imf
+
+
+def highpass_detrend(f_cutoff: float, order: int = 4) -> Callable[[Signal], Signal]:
+    """Remove the low-frequency drift by a zero-phase high-pass filter.
+
+    Parametrs:
+    > f_cutoff: float - cutoff frequency of the Butterworth filter.
+    > order: int = 4 - order of the filter (doubled by forward-backward
+    filtering).
+    Returns:
+    > Callable[[Signal], Signal] - detrending function.
+    """
+
+    def detrend(data: Signal) -> Signal:
+        x, y = data.get_data(copy=False)
+        sos = butter(order, f_cutoff * 2 * data.dx, "highpass", output="sos")
+        return type(data)(x, sosfiltfilt(sos, y))
+
+    return detrend
+
+
+def spline_detrend(knot_interval: float) -> Callable[[Signal], Signal]:
+    """Remove the low-frequency drift by subtracting a smooth baseline.
+
+    The baseline is the least-squares cubic spline with the knots placed
+    every knot_interval along the x-axis.
+
+    Parametrs:
+    > knot_interval: float - distance between the knots of the spline, the
+    drift slower than it is removed.
+    Returns:
+    > Callable[[Signal], Signal] - detrending function.
+    """
+
+    def detrend(data: Signal) -> Signal:
+        x, y = data.get_data(copy=False)
+        n_knots = max(int((x[-1] - x[0]) / knot_interval), 1)
+        inner_knots = np.linspace(x[0], x[-1], n_knots + 1)[1:-1]
+        knots = np.concatenate(([x[0]] * 4, inner_knots, [x[-1]] * 4))
+        baseline = make_lsq_spline(x, y, knots, k=3)(x)
+        return type(data)(x, y - baseline)
+
+    return detrend
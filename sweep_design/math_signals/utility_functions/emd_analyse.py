@@ -1,5 +1,6 @@
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 
+import numpy as np
 from PyEMD import CEEMDAN, EMD
 from ..math_signal import Signal
 
@@ -15,12 +16,17 @@ def get_IMFs_ceemdan(
     noise_kind="normal",
     range_thr=0.01,
     total_power_thr=0.05,
+    seed: Optional[int] = None,
 ) -> List[Signal]:
     """Empirical mode decomposition (EMD).
 
     Using CEEMDAN from PyEMD (https://pyemd.readthedocs.io/) to calulate IMFs
     and return them as a list of Signals.
 
+    The trials can be run on a pool of processes (parallel, processes).
+    The noise of the trials is generated in the calling process, so the
+    result is reproducible with the seed either way.
+
     About empirical mode decomposition on
     https://en.wikipedia.org/wiki/Hilbert%E2%80%93Huang_transform#Techniques
     """
@@ -36,6 +42,8 @@ def get_IMFs_ceemdan(
         range_thr=range_thr,
         total_power_thr=total_power_thr,
     )
+    if seed is not None:
+        emd.noise_seed(seed)
     IMFs = emd(y)
     result = [Signal(x, k) for k in IMFs]
     return result
@@ -48,3 +56,25 @@ def get_IMFs_emd(data: Signal) -> List[Signal]:
     IMFs = emd(y)
     result = [Signal(x, k) for k in IMFs]
     return result
+
+
+def get_first_IMF_emd(
+    data: Signal, trend: Optional[np.ndarray] = None, emd: Optional[EMD] = None
+) -> Tuple[Signal, np.ndarray]:
+    """The first IMF of Empirical mode decomposition (EMD).
+
+    Only the first IMF is sifted, the rest of the decomposition is not
+    calculated. The IMF is the same as the first one of `get_IMFs_emd`.
+
+    If trend (the signal without its first IMF) of a close signal is passed,
+    for example from the previous iteration of a correction, it is subtracted
+    before sifting. The sifting starts near the result and stops earlier.
+
+    Returns the first IMF and the trend of the signal.
+    """
+    x, y = data.get_data()
+    if emd is None:
+        emd = EMD()
+    start = y if trend is None else y - trend
+    imf = emd.emd(start, max_imf=1)[0]
+    return Signal(x, imf), y - imf
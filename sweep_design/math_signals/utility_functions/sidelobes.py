@@ -0,0 +1,42 @@
+import numpy as np
+from scipy.fft import next_fast_len  # type: ignore
+
+from ..defaults.fft_backends import get_fft_backend
+
+
+def get_peak_to_sidelobe_ratio(y: np.ndarray) -> np.ndarray:
+    """Peak-to-sidelobe ratio of the autocorrelation in dB.
+
+    The autocorrelation is calculated by FFT, its envelope is the absolute
+    value of the analytic autocorrelation. The main lobe ends at the first
+    minimum of the envelope, the ratio of the peak (zero lag) to the largest
+    value of the envelope after that is returned.
+
+    The last axis of y is the signal, the other axes are the batch: for 2D
+    array the ratio is calculated for each row at once.
+
+    Parametrs:
+    > y: np.ndarray - signal or array of signals.
+    Returns:
+    > np.ndarray - peak-to-sidelobe ratio (float for 1D y).
+    """
+    y = np.asarray(y)
+    n = y.shape[-1]
+    n_fft = next_fast_len(2 * n - 1)
+
+    backend = get_fft_backend()
+    power = np.abs(backend.fft(y, n_fft)) ** 2
+    weights = np.zeros(n_fft)
+    weights[0] = 1.0
+    weights[1 : (n_fft + 1) // 2] = 2.0
+    if n_fft % 2 == 0:
+        weights[n_fft // 2] = 1.0
+    envelope = np.abs(backend.ifft(power * weights)[..., :n])
+
+    is_rising = np.diff(envelope, axis=-1) > 0
+    end_main_lobe = np.where(is_rising.any(axis=-1), is_rising.argmax(axis=-1), n)
+    is_sidelobe = np.arange(n) >= end_main_lobe[..., np.newaxis]
+    sidelobe = np.max(np.where(is_sidelobe, envelope, 0.0), axis=-1)
+
+    with np.errstate(divide="ignore"):
+        return 20 * np.log10(envelope[..., 0] / sidelobe)
@@ -0,0 +1,105 @@
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+import numpy as np
+from scipy.fft import next_fast_len  # type: ignore
+
+from ..defaults.base_structures import BadInputError
+from ..defaults.fft_backends import get_fft_backend
+from ..math_relation import Relation
+from ..math_signal import Signal
+
+
+def _check_sample_interval(pilot_dt: float, dt: Optional[float]) -> None:
+    if dt is not None and not np.isclose(dt, pilot_dt, rtol=1e-9, atol=0.0):
+        raise BadInputError(
+            f"The sample interval of the record ({dt}) is not equal "
+            f"to the one of the pilot ({pilot_dt})."
+        )
+
+
+def correlate_stream(
+    pilot: Relation,
+    chunks: Iterable[Union[np.ndarray, Relation]],
+    block_size: Optional[int] = None,
+    start_time: float = 0.0,
+    dt: Optional[float] = None,
+) -> Iterator[Signal]:
+    """Correlate a long record with a pilot sweep chunk by chunk.
+
+    The record is passed as an iterable of chunks of any size, for example
+    slices of a `numpy.memmap`. The record must have the same sample rate
+    as the pilot. The correlation is calculated with the overlap-save
+    method, so only a block of `block_size` output samples and the length
+    of the pilot are kept in memory.
+
+    For every lag `k` from 0 to the length of the record the result is
+    `sum(record[k + n] * conj(pilot[n]))`, it is equal to the positive lags of
+    `numpy.correlate(record, pilot, "full")`.
+
+    Parametrs:
+    > `pilot`: `Relation` - pilot sweep signal
+
+    > `chunks`: `Iterable[Union[np.ndarray, Relation]]` - record split into
+    chunks (arrays or relations with the x-axis of time)
+
+    > `block_size`: `int` = None - number of output samples calculated by one
+    FFT, if None, then it is chosen from the length of the pilot
+
+    > `start_time`: `float` = 0. - time of the first sample of the record
+
+    > `dt`: `float` = None - sample interval of the record, if it is passed
+    (or the chunks are relations), it must be equal to the one of the pilot,
+    otherwise `BadInputError` is raised
+
+    Returns:
+    > Iterator of `Signal` - correlated record split into blocks.
+    """
+    pilot_dt = pilot.dx
+    _check_sample_interval(pilot_dt, dt)
+    pilot_y = pilot._y
+    m = pilot_y.size
+
+    if block_size is None:
+        block_size = 4 * m
+    n_fft = next_fast_len(block_size + m - 1)
+    block_size = n_fft - m + 1
+
+    is_complex = np.iscomplexobj(pilot_y)
+    spectra_pilot: Dict[str, np.ndarray] = {}
+    backend = get_fft_backend()
+
+    buffer = np.zeros(0, dtype=pilot_y.dtype)
+    position = 0
+    n_record = 0
+
+    def correlate_block(block: np.ndarray, size: int) -> Signal:
+        nonlocal position
+        if is_complex or np.iscomplexobj(block):
+            if "fft" not in spectra_pilot:
+                spectra_pilot["fft"] = np.conj(backend.fft(pilot_y, n_fft))
+            result = backend.ifft(backend.fft(block, n_fft) * spectra_pilot["fft"])
+        else:
+            if "rfft" not in spectra_pilot:
+                spectra_pilot["rfft"] = np.conj(backend.rfft(pilot_y, n_fft))
+            spectrum = backend.rfft(block, n_fft) * spectra_pilot["rfft"]
+            result = backend.irfft(spectrum, n_fft)
+
+        time = start_time + (position + np.arange(size)) * pilot_dt
+        position += size
+        return Signal(time, result[:size])
+
+    for chunk in chunks:
+        if isinstance(chunk, Relation):
+            _check_sample_interval(pilot_dt, chunk.dx)
+            chunk = chunk.get_data(copy=False)[1]
+        chunk = np.asarray(chunk)
+        n_record += chunk.size
+        buffer = np.concatenate((buffer, chunk))
+        while buffer.size >= n_fft:
+            yield correlate_block(buffer[:n_fft], block_size)
+            buffer = buffer[block_size:]
+
+    while position < n_record:
+        size = min(block_size, n_record - position)
+        yield correlate_block(buffer[:n_fft], size)
+        buffer = buffer[block_size:]
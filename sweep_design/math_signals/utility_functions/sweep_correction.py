@@ -1,37 +1,52 @@
-from typing import TypeVar
+from typing import Callable, Optional, TypeVar
 
 import numpy as np
 
 from ..math_relation import Relation
-from ..utility_functions.emd_analyse import get_IMFs_emd
+from ..utility_functions.detrend import emd_detrend
 from ..utility_functions.tukey import tukey_a_t
 
 Signal = TypeVar("Signal", bound=Relation)
 
 
-def correct_sweep(signal: Signal, start_window: float = None) -> Signal:
+def correct_sweep(
+    signal: Signal,
+    start_window: float = None,
+    detrend_method: Optional[Callable[[Signal], Signal]] = None,
+) -> Signal:
     """Sweep correction.
 
     Using the EMD to subtract the last IMF from the displacement and apply
     a window in the star so that the displacement starts at zero.
+
+    Other way to remove the drift of the displacement can be passed as
+    detrend_method (see `sweep_design.math_signals.utility_functions.detrend`).
     """
+    if detrend_method is None:
+        detrend_method = emd_detrend
 
     displacement = signal.integrate().integrate()
     x = displacement.x
 
     window = tukey_a_t(x, start_window, "left")
 
-    IMFs = get_IMFs_emd(displacement)
-    new_displacement = IMFs[0] * Relation(x, window)
+    new_displacement = detrend_method(displacement) * Relation(x, window)
 
     signal = new_displacement.diff().diff()
 
     return signal
 
 
-def correct_sweep_without_window(signal: Signal) -> Signal:
-    """Using the EMD to subtract the last IMF from the displacement."""
+def correct_sweep_without_window(
+    signal: Signal, detrend_method: Optional[Callable[[Signal], Signal]] = None
+) -> Signal:
+    """Using the EMD to subtract the last IMF from the displacement.
+
+    Other way to remove the drift of the displacement can be passed as
+    detrend_method (see `sweep_design.math_signals.utility_functions.detrend`).
+    """
+    if detrend_method is None:
+        detrend_method = emd_detrend
     displacement = signal.integrate().integrate()
-    IMFs = get_IMFs_emd(displacement)
-    signal = IMFs[0].diff().diff()
+    signal = detrend_method(displacement).diff().diff()
     return signal
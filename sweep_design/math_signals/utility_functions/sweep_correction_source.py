@@ -1,11 +1,11 @@
-from math import sin
+from time import perf_counter
 from typing import Callable, Optional, TypeVar
 
 import numpy as np
 from loguru import logger
 
 from ..math_relation import Relation
-from .emd_analyse import get_IMFs_emd
+from .emd_analyse import get_first_IMF_emd
 from .tukey import tukey_a_t
 
 Signal = TypeVar("Signal", bound=Relation)
@@ -14,26 +14,28 @@ Signal = TypeVar("Signal", bound=Relation)
 def soft_clip(
     data: np.ndarray, limits: float, percent=0.85, coef: int = 1
 ) -> np.ndarray:
-    """Custom function for correction."""
+    """Custom function for correction.
+
+    The first column of data is the amplitude to be limited, the second one
+    is the value to be scaled. Values with the amplitude up to
+    `limits * percent` are not changed, after that the amplitude is smoothly
+    compressed up to `limits`.
+    """
     hard_limit = limits
     linear_limit = limits * percent
+    scale = hard_limit - linear_limit
 
-    def select_choice(data: np.ndarray):
-
-        amplitude = abs(data[0])
-
-        if amplitude <= linear_limit:
-            return data[1]
-
-        if amplitude >= hard_limit:
-            return ((hard_limit / amplitude) ** coef) * data[1]
-
-        scale = hard_limit - linear_limit
-        compression = scale * sin(np.pi / 2 * (amplitude - linear_limit) / scale)
+    amplitude = np.abs(data[:, 0])
+    value = data[:, 1]
 
-        return (((linear_limit + compression) / amplitude) ** coef) * data[1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        compression = scale * np.sin(np.pi / 2 * (amplitude - linear_limit) / scale)
+        limited = np.where(
+            amplitude >= hard_limit, hard_limit, linear_limit + compression
+        )
+        clipped = np.float_power(limited / amplitude, coef) * value
 
-    return np.apply_along_axis(select_choice, 1, data)
+    return np.where(amplitude <= linear_limit, value, clipped)
 
 
 def get_correction_for_source(
@@ -44,6 +46,8 @@ def get_correction_for_source(
     limit_iteration: Optional[int] = 10,
     window_percent=0.01,
     coef_function: Callable[[int], float] = lambda x: x,
+    warm_start: bool = False,
+    detrend_method: Optional[Callable[[Signal], Signal]] = None,
 ) -> Signal:
 
     """Sweep signal correction for realization on the vibration source.
@@ -74,21 +78,36 @@ def get_correction_for_source(
 
     > `coef_function` - function to suppress.
 
+    > `warm_start`: bool = False - start the sifting of the first IMF of
+    the displacement from the trend found at the previous iteration.
+    It takes less sifting iterations, but the result slightly differs.
+
+    > `detrend_method`: Callable[[Signal], Signal] = None - the function to
+    remove the drift of the displacement instead of the EMD
+    (see `sweep_design.math_signals.utility_functions.detrend`).
+
+    Only the first IMF of the displacement is calculated at each iteration,
+    the time of the iterations is logged.
+
     Returns:
     > `Relation` of Force.
 
     """
+    def detrend(displacement: Signal, trend: Optional[np.ndarray]):
+        if detrend_method is not None:
+            return detrend_method(displacement), None
+        return get_first_IMF_emd(displacement, trend)
+
     displacement = signal.integrate().integrate() / reaction_mass
-    imfs = get_IMFs_emd(displacement)
+    new_displacement, trend = detrend(displacement, None)
 
-    d_array = np.vstack((imfs[0].y, signal.y[1:-1]))
+    d_array = np.vstack((new_displacement.y, signal.y[1:-1]))
     d_array = np.transpose(d_array)
 
     cnt = 0
     while True and limits is not None:
         cnt += 1
-
-        logger.info("Iteration of correction: {}", cnt)
+        start_time = perf_counter()
 
         result = soft_clip(d_array, limits, limits_persent, coef_function(cnt))
 
@@ -96,9 +115,16 @@ def get_correction_for_source(
 
         new_displacement = force.integrate().integrate() / reaction_mass
 
-        imfs = get_IMFs_emd(new_displacement)
+        # The double integration drops two first samples.
+        new_displacement, trend = detrend(
+            new_displacement, trend[2:] if warm_start and trend is not None else None
+        )
 
-        new_displacement = imfs[0]
+        logger.info(
+            "Iteration of correction: {} ({:.3f} s)",
+            cnt,
+            perf_counter() - start_time,
+        )
 
         if np.all(np.abs(new_displacement.y) < limits):
             break
@@ -25,6 +25,12 @@ class to the constructor of the
 `sweep_design.named_signals.named_relation.NamedRelation` class. Also 
 works for others.
 
+The history of the operations of each named object is kept as a DAG of 
+records (`sweep_design.named_signals.header_signals.defaults.methods.Provenance`, 
+see `sweep_design.named_signals.named_relation.NamedRelation.provenance`). 
+The named objects and their history can be pickled, for example, to be sent 
+to a pool of processes, and the key of the record can be used for caching.
+
 The purpose of creating this module is to simplify the work with many 
 examples of signals, spectra, sweeps and relations. Simplify their 
 visualization, comparison and storage.
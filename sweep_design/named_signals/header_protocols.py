@@ -81,7 +81,7 @@ class HeaderRelation(Protocol):
     def __imul__(self: R, other: Union["HeaderRelation", Num], **kwargs) -> R:
         ...
 
-    def __idiv__(self: R, other: Union["HeaderRelation", Num], **kwargs) -> R:
+    def __itruediv__(self: R, other: Union["HeaderRelation", Num], **kwargs) -> R:
         ...
 
     def __ipow__(self: R, other: Union["HeaderRelation", Num], **kwargs) -> R:
@@ -1,13 +1,26 @@
-from typing import Callable, Union, Optional
+from typing import Any, Callable, Union, Optional
 from abc import ABCMeta, abstractmethod
 
 
 InName = Union["HeaderBase", str, Callable[..., str]]
 
 
+class StaticName:
+    """The name given by a value (unlike a closure, it can be pickled)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __call__(self) -> str:
+        return str(self.value)
+
+
 class HeaderBase(metaclass=ABCMeta):
     def __init__(self, name: InName, category: str) -> None:
 
+        self._source: Union[None, str, Callable[[], str]] = None
         if callable(name):
             self._name = name
             self._category = category
@@ -15,13 +28,21 @@ class HeaderBase(metaclass=ABCMeta):
             self._name = name._name
             self._category = name._category
         else:
-            r_name = str(name)
+            self._name = StaticName(str(name))
+            self._category = category
+
+    @property
+    def source(self) -> Optional[str]:
+        """The identifier of the data of the object made not by an operation.
 
-            def call() -> str:
-                return r_name
+        It is the digest of the data set by the named object or the value
+        set by the user. The provenance key of such an object is made of it.
+        """
+        return self._source() if callable(self._source) else self._source
 
-            self._name = call
-            self._category = category
+    @source.setter
+    def source(self, value: Optional[str]) -> None:
+        self._source = value
 
     @property
     @abstractmethod
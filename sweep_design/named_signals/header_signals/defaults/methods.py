@@ -1,20 +1,299 @@
-from typing import Union, Callable, Optional
+import hashlib
+import re
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Tuple, Union, Callable, Optional
 
-from ..base_header import HeaderBase
+import numpy as np
+
+from ....config.named_config import NamedConfig
+from ....math_signals.defaults.base_structures import MathOperation
+from ..base_header import HeaderBase, StaticName
 
 Num = Union[float, int, complex]
 InName = Union[HeaderBase, str, Callable[[], str]]
 
 
+class Provenance(NamedTuple):
+    """The record of the operation by which a named object was made.
+
+    > operation: str - the name of the operation ("source" for the objects
+    which are not made from other named objects).
+    > operands: Tuple[str, ...] - the keys of the records of the operands.
+    > parameters: Tuple[Any, ...] - the other parameters of the operation
+    (the arrays are replaced by their digests).
+    > key: str - the digest of the above, the same operations with the same
+    operands and parameters have the same key.
+
+    The record of a source is made of the digest of its data (or of the
+    `source` set to its header). So the records can be pickled and the keys
+    do not depend on the process or the session in which the objects were
+    made, the same data and operations give the same key.
+    """
+
+    operation: str
+    operands: Tuple[str, ...]
+    parameters: Tuple[Any, ...]
+    key: str
+
+    @classmethod
+    def create(
+        cls, operation: str, operands: Tuple[str, ...], parameters: Tuple[Any, ...]
+    ) -> "Provenance":
+        digest = hashlib.sha1(repr((operation, operands, parameters)).encode())
+        return cls(operation, operands, parameters, digest.hexdigest())
+
+
+def _get_parameter(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha1(np.ascontiguousarray(value).data).hexdigest()
+        return f"array{value.shape}:{value.dtype}:{digest}"
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return value
+    return repr(value)
+
+
+def _as_header(value: Any) -> Optional[HeaderBase]:
+    # The named objects are passed to the operations of headers as is.
+    if isinstance(value, HeaderBase):
+        return value
+    header = getattr(value, "header", None)
+    return header if isinstance(header, HeaderBase) else None
+
+
+def _get_operation(func: Callable[..., str]) -> str:
+    return re.sub(r"^(make_|get_)?(default_)?(name_)?|_names?$", "", func.__name__)
+
+
+class NameNode:
+    """The name of a header made of the names of other headers.
+
+    The node of the provenance DAG: the function rendering the name and its
+    arguments (the parent headers and the parameters of the operation).
+    If the name was passed to the operation, it is used instead of
+    the rendered one, the history is kept anyway.
+
+    The rendered name is memoized until a name of any header is changed
+    (`NameNode.invalidate`). If `NamedConfig.NAME_MAX_DEPTH` is set, only
+    that number of the upper levels is rendered, the deeper history is
+    replaced by "...".
+    """
+
+    __slots__ = ("func", "args", "name", "depth", "_rendered", "_version", "_record")
+
+    _names_version = 0
+    _render_level = 0
+
+    def __init__(
+        self, func: Callable[..., str], *args: Any, name: Optional[InName] = None
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.name = name
+        self.depth = 1 + max((k.depth for k in self.get_parent_nodes()), default=0)
+        self._rendered: Optional[str] = None
+        self._version: Optional[Tuple[int, Optional[int]]] = None
+        self._record: Optional[Provenance] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in ("func", "args", "name", "depth")}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for k, value in state.items():
+            setattr(self, k, value)
+        self._rendered = self._version = self._record = None
+
+    def renamed(self, name: InName) -> "NameNode":
+        """The same history under the other name."""
+        return NameNode(self.func, *self.args, name=name)
+
+    def get_record(self, keys: Dict[int, str]) -> Provenance:
+        """The record of the operation (keys - the keys of the parents)."""
+        if self._record is None:
+            operation = _get_operation(self.func)
+            operands, parameters = [], []
+            for k in self.args:
+                header = _as_header(k)
+                if header is not None:
+                    operands.append(keys[id(header)])
+                elif isinstance(k, MathOperation):
+                    operation = k.value
+                else:
+                    parameters.append(_get_parameter(k))
+            self._record = Provenance.create(
+                operation, tuple(operands), tuple(parameters)
+            )
+        return self._record
+
+    @property
+    def parents(self) -> Tuple[HeaderBase, ...]:
+        """The headers from which the name is made."""
+        headers = (_as_header(k) for k in self.args)
+        return tuple(k for k in headers if k is not None)
+
+    def get_parent_nodes(self) -> List["NameNode"]:
+        return [k._name for k in self.parents if isinstance(k._name, NameNode)]
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget the rendered names (called when a name is changed)."""
+        cls._names_version += 1
+
+    def _render_ancestors(self, version: Tuple[int, Optional[int]]) -> None:
+        # Render from the oldest history to the newest, so each name is
+        # formatted from the memoized names of its parents without deep
+        # recursion.
+        ancestors = {}
+        stack = [self]
+        while stack:
+            for node in stack.pop().get_parent_nodes():
+                if node._version != version and id(node) not in ancestors:
+                    ancestors[id(node)] = node
+                    stack.append(node)
+        for node in sorted(ancestors.values(), key=lambda k: k.depth):
+            node()
+
+    def __call__(self) -> str:
+        if self.name is not None:
+            return self.name()
+
+        max_depth = NamedConfig.NAME_MAX_DEPTH
+        level = NameNode._render_level
+        if max_depth is not None and level >= max_depth:
+            return "..."
+
+        is_memoized = max_depth is None or level == 0
+        version = (NameNode._names_version, max_depth)
+        if is_memoized and self._version == version:
+            return self._rendered
+
+        if max_depth is None and level == 0:
+            self._render_ancestors(version)
+
+        NameNode._render_level += 1
+        try:
+            rendered = self.func(*self.args)
+        finally:
+            NameNode._render_level -= 1
+
+        if is_memoized:
+            self._rendered, self._version = rendered, version
+        return rendered
+
+
 def make_name(name: Optional[InName], func: Callable[..., str], *args) -> InName:
 
-    if name is not None:
+    if isinstance(name, HeaderBase):
         return name
+    if name is not None and not callable(name):
+        name = StaticName(str(name))
+
+    return NameNode(func, *args, name=name)
+
+
+def rename(old_name: InName, value: InName) -> InName:
+    """The name of a header after setting the name to value.
+
+    The history of the header (if it was made by an operation) is kept.
+    """
+    if isinstance(value, HeaderBase):
+        return value._name
+    if callable(value) and isinstance(value(), str):
+        name = value
+    else:
+        name = StaticName(value)
+    if isinstance(old_name, NameNode):
+        return old_name.renamed(name)
+    return name
+
+
+class DataSource:
+    """The source of a header given by the data of the named object.
+
+    The digest of the data is calculated on the first request and kept.
+    The pickled source is the digest only.
+    """
+
+    __slots__ = ("relation", "_key")
+
+    def __init__(self, relation: Any) -> None:
+        self.relation = relation
+        self._key: Optional[str] = None
+
+    def __call__(self) -> str:
+        if self._key is None:
+            x, y = self.relation.get_data(copy=False)
+            self._key = f"{_get_parameter(x)}/{_get_parameter(y)}"
+            self.relation = None
+        return self._key
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return str, (self(),)
+
+
+def set_data_source(header: HeaderBase, relation: Any) -> None:
+    """Make the source of the header from the data, if it is not set."""
+    if header._source is None and not isinstance(header._name, NameNode):
+        header._source = DataSource(relation)
+
+
+def set_data_digest(header: HeaderBase) -> None:
+    """Calculate the digest of the data source of the header now.
+
+    It is called before the data of the named object is changed in place,
+    so the records made from the header keep the digest of the old data.
+    """
+    if isinstance(header._source, DataSource):
+        header._source()
+
+
+def _get_record(header: HeaderBase, keys: Dict[int, str]) -> Provenance:
+    if isinstance(header._name, NameNode):
+        return header._name.get_record(keys)
+    source = header.source
+    if source is None:
+        # The header without data is identified by its name and category.
+        return Provenance.create("source", (), (header._name(), header._category))
+    return Provenance.create("source", (), (source,))
+
+
+def get_provenance_graph(header: HeaderBase) -> Tuple[str, Dict[str, Provenance]]:
+    """The provenance DAG of the header.
+
+    Returns the key of the record of the header and the records of it and
+    all its ancestors by their keys.
+    """
+    headers = {id(header): header}
+    stack = [header]
+    while stack:
+        name = stack.pop()._name
+        if isinstance(name, NameNode):
+            for k in name.parents:
+                if id(k) not in headers:
+                    headers[id(k)] = k
+                    stack.append(k)
+
+    def depth(k: HeaderBase) -> int:
+        return k._name.depth if isinstance(k._name, NameNode) else 0
+
+    keys: Dict[int, str] = {}
+    records: Dict[str, Provenance] = {}
+    for k in sorted(headers.values(), key=depth):
+        record = _get_record(k, keys)
+        keys[id(k)] = record.key
+        records[record.key] = record
+    return keys[id(header)], records
 
-    def call() -> str:
-        return func(*args)
 
-    return call
+def get_provenance(header: HeaderBase) -> Provenance:
+    """The provenance record of the header."""
+    if isinstance(header._name, NameNode) and header._name._record is not None:
+        return header._name._record
+    key, records = get_provenance_graph(header)
+    return records[key]
 
 
 def make_category(
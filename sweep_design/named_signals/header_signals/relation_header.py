@@ -1,4 +1,5 @@
-import inspect
+import sys
+from types import CodeType
 from typing import Optional, Tuple, Type, TypeVar, Union, Callable
 
 import numpy as np
@@ -6,9 +7,9 @@ import numpy as np
 from ...math_signals.math_relation import Relation
 from ...math_signals.defaults.base_structures import TypeFuncError
 from ...math_signals.defaults.base_structures import MathOperation
-from .base_header import HeaderBase
+from .base_header import HeaderBase, StaticName
 from .defaults import names as dfn
-from .defaults.methods import make_name, make_category
+from .defaults.methods import NameNode, make_name, make_category, rename
 from ...config.named_config import NamedConfig
 
 Num = Union[float, int, complex]
@@ -20,19 +21,46 @@ class BadNameCategory(Exception):
     pass
 
 
-def _get_name_by_trace(position: int) -> str:
-    frames_callers = inspect.stack()
-    for n, k in enumerate(frames_callers):
-        if "IPython" in k.filename:
-            position = position + 1
-            break
+def _get_code_by_trace() -> CodeType:
+    """Return the code of the outermost caller (or of the IPython cell).
 
-        names = frames_callers[n].frame.f_code.co_names
+    Only the references between the frames are followed, the frame info
+    and the source lines (as in `inspect.stack`) are not read.
+    """
+    frame = sys._getframe(1)
+    code = frame.f_code
+    while frame is not None and "IPython" not in frame.f_code.co_filename:
+        code = frame.f_code
+        frame = frame.f_back
+    return code
+
+
+class _TraceName:
+    """The name from the code of the caller.
+
+    The code is found when the header is created, the name is resolved
+    only when it is requested. The code can not be pickled, so the resolved
+    name is pickled instead.
+    """
+
+    __slots__ = ("code", "position")
+
+    def __init__(self, code: CodeType, position: int) -> None:
+        self.code = code
+        self.position = position
+
+    def __call__(self) -> str:
+        names = self.code.co_names
         if len(names) > 2:
-            name = names[position]
-        else:
-            name = names[-1]
-    return name
+            return names[self.position]
+        return names[-1]
+
+    def __reduce__(self):
+        return StaticName, (self(),)
+
+
+def _get_name_by_trace(position: int) -> Callable[[], str]:
+    return _TraceName(_get_code_by_trace(), position)
 
 
 def set_name_by_trace(name: Optional[str], is_set=False, position=-2):
@@ -76,17 +104,8 @@ class HeaderRelation(HeaderBase):
 
     @name.setter
     def name(self, value: InName) -> None:
-        if callable(value) and isinstance(value(), str):
-            self._name = value
-        elif isinstance(value, HeaderBase):
-            self._name = value._name
-        else:
-            str(value)
-
-            def call() -> str:
-                return str(value)
-
-            self._name = call
+        NameNode.invalidate()
+        self._name = rename(self._name, value)
 
     def select_data(
         self,
@@ -375,7 +394,7 @@ class HeaderRelation(HeaderBase):
     ) -> "HeaderRelation":
         return self.__mul__(other, name, category)
 
-    def __idiv__(
+    def __itruediv__(
         self,
         other: Union["HeaderRelation", Num],
         name: InName = None,
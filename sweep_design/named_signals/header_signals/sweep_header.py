@@ -4,7 +4,7 @@ from .relation_header import HeaderRelation
 from .signal_header import HeaderSignal
 from .base_header import HeaderBase
 from .defaults import names as dfn
-from .defaults.methods import make_name, make_category
+from .defaults.methods import NameNode, make_name, make_category, rename
 
 InName = Union[HeaderBase, str, Callable[[], str]]
 
@@ -74,17 +74,8 @@ class HeaderSpectrogram(HeaderBase):
 
     @name.setter
     def name(self, value: InName) -> None:
-        if callable(value) and isinstance(value(), str):
-            self._name = value
-        elif isinstance(value, HeaderBase):
-            self._name = value._name
-        else:
-            str(value)
-
-            def call() -> str:
-                return str(value)
-
-            self._name = call
+        NameNode.invalidate()
+        self._name = rename(self._name, value)
 
     def __str__(self) -> str:
         return self.name()
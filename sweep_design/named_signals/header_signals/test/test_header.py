@@ -1,10 +1,18 @@
+import pickle
+import subprocess
+import sys
 import unittest
+from pathlib import Path
 
 import numpy as np
 
 from ..defaults import names as dn
+from ..defaults.methods import get_provenance, get_provenance_graph
 from ..relation_header import HeaderRelation
+from ....config.named_config import NamedConfig
 from ....math_signals.defaults.base_structures import MathOperation
+from ...named_relation import NamedRelation
+from ...named_signal import NamedSignal
 
 
 class TestHeaderRelation(unittest.TestCase):
@@ -29,6 +37,10 @@ class TestHeaderRelation(unittest.TestCase):
 
         self.check_equal(self.nr, self.name, self.category)
 
+    def test_name_by_trace(self):
+        self.assertIsInstance(str(self.dnr), str)
+        self.assertEqual(self.dnr.category, self.dcategory)
+
     def test_select_data(self):
 
         x_start = 0
@@ -149,3 +161,111 @@ class TestHeaderRelation(unittest.TestCase):
         )
         nr2 = HeaderRelation.convolve(self.nr, self.nr, self.name, self.category)
         self.check_equal(nr2, self.name, self.category)
+
+    def test_name_rendering(self):
+        a, b, c, d = [HeaderRelation(k, self.category) for k in "ABCD"]
+        result = ((a + b) * c) - d
+        self.assertEqual(str(result), "(((A + B) * C) - D)")
+
+        a.name = "Z"
+        self.assertEqual(str(result), "(((Z + B) * C) - D)")
+
+        NamedConfig.NAME_MAX_DEPTH = 2
+        try:
+            self.assertEqual(str(result), "((... * C) - D)")
+        finally:
+            NamedConfig.NAME_MAX_DEPTH = None
+        self.assertEqual(str(result), "(((Z + B) * C) - D)")
+
+        long_result = a
+        for _ in range(5000):
+            long_result = long_result + 1
+        self.assertTrue(str(long_result).endswith(" + 1)"))
+        self.assertEqual(long_result.name.depth, 5000)
+
+    def test_inplace_operation_names(self):
+        t = np.linspace(0.0, 1.0, 11)
+        a = NamedRelation(t, np.sin(t), name="A")
+        b = NamedRelation(t, np.cos(t), name="B")
+        rendered, unrendered = a + b, a * b
+        self.assertEqual(str(rendered), "(A + B)")
+        b += 1
+        self.assertEqual(str(b), "(B + 1)")
+        self.assertEqual(str(rendered), "(A + B)")
+        self.assertEqual(str(unrendered), "(A * B)")
+        self.assertEqual(str(a - b), "(A - (B + 1))")
+
+    def test_provenance(self):
+        a, b = HeaderRelation("A", self.category), HeaderRelation("B", self.category)
+        result = (a + b).diff().shift(0.5, "shifted") * 2
+
+        record = get_provenance(result)
+        self.assertEqual(record.operation, MathOperation.MUL.value)
+        self.assertEqual(record.parameters, (2,))
+
+        key, graph = get_provenance_graph(result)
+        self.assertEqual(key, record.key)
+        self.assertEqual(
+            sorted(k.operation for k in graph.values()),
+            sorted(["source", "source", "__add__", "diff", "shift", "__mul__"]),
+        )
+        same = (a + b).diff().shift(0.5) * 2
+        self.assertEqual(get_provenance(same).key, key)
+        self.assertNotEqual(get_provenance((a - b).diff().shift(0.5) * 2).key, key)
+
+        restored = pickle.loads(pickle.dumps(result))
+        self.assertEqual(str(restored), str(result))
+        self.assertEqual(get_provenance(restored).key, key)
+        self.assertIsInstance(str(pickle.loads(pickle.dumps(self.dnr))), str)
+
+        result.name = "renamed"
+        self.assertEqual(str(result), "renamed")
+        self.assertEqual(get_provenance(result).key, key)
+
+    def test_provenance_between_processes(self):
+        code = (
+            "import numpy as np\n"
+            "from sweep_design.named_signals import NamedRelation, NamedSignal\n"
+            "t = np.linspace(0.0, 1.0, 101)\n"
+            "a = NamedRelation(t, np.sin(t), name='A')\n"
+            "b = NamedSignal(t, np.cos(t), name='B')\n"
+            "b.header.source = 'record-17'\n"
+            "print((a + b).diff().shift(0.5).provenance.key)\n"
+        )
+        keys = [
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=Path(__file__).resolve().parents[4],
+            ).stdout.strip()
+            for _ in range(2)
+        ]
+        self.assertEqual(keys[0], keys[1])
+
+        t = np.linspace(0.0, 1.0, 101)
+        a = NamedRelation(t, np.sin(t), name="A")
+        b = NamedSignal(t, np.cos(t), name="B")
+        b.header.source = "record-17"
+        self.assertEqual((a + b).diff().shift(0.5).provenance.key, keys[0])
+
+        other = NamedRelation(t, np.sin(t), name="other name")
+        self.assertEqual(other.provenance, a.provenance)
+        other += 1
+        self.assertNotEqual(other.provenance, a.provenance)
+
+    def test_provenance_after_inplace_operation(self):
+        t = np.linspace(0.0, 1.0, 11)
+        a = NamedRelation(t, np.sin(t), name="A")
+        b = NamedRelation(t, np.cos(t), name="B")
+        result = a + b
+        b += 1
+        same = a + NamedRelation(t, np.cos(t), name="B")
+        self.assertEqual(result.provenance.key, same.provenance.key)
+        self.assertEqual(b.provenance.operation, MathOperation.ADD.value)
+
+        correlation = NamedRelation.correlate(a, b)
+        convolution = NamedRelation.convolve(a, b)
+        self.assertEqual(str(correlation), "(Corr(A & (B + 1)))")
+        self.assertNotEqual(correlation.provenance.key, convolution.provenance.key)
@@ -5,6 +5,7 @@ import numpy as np
 from .base_header import HeaderBase
 from .sweep_header import HeaderSweep
 from .defaults import names as dfn
+from .defaults.methods import NameNode, rename
 
 InName = Union[HeaderBase, str, Callable[[], str]]
 
@@ -38,17 +39,8 @@ class NamedUncalcSweep(HeaderBase):
 
     @name.setter
     def name(self, value: InName) -> None:
-        if callable(value) and isinstance(value(), str):
-            self._name = value
-        elif isinstance(value, HeaderBase):
-            self._name = value._name
-        else:
-            str(value)
-
-            def call() -> str:
-                return str(value)
-
-            self._name = call
+        NameNode.invalidate()
+        self._name = rename(self._name, value)
 
     def __call__(
         self, time: np.ndarray, name: InName = None, category: str = None
@@ -85,7 +85,7 @@ class MathRelation(Sized, Protocol):
     def __imul__(self: R, other: Union["MathRelation", Num], **kwargs) -> R:
         ...
 
-    def __idiv__(self: R, other: Union["MathRelation", Num], **kwargs) -> R:
+    def __itruediv__(self: R, other: Union["MathRelation", Num], **kwargs) -> R:
         ...
 
     def __ipow__(self: R, other: Union["MathRelation", Num], **kwargs) -> R:
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
 
 import numpy as np
 
@@ -6,6 +6,13 @@ from ..config.named_config import NamedConfig
 from ..math_signals.defaults.base_structures import MathOperation
 from ..math_signals.math_relation import Relation
 from .header_signals.base_header import HeaderBase
+from .header_signals.defaults.methods import (
+    Provenance,
+    get_provenance,
+    get_provenance_graph,
+    set_data_digest,
+    set_data_source,
+)
 from .header_signals.relation_header import HeaderRelation
 
 Num = Union[float, int, complex]
@@ -34,6 +41,7 @@ class NamedRelation:
 
         self._relation = Relation(x, y)
         self.header = HeaderRelation(name, category)
+        set_data_source(self.header, self._relation)
 
     @property
     def x(self):
@@ -55,6 +63,21 @@ class NamedRelation:
     def category(self):
         return self.header.category
 
+    @property
+    def provenance(self) -> Provenance:
+        """The record of the operation by which the object was made.
+
+        The record can be pickled and its key identifies the history of
+        the object, the sources are identified by the digests of their data
+        or by `header.source` set by the user (see
+        `sweep_design.named_signals.header_signals.defaults.methods.Provenance`).
+        """
+        return get_provenance(self.header)
+
+    def get_provenance_graph(self) -> Tuple[str, Dict[str, Provenance]]:
+        """The key of the provenance record and the records of the history."""
+        return get_provenance_graph(self.header)
+
     @classmethod
     def _convert_input(
         cls: Type[CR], data: Any, name: InName = None
@@ -65,6 +88,15 @@ class NamedRelation:
             return NamedRelation(cls.extract_input_default(data, None), name=name)
         return data
 
+    @staticmethod
+    def _get_header(other: Any) -> Any:
+        # The header of the operand is kept, not the operand: the in-place
+        # operations replace the header of the operand, the names made
+        # before them stay the same.
+        if isinstance(other, NamedRelation):
+            return other.header
+        return other
+
     def _operate(
         self: CR,
         other: Any,
@@ -77,11 +109,33 @@ class NamedRelation:
             other = self._convert_input(other)
 
         relation = getattr(self._relation, operation.value)(other)
-        header = getattr(self.header, operation.value)(other, name, category)
+        header = getattr(self.header, operation.value)(
+            self._get_header(other), name, category
+        )
         return type(self)(relation, name=header)
 
-    def get_data(self) -> Tuple[np.ndarray, np.ndarray]:
-        return self._relation.get_data()
+    def _inplace_operate(
+        self: CR,
+        other: Any,
+        operation: MathOperation,
+        name: Optional[InName],
+        category: Optional[str],
+    ) -> CR:
+
+        if not isinstance(other, (NamedRelation, float, int, complex)):
+            other = self._convert_input(other)
+
+        inplace_operation = operation.value.replace("__", "__i", 1)
+        # The digest of the data is taken before the data is changed.
+        set_data_digest(self.header)
+        self._relation = getattr(self._relation, inplace_operation)(other)
+        self.header = getattr(self.header, operation.value)(
+            self._get_header(other), name, category
+        )
+        return self
+
+    def get_data(self, copy: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        return self._relation.get_data(copy)
 
     def select_data(
         self: CR,
@@ -172,7 +226,7 @@ class NamedRelation:
     ) -> CR:
         cr1 = cls._convert_input(cr1)
         cr2 = cls._convert_input(cr2)
-        named = HeaderRelation.convolve(cr1.header, cr2.header, name, category)
+        named = HeaderRelation.correlate(cr1.header, cr2.header, name, category)
         relation = Relation.correlate(cr1.relation, cr2.relation)
         return cls(relation, name=named)
 
@@ -214,19 +268,21 @@ class NamedRelation:
         return self._operate(other, MathOperation.RPOW, name, category)
 
     def __iadd__(self: CR, other: Any, name: InName = None, category="relation") -> CR:
-        return self.__add__(other, name, category)
+        return self._inplace_operate(other, MathOperation.ADD, name, category)
 
     def __isub__(self: CR, other: Any, name: InName = None, category="relation") -> CR:
-        return self.__sub__(other, name, category)
+        return self._inplace_operate(other, MathOperation.SUB, name, category)
 
     def __imul__(self: CR, other: Any, name: InName = None, category="relation") -> CR:
-        return self.__mul__(other, name, category)
+        return self._inplace_operate(other, MathOperation.MUL, name, category)
 
-    def __idiv__(self: CR, other: Any, name: InName = None, category="relation") -> CR:
-        return self.__truediv__(other, name, category)
+    def __itruediv__(
+        self: CR, other: Any, name: InName = None, category="relation"
+    ) -> CR:
+        return self._inplace_operate(other, MathOperation.TRUEDIV, name, category)
 
     def __ipow__(self: CR, other: Any, name: InName = None, category="relation") -> CR:
-        return self.__pow__(other, name, category)
+        return self._inplace_operate(other, MathOperation.POW, name, category)
 
     def __getitem__(self, item: Union[float, slice]):
         if isinstance(item, float):
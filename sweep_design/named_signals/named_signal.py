@@ -3,6 +3,7 @@ from typing import Any, Callable, Optional, Type, TypeVar, Union
 from ..math_signals.math_relation import Relation
 from ..math_signals.math_signal import Signal, Spectrum
 from .header_signals.base_header import HeaderBase
+from .header_signals.defaults.methods import set_data_source
 from .header_signals.signal_header import HeaderSignal, HeaderSpectrum
 from .named_relation import NamedRelation
 from ..config.named_config import NamedConfig
@@ -23,6 +24,7 @@ class NamedSpectrum(NamedRelation):
         f, s_a = NamedConfig.extract_input(f, s_a)
         self._relation: Spectrum = Spectrum(f, s_a)
         self.header: HeaderSpectrum = HeaderSpectrum(name=name, category=category)
+        set_data_source(self.header, self._relation)
         self.signal: Optional[NamedSignal] = None
 
     def get_signal(
@@ -114,6 +116,7 @@ class NamedSignal(NamedRelation):
         t, a = NamedConfig.extract_input(t, a)
         self._relation: Signal = Signal(t, a)
         self.header: HeaderSignal = HeaderSignal(name, category)
+        set_data_source(self.header, self._relation)
         self.spectrum: Optional[NamedSpectrum] = None
 
     def get_amplitude_spectrum(
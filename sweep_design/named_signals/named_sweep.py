@@ -5,6 +5,7 @@ from sweep_design.config.named_config import NamedConfig
 from .named_relation import NamedRelation
 
 from .header_signals.base_header import HeaderBase
+from .header_signals.defaults.methods import set_data_source
 from .header_signals.sweep_header import HeaderSpectrogram, HeaderSweep
 from ..math_signals.defaults.base_structures import Spectrogram
 from ..math_signals.math_signal import Spectrum
@@ -61,6 +62,7 @@ class NamedSweep(NamedSignal):
 
         time, amplitude = NamedConfig.extract_input(time, amplitude)
         self._relation = Sweep(time, amplitude, r_f_t, r_a_t, None)
+        set_data_source(self.header, self._relation)
 
         self._spectrogram: Optional["NamedSpecrogram"] = None
         self.spectrum: Optional[NamedSpectrum] = None